@@ -0,0 +1,59 @@
+"""Benchmark de l'étape d'analyse : processus courant contre pool de processus.
+
+Mesure les pages analysées par seconde (langue, analyse, plugins) pour
+plusieurs tailles de pool ; le débit doit croître avec le nombre de cœurs.
+
+    python -m benchmarks.bench_analysis --pages 400 --processes 1 2 4 8 --chunk 8
+"""
+import argparse
+import os
+import time
+
+from minima.core.analysis_pool import AnalysisPool
+from minima.core.generic_analyzer import GenericAnalyzer
+from minima.core.page_processor import PageProcessor
+from minima.plugins import tech_detector_plugin, word_freq_plugin
+
+
+def make_pages(n):
+    pages = []
+    for i in range(n):
+        body = "".join(f"<p>Le conseil des ministres {j} <a href='/{i}/{j}'>lien</a></p>"
+                       for j in range(300))
+        pages.append(({"url": f"https://bench.local/{i}", "score": 0},
+                      f"<html lang='fr'><head><title>Page {i}</title></head>"
+                      f"<body><article>{body}</article></body></html>"))
+    return pages
+
+
+def bench(name, processor, pages):
+    start = time.perf_counter()
+    processor.process_batch(pages)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<28} {len(pages):>5} pages  {elapsed:7.2f}s  {len(pages) / elapsed:8.1f} pages/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--chunk", type=int, default=8, help="pages par lot envoyé à un processus")
+    parser.add_argument("--compress", type=int, default=0, help="niveau zlib (0 = aucun)")
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} cœurs disponibles")
+    pages = make_pages(args.pages)
+    plugins = [tech_detector_plugin, word_freq_plugin]
+    base = bench("processus courant", PageProcessor(GenericAnalyzer(), plugins, ["fr"]), pages)
+    for n in args.processes:
+        pool = AnalysisPool(n, plugins, ["fr"], chunk_size=args.chunk, compress_level=args.compress)
+        try:
+            elapsed = bench(f"pool {n} processus", pool, pages)
+        finally:
+            pool.close()
+        print(f"{'':<28} accélération x{base / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
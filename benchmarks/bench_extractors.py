@@ -0,0 +1,95 @@
+"""Benchmark des extracteurs titre/liens/images : BeautifulSoup contre parseur événementiel.
+
+Le corpus vient d'un dossier de fichiers .html, du cache HTTP d'un crawl
+(http_cache_dir) ou, à défaut, de pages synthétiques. On compare
+`GenericAnalyzer.analyze` (arbre lxml complet) et l'extracteur "stream"
+(minima.core.extractor) : temps, pic mémoire et concordance des résultats.
+
+    python -m benchmarks.bench_extractors --http-cache data/http_cache
+    python -m benchmarks.bench_extractors --corpus pages/ --repeat 3
+"""
+import argparse
+import time
+import tracemalloc
+import zlib
+from pathlib import Path
+
+from minima.core.document import ParsedDocument
+from minima.core.generic_analyzer import GenericAnalyzer
+
+
+def load_corpus(corpus: str | None, http_cache: str | None, limit: int) -> list[str]:
+    pages = []
+    if corpus:
+        for path in sorted(Path(corpus).rglob("*.htm*"))[:limit]:
+            pages.append(path.read_text(encoding="utf-8", errors="replace"))
+    if http_cache:
+        # Entrées du cache HTTP : une ligne de métadonnées JSON puis le corps zlib
+        for path in sorted(Path(http_cache).rglob("*.bin"))[:limit - len(pages)]:
+            with open(path, "rb") as f:
+                f.readline()
+                try:
+                    pages.append(zlib.decompress(f.read()).decode("utf-8"))
+                except (zlib.error, UnicodeDecodeError):
+                    continue
+    if not pages:
+        print("Aucun corpus fourni : pages synthétiques")
+        for n in range(limit):
+            body = "".join(f"<div class='c'><p>Paragraphe {i} <a href='/p/{n}/{i}'>lien</a>"
+                           f"<img src='/img/{i}.png'></p></div>" for i in range(50 + n % 400))
+            pages.append(f"<!DOCTYPE html><html lang='fr'><head><title>Page {n}</title>"
+                         f"<script>var x = '<a href=\"faux\">';</script></head>"
+                         f"<body>{body}</body></html>")
+    return pages
+
+
+def soup_extract(html):
+    result = GenericAnalyzer().analyze(html, "https://bench/")
+    return result["title"], result["links"], result["images"]
+
+
+def stream_extract(html):
+    doc = ParsedDocument(html, "https://bench/", extractor="stream")
+    return doc.title or "Sans titre", doc.links, doc.images
+
+
+def bench(name, extract, pages, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            extract(html)
+    elapsed = time.perf_counter() - start
+    # Pic mémoire mesuré séparément (tracemalloc ralentit l'exécution)
+    peak = 0
+    for html in pages:
+        tracemalloc.start()
+        extract(html)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    n = len(pages) * repeat
+    print(f"{name:<8} {n:>6} pages  {elapsed:7.2f}s  {n / elapsed:8.1f} pages/s  "
+          f"pic mémoire/page {peak / 1024:8.0f} Ko")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", help="dossier de fichiers .html")
+    parser.add_argument("--http-cache", help="dossier du cache HTTP (http_cache_dir)")
+    parser.add_argument("--limit", type=int, default=200, help="nombre max de pages")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus, args.http_cache, args.limit)
+    size = sum(len(p) for p in pages)
+    print(f"{len(pages)} pages, {size / 1024 / 1024:.1f} Mo de HTML")
+
+    mismatches = sum(1 for html in pages if soup_extract(html) != stream_extract(html))
+    soup_time = bench("soup", soup_extract, pages, args.repeat)
+    stream_time = bench("stream", stream_extract, pages, args.repeat)
+    print(f"Accélération x{soup_time / stream_time:.1f} ; "
+          f"résultats différents sur {mismatches} pages")
+
+
+if __name__ == "__main__":
+    main()
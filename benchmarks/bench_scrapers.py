@@ -0,0 +1,88 @@
+"""Benchmark des moteurs de fetch contre un serveur HTTP local.
+
+Le serveur (aiohttp.web) simule une latence réseau fixe par requête ; on
+compare le Scraper à threads et l'AsyncScraper sur le même lot d'URLs.
+
+    python -m benchmarks.bench_scrapers --urls 2000 --latency 0.2 --concurrency 1000
+"""
+import argparse
+import asyncio
+import threading
+import time
+
+from aiohttp import web
+
+from minima.core.async_scraper import AsyncScraper
+from minima.core.scraper import Scraper
+
+PAGE = ("<html lang='fr'><head><title>Bench</title></head><body>"
+        + "<p>contenu</p>" * 200 + "</body></html>")
+
+
+def start_server(latency: float) -> tuple[str, callable]:
+    """Démarre le serveur dans un thread dédié ; renvoie (url de base, arrêt)."""
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    state = {}
+
+    async def page(request):
+        await asyncio.sleep(latency)
+        return web.Response(text=PAGE, content_type="text/html")
+
+    async def setup():
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", page)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0, backlog=4096)
+        await site.start()
+        state["runner"] = runner
+        state["port"] = runner.addresses[0][1]
+        ready.set()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(setup())
+        loop.run_forever()
+
+    threading.Thread(target=run, daemon=True).start()
+    ready.wait()
+
+    def stop():
+        asyncio.run_coroutine_threadsafe(state["runner"].cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+    return f"http://127.0.0.1:{state['port']}", stop
+
+
+def bench(name, scraper, urls):
+    start = time.perf_counter()
+    results = scraper.fetch_all(urls)
+    elapsed = time.perf_counter() - start
+    ok = sum(1 for v in results.values() if v)
+    print(f"{name:<22} {len(urls):>6} URLs  {elapsed:7.2f}s  "
+          f"{len(urls) / elapsed:8.1f} req/s  ({ok} OK)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--urls", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.1, help="latence simulée (s)")
+    parser.add_argument("--workers", type=int, default=5, help="threads du Scraper classique")
+    parser.add_argument("--concurrency", type=int, default=500, help="requêtes en vol (async)")
+    args = parser.parse_args()
+
+    base, stop = start_server(args.latency)
+    urls = [f"{base}/page/{i}" for i in range(args.urls)]
+    try:
+        threaded = Scraper()
+        threaded.max_workers = args.workers
+        bench(f"threads ({args.workers})", threaded, urls)
+        bench(f"async ({args.concurrency})",
+              AsyncScraper(timeout=30, retries=1, concurrency=args.concurrency), urls)
+    finally:
+        stop()
+
+
+if __name__ == "__main__":
+    main()
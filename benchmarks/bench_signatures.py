@@ -0,0 +1,69 @@
+"""Benchmark du moteur de signatures : coût par page selon la taille de la base.
+
+On ajoute N signatures synthétiques à la base livrée (config/tech_signatures.yaml)
+et on compare au balayage naïf (une recherche de sous-chaîne par motif) :
+le moteur compilé doit rester à peu près constant quand N grandit.
+
+    python -m benchmarks.bench_signatures --sizes 0 100 500 2000 --pages 200
+"""
+import argparse
+import time
+
+import yaml
+
+from minima.core.signatures import SignatureEngine
+from minima.plugins.tech_detector_plugin import SIGNATURES_PATH
+
+
+def make_pages(n):
+    body = "".join(f"<div class='c'><p>Paragraphe {i} <a href='/p/{i}'>lien</a></p></div>"
+                   for i in range(400))
+    return [f"<html><head><title>Page {k}</title><script src='/js/app.{k}.js'></script>"
+            f"<link href='/wp-content/themes/t.css'></head><body>{body}</body></html>"
+            for k in range(n)]
+
+
+def with_synthetic(base, n):
+    signatures = dict(base)
+    for i in range(n):
+        signatures[f"Techno {i}"] = {"html": [f"/vendor/lib{i}/", f"lib{i}-widget"]}
+    return signatures
+
+
+def naive_detect(signatures, html):
+    lower = html.lower()
+    return {tech for tech, sig in signatures.items()
+            if any(p.lower() in lower for p in (sig or {}).get("html", [])
+                   if not p.startswith("re:"))}
+
+
+def timed(fn, pages):
+    start = time.perf_counter()
+    for html in pages:
+        fn(html)
+    return (time.perf_counter() - start) / len(pages) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 100, 500, 2000])
+    parser.add_argument("--pages", type=int, default=200)
+    args = parser.parse_args()
+
+    with open(SIGNATURES_PATH, "r", encoding="utf-8") as f:
+        base = yaml.safe_load(f)
+    pages = make_pages(args.pages)
+    print(f"{args.pages} pages de {len(pages[0]) / 1024:.0f} Ko")
+    for n in args.sizes:
+        signatures = with_synthetic(base, n)
+        start = time.perf_counter()
+        engine = SignatureEngine(signatures)
+        compile_ms = (time.perf_counter() - start) * 1000
+        compiled = timed(engine.detect, pages)
+        naive = timed(lambda html: naive_detect(signatures, html), pages)
+        print(f"{len(engine):>5} signatures  compilation {compile_ms:7.1f} ms  "
+              f"compilé {compiled:8.0f} µs/page  naïf {naive:8.0f} µs/page")
+
+
+if __name__ == "__main__":
+    main()
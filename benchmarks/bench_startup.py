@@ -0,0 +1,57 @@
+"""Benchmark du démarrage : temps des commandes CLI à froid et du pool d’analyse.
+
+Chaque mesure tourne dans un processus neuf (imports non encore chargés),
+répétée `--runs` fois ; on garde la médiane.
+
+    python -m benchmarks.bench_startup --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+SCENARIOS = {
+    "import cli": "import cli",
+    "plugins-list": "import cli; cli.plugins_list()",
+    "queue-status": "import cli; cli.queue_status(config='config/config.yaml', limit=0)",
+    "import bs4/lxml/langdetect": "import bs4, lxml.html, langdetect",
+    "pool d’analyse (2 processus)": (
+        "from minima.plugins.plugin_validator import validate_all, PLUGIN_DIR\n"
+        "from minima.core.analysis_pool import AnalysisPool\n"
+        "pool = AnalysisPool(2, validate_all(PLUGIN_DIR), ['fr', 'en'])\n"
+        "pool.close()"
+    ),
+}
+
+
+def time_snippet(code, runs):
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = time_snippet("pass", args.runs)
+    print(f"{'interpréteur seul':32s} {baseline * 1000:8.1f} ms")
+    for name, code in SCENARIOS.items():
+        elapsed = time_snippet(code, args.runs)
+        print(f"{name:32s} {elapsed * 1000:8.1f} ms  (+{(elapsed - baseline) * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,34 @@
 import typer
-from minima.main import main
-from minima.plugins.plugin_validator import validate_all
 
 app = typer.Typer(help="CLI officielle de Minima")
 
 @app.command()
 def run(config: str = typer.Option("config/config.yaml", "--config", help="Chemin du fichier de configuration")):
     """Exécute le pipeline principal."""
+    from minima.main import main
     main(config_path=config)
 
 @app.command()
 def plugins_list():
     """Liste les plugins valides."""
-    from minima.plugins.plugin_validator import PLUGIN_DIR
+    from minima.plugins.plugin_validator import PLUGIN_DIR, validate_all
     valid = validate_all(PLUGIN_DIR)
     for p in valid:
         print(p.__name__)
 
 @app.command()
-def queue_status():
+def queue_status(
+    config: str = typer.Option("config/config.yaml", "--config",
+                               help="Chemin du fichier de configuration"),
+    limit: int = typer.Option(20, "--limit", help="Nombre d’URLs en attente à afficher"),
+):
     """Affiche l’état de la file persistante."""
-    import json, os
-    path = "data/queue.json"
-    if not os.path.exists(path):
-        print("Queue introuvable.")
-        return
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    print(f"{len(data)} éléments en file.")
-    for item in data:
-        print("-", item.get("url"))
+    from minima.main import load_config, QUEUE_PATH
+    from minima.core.queue import open_queue
+    cfg = load_config(config)
+    queue = open_queue(cfg, QUEUE_PATH, read_only=True)
+    counts = queue.counts()
+    print(f"{counts['pending']} éléments en file, {counts['processed']} traités.")
+    for item in queue.remaining_urls(limit=limit):
+        print("-", item.get("url") if isinstance(item, dict) else item)
+    queue.close()
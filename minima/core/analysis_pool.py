@@ -0,0 +1,116 @@
+# minima/core/analysis_pool.py
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from minima.core.generic_analyzer import GenericAnalyzer
+from minima.core.language import LanguageDetector
+from minima.core.logger import logger
+from minima.core.page_processor import PageProcessor
+from minima.core.plugin_stats import PluginStats
+from minima.core.result_cache import ResultCache
+
+# PageProcessor propre à chaque processus de travail (construit par _init_worker)
+_PROCESSOR = None
+
+
+def _init_worker(plugins, accepted_languages, extractor, language_options, plugin_options,
+                 cache_options):
+    """Réchauffe le processus une seule fois : plugins importés, analyseur prêt."""
+    global _PROCESSOR
+    from minima.plugins.plugin_validator import load_plugin
+    loaded = [load_plugin(path, sha) for path, sha in plugins]
+    analyzer = GenericAnalyzer(language_detector=LanguageDetector(**language_options))
+    # Mesures des plugins renvoyées avec chaque lot, agrégées par le processus principal
+    plugin_options = dict(plugin_options, stats=PluginStats(keep_events=True))
+    # Chaque processus ouvre le cache de résultats partagé (même fichier SQLite)
+    cache = ResultCache(**cache_options) if cache_options else None
+    _PROCESSOR = PageProcessor(analyzer, loaded, accepted_languages, extractor=extractor,
+                               plugin_options=plugin_options, result_cache=cache)
+
+
+def _ping():
+    return os.getpid()
+
+
+def _process_batch(jobs, compressed):
+    if compressed:
+        jobs = [(item, zlib.decompress(html).decode("utf-8")) for item, html in jobs]
+    try:
+        # Lot entier : les plugins à process_batch reçoivent toutes les pages d’un coup
+        results = _PROCESSOR.process_batch(jobs)
+    except Exception:
+        # Une page a fait échouer le lot : on isole la fautive en reprenant page par page
+        results = []
+        for item, html in jobs:
+            try:
+                results.append(_PROCESSOR.process(item, html))
+            except Exception as e:
+                logger.warning(f"Échec de l’analyse pour {item['url']}: {e}")
+                results.append(None)
+    if _PROCESSOR.cache is not None:
+        _PROCESSOR.cache.commit()  # pas de close() dans un processus du pool
+    return results, _PROCESSOR.plugins.stats.drain()
+
+
+class AnalysisPool:
+    """Étape d’analyse (langue, analyse, plugins) dans un pool de processus.
+
+    Même interface que PageProcessor (`process`, `process_batch`) : le travail
+    CPU sort du GIL et se répartit sur `processes` cœurs. Les pages sont
+    envoyées par lots de `chunk_size` pour amortir le coût de sérialisation ;
+    `compress_level` > 0 compresse le HTML (moins d’octets copiés entre
+    processus, un peu plus de CPU).
+    """
+
+    def __init__(self, processes, plugins, accepted_languages, extractor="soup",
+                 language_options=None, chunk_size=8, compress_level=0, plugin_options=None,
+                 cache_options=None):
+        self.processes = max(1, int(processes))
+        self.chunk_size = max(1, int(chunk_size))
+        self.compress_level = int(compress_level)
+        self.plugin_stats = PluginStats()
+        # Les modules ne se sérialisent pas : on transmet chemin + empreinte validée
+        plugin_refs = [(p.__file__, getattr(p, "__sha256__", None)) for p in plugins]
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            initializer=_init_worker,
+            initargs=(plugin_refs, list(accepted_languages), extractor, language_options or {},
+                      plugin_options or {}, cache_options),
+        )
+        # Démarrage immédiat des processus, avant que les threads de fetch ne tournent
+        for future in [self._executor.submit(_ping) for _ in range(self.processes)]:
+            future.result()
+        logger.info(f"Pool d’analyse démarré ({self.processes} processus, "
+                    f"lots de {self.chunk_size} pages)")
+
+    def _pack(self, jobs):
+        if self.compress_level <= 0:
+            return jobs
+        return [(item, zlib.compress(html.encode("utf-8"), self.compress_level))
+                for item, html in jobs]
+
+    def process(self, item: dict, html: str) -> dict | None:
+        return self.process_batch([(item, html)])[0]
+
+    def process_batch(self, jobs: list) -> list:
+        """Analyse [(item, html), ...] ; renvoie les résultats dans le même ordre."""
+        chunks = [jobs[i:i + self.chunk_size] for i in range(0, len(jobs), self.chunk_size)]
+        futures = [self._executor.submit(_process_batch, self._pack(chunk), self.compress_level > 0)
+                   for chunk in chunks]
+        results = []
+        for future in futures:
+            chunk_results, events = future.result()
+            results.extend(chunk_results)
+            self.plugin_stats.merge(events)
+        return results
+
+    def log_stats(self):
+        """Mesures des plugins, tous processus confondus.
+
+        Les disjoncteurs restent propres à chaque processus.
+        """
+        self.plugin_stats.log_summary()
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,158 @@
+# minima/core/async_scraper.py
+from __future__ import annotations
+import asyncio
+import time
+from typing import Dict, Iterable, Optional
+
+import aiohttp
+
+from minima.core.base_scraper import BaseScraper
+from minima.core.concurrency import parse_retry_after
+from minima.core.encoding import BoundedBody, BodyTooLarge
+from minima.core.language import prefilter_rejects
+from minima.core.logger import logger
+from minima.core.politeness import host_of
+from minima.core.scraper import EXCLUDED_EXT
+
+
+class AsyncScraper(BaseScraper):
+    """Moteur de fetch asyncio (aiohttp) implémentant BaseScraper.
+
+    Des centaines à des milliers de requêtes peuvent être en vol en même temps,
+    bornées par un sémaphore (`concurrency`) plutôt que par un nombre de threads.
+    Mêmes filtres que `Scraper.fetch_html` : extensions média et Content-Type.
+    """
+
+    def __init__(self, timeout: int = 10, retries: int = 3, headers: Dict[str, str] | None = None,
+                 concurrency: int = 500, min_interval: float = 0.0, max_per_host: int = 0,
+                 max_body_bytes: int = 5 * 1024 * 1024, oversize_policy: str = "truncate",
+                 accepted_languages=None, prefilter_bytes: int = 0,
+                 deferred_retries: bool = False, batch_deadline: float = 0):
+        super().__init__(timeout=timeout, retries=retries, headers=headers)
+        self.concurrency = max(1, int(concurrency))
+        self.min_interval = float(min_interval)
+        self.max_per_host = max(0, int(max_per_host))  # 0 = pas de plafond par hôte
+        self.excluded_ext = EXCLUDED_EXT
+        self.max_body_bytes = int(max_body_bytes)
+        self.oversize_policy = oversize_policy
+        # Préfiltre de langue actif si prefilter_bytes > 0 (cf. Scraper)
+        self.accepted_languages = accepted_languages
+        self.prefilter_bytes = int(prefilter_bytes)
+        self._next_time: Dict[str, float] = {}
+        # Nouveaux essais différés (cf. Scraper.pop_retry)
+        self.deferred_retries = bool(deferred_retries)
+        self._retry_hints: Dict[str, float] = {}
+        # Délai par lot (0 = aucun) ; chaque requête est déjà bornée
+        # par ClientTimeout(total=timeout)
+        self.batch_deadline = float(batch_deadline)
+
+    async def _wait_turn(self, host: str):
+        # Politesse par hôte : chaque requête réserve le prochain créneau libre
+        if self.min_interval <= 0:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next_time.get(host, 0.0))
+        self._next_time[host] = slot + self.min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def _fetch(self, session: aiohttp.ClientSession, sem: asyncio.Semaphore,
+                     url: str) -> Optional[str]:
+        if url.lower().endswith(self.excluded_ext):
+            logger.info(f"Ignoré (Fichier média) : {url}")
+            return None
+
+        attempts = 1 if self.deferred_retries else self.retries
+        retryable, retry_after = False, None
+        for attempt in range(1, attempts + 1):
+            await self._wait_turn(host_of(url))
+            try:
+                async with sem, session.get(url) as resp:
+                    if resp.status == 200:
+                        content_type = resp.headers.get("Content-Type", "").lower()
+                        if "text/html" not in content_type:
+                            logger.warning(f"Ignoré (Format non-HTML: {content_type}) : {url}")
+                            return None
+                        return await self._read_body(resp, url)
+                    retryable = resp.status in (403, 429) or resp.status >= 500
+                    retry_after = resp.headers.get("Retry-After")
+                    if resp.status not in (403, 429):
+                        break
+                    logger.warning(f"Tentative {attempt} : Blocage {resp.status}")
+                if self.deferred_retries:
+                    break
+                # Attente hors sémaphore : le slot est rendu aux autres requêtes
+                await asyncio.sleep(2 * attempt)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.debug(f"Erreur réseau sur {url} : {e}")
+                retryable = True
+                if not self.deferred_retries:
+                    await asyncio.sleep(1)
+        if retryable and self.deferred_retries:
+            self._retry_hints[url] = parse_retry_after(retry_after) or 0.0
+        return None
+
+    def pop_retry(self, url: str) -> Optional[float]:
+        """Voir `Scraper.pop_retry`."""
+        return self._retry_hints.pop(url, None)
+
+    async def _read_body(self, resp: aiohttp.ClientResponse, url: str) -> Optional[str]:
+        """Lecture bornée du corps, comme `Scraper._read_body`."""
+        body = BoundedBody(self.max_body_bytes, self.oversize_policy)
+        checked = self.prefilter_bytes <= 0
+        try:
+            async for chunk in resp.content.iter_chunked(16384):
+                if not body.feed(chunk):
+                    logger.warning(f"Page tronquée à {self.max_body_bytes} octets : {url}")
+                    break
+                if not checked and body.size >= self.prefilter_bytes:
+                    checked = True
+                    if self._rejected_language(body, resp, url):
+                        return None
+            if not checked and self._rejected_language(body, resp, url):
+                return None
+        except BodyTooLarge as e:
+            logger.warning(f"Ignoré (page trop volumineuse, {e}) : {url}")
+            return None
+        return body.text(resp.headers.get("Content-Type"))
+
+    def _rejected_language(self, body: BoundedBody, resp, url: str) -> bool:
+        lang = prefilter_rejects(body.head(self.prefilter_bytes),
+                                 resp.headers.get("Content-Language"), self.accepted_languages)
+        if lang:
+            logger.info(f"Ignoré (Langue {lang}, préfiltre) : {url}")
+        return lang is not None
+
+    async def fetch_many(self, urls: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Télécharge toutes les URLs dans la boucle asyncio courante."""
+        urls = list(dict.fromkeys(urls))
+        sem = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.max_per_host,
+                                         ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector,
+                                         timeout=timeout) as session:
+            tasks = {asyncio.ensure_future(self._fetch(session, sem, url)): url for url in urls}
+            done, late = await asyncio.wait(tasks, timeout=self.batch_deadline or None)
+            for task in late:
+                task.cancel()
+        results = {tasks[task]: task.result() for task in done}
+        for task in late:
+            # Non terminée à l'échéance du lot : reportée comme un échec réessayable
+            results[tasks[task]] = None
+            self._retry_hints[tasks[task]] = 0.0
+        if late:
+            logger.warning(f"Délai du lot dépassé : {len(late)} URLs reportées")
+        return results
+
+    def fetch(self, url: str) -> Optional[str]:
+        return self.fetch_all([url])[url]
+
+    def fetch_all(self, urls: Iterable[str]) -> Dict[str, Optional[str]]:
+        urls = list(urls)
+        start = time.time()
+        results = asyncio.run(self.fetch_many(urls))
+        duration = round(time.time() - start, 2)
+        rps = round(len(urls) / duration, 2) if duration > 0 else 0
+        logger.info(f"Fetch async terminé ({len(urls)} URLs en {duration}s, {rps} RPS)")
+        return results
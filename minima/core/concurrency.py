@@ -0,0 +1,176 @@
+# minima/core/concurrency.py
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+THROTTLE_STATUSES = (403, 429, 503)
+
+
+def parse_retry_after(value, max_delay: float = 600.0) -> float | None:
+    """En-tête Retry-After (secondes ou date HTTP) -> délai en secondes, borné."""
+    if not value:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        delay = float(value)
+    else:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(0.0, delay), max_delay)
+
+
+def backoff_delay(attempt: int, base: float = 2.0, cap: float = 300.0,
+                  retry_after: float | None = None) -> float:
+    """Délai avant le nouvel essai n° `attempt` (0 = premier échec).
+
+    Backoff exponentiel plafonné avec jitter (moitié fixe, moitié aléatoire)
+    pour étaler les reprises ; jamais moins que le Retry-After du serveur.
+    """
+    delay = min(cap, base * 2 ** attempt)
+    delay = delay / 2 + random.uniform(0, delay / 2)
+    return max(delay, retry_after or 0.0)
+
+
+class AIMDLimit:
+    """Limite de concurrence AIMD (additive increase, multiplicative decrease).
+
+    La limite monte d’environ +1 par « aller-retour » tant que la latence
+    reste proche de sa ligne de base, et est multipliée par `decrease` sur
+    une réponse de throttling, une erreur ou une latence qui dérive. Une
+    seule baisse par fenêtre de latence : les requêtes déjà en vol au moment
+    du signal ne la font pas s’effondrer.
+    """
+
+    def __init__(self, initial=4, min_limit=1, max_limit=64, decrease=0.5, latency_tolerance=2.0):
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.decrease = float(decrease)
+        self.latency_tolerance = float(latency_tolerance)
+        self.in_flight = 0
+        self.ewma = None      # latence lissée
+        self.baseline = None  # meilleure latence lissée observée (dérive lente vers le haut)
+        self._last_decrease = 0.0
+
+    def allows(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def _cut(self, now):
+        if now - self._last_decrease < (self.ewma or 0.0):
+            return
+        self.limit = max(self.min_limit, self.limit * self.decrease)
+        self._last_decrease = now
+
+    def on_success(self, latency: float, now: float):
+        self.ewma = latency if self.ewma is None else 0.8 * self.ewma + 0.2 * latency
+        if self.baseline is None:
+            self.baseline = self.ewma
+        else:
+            self.baseline = min(self.baseline * 1.001, self.ewma)
+        if self.ewma > self.latency_tolerance * self.baseline:
+            self._cut(now)
+        else:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+    def on_failure(self, now: float):
+        self._cut(now)
+
+
+class AdaptiveConcurrency:
+    """Contrôleur AIMD global et par hôte pour le fetch.
+
+    `acquire(host)` attend qu’un slot soit libre à la fois globalement et pour
+    l’hôte, et que l’éventuel Retry-After de l’hôte soit écoulé ; `release`
+    rapporte le résultat de la requête pour ajuster les limites.
+    """
+
+    def __init__(self, initial=4, max_global=64, max_per_host=8, min_backoff=1.0,
+                 max_retry_after=600.0, latency_tolerance=2.0):
+        self.max_per_host = max_per_host
+        self.initial = initial
+        self.min_backoff = float(min_backoff)
+        self.max_retry_after = float(max_retry_after)
+        self.latency_tolerance = latency_tolerance
+        self.global_limit = AIMDLimit(initial=initial, max_limit=max_global,
+                                      latency_tolerance=latency_tolerance)
+        self._hosts = {}
+        self._blocked_until = {}
+        self._strikes = {}  # throttlings consécutifs par hôte (backoff sans Retry-After)
+        self._cond = threading.Condition()
+
+    def _host(self, host) -> AIMDLimit:
+        limit = self._hosts.get(host)
+        if limit is None:
+            limit = self._hosts[host] = AIMDLimit(
+                initial=min(self.initial, self.max_per_host), max_limit=self.max_per_host,
+                latency_tolerance=self.latency_tolerance)
+        return limit
+
+    def host_limit(self, host) -> int:
+        with self._cond:
+            return int(self._host(host).limit)
+
+    def blocked_until(self, host) -> float:
+        return self._blocked_until.get(host, 0.0)
+
+    def acquire(self, host, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                blocked = self._blocked_until.get(host, 0.0) - now
+                host_limit = self._host(host)
+                if blocked <= 0 and self.global_limit.allows() and host_limit.allows():
+                    self.global_limit.in_flight += 1
+                    host_limit.in_flight += 1
+                    return True
+                wait = blocked if blocked > 0 else None
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        return False
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._cond.wait(wait)
+
+    def release(self, host, latency: float, status: int | None = None, retry_after=None):
+        """`status` None = erreur réseau ; 403/429/503 = throttling."""
+        with self._cond:
+            now = time.monotonic()
+            host_limit = self._host(host)
+            host_limit.in_flight = max(0, host_limit.in_flight - 1)
+            self.global_limit.in_flight = max(0, self.global_limit.in_flight - 1)
+            if status is None or status in THROTTLE_STATUSES or status >= 500:
+                host_limit.on_failure(now)
+                if status not in THROTTLE_STATUSES:
+                    # Le throttling est propre à un hôte ; les erreurs réseau pèsent sur le global
+                    self.global_limit.on_failure(now)
+                else:
+                    strikes = self._strikes[host] = self._strikes.get(host, 0) + 1
+                    delay = parse_retry_after(retry_after, self.max_retry_after)
+                    if delay is None:
+                        delay = min(self.max_retry_after, self.min_backoff * 2 ** (strikes - 1))
+                    self._blocked_until[host] = max(self._blocked_until.get(host, 0.0), now + delay)
+            else:
+                self._strikes.pop(host, None)
+                host_limit.on_success(latency, now)
+                self.global_limit.on_success(latency, now)
+            self._cond.notify_all()
+
+    def snapshot(self) -> dict:
+        """Limites courantes (exposées dans les métriques de fin de run)."""
+        with self._cond:
+            now = time.monotonic()
+            return {
+                "global_limit": int(self.global_limit.limit),
+                "global_in_flight": self.global_limit.in_flight,
+                "hosts": {
+                    host: {"limit": int(lim.limit), "in_flight": lim.in_flight,
+                           "latency": round(lim.ewma or 0.0, 3),
+                           "blocked_for": round(
+                               max(0.0, self._blocked_until.get(host, 0.0) - now), 1)}
+                    for host, lim in self._hosts.items()
+                },
+            }
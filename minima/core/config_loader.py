@@ -26,6 +26,13 @@ def load_config(path: Path = None):
     return _config
 
 
+def set_config(cfg: dict):
+    """Remplace la configuration courante (ex. config déjà chargée par main)."""
+    global _config
+    _config = cfg or {}
+    return _config
+
+
 def get(key, default=None):
     """Récupère une clé de configuration."""
     return _config.get(key, default)
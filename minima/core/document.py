@@ -0,0 +1,90 @@
+# minima/core/document.py
+import hashlib
+from functools import cached_property
+
+from minima.core.extractor import extract_links
+
+# Balises dont le texte n'est pas affiché
+INVISIBLE_TAGS = {"script", "style", "noscript", "template", "head", "title", "svg", "iframe"}
+
+
+class ParsedDocument:
+    """Page HTML parsée une seule fois (lxml) et partagée par l’analyseur et les plugins.
+
+    Chaque vue (titre, liens, texte visible…) est calculée au premier accès
+    puis mise en cache. L’arbre `soup` est partagé : les plugins doivent le
+    lire sans le modifier (pas de `decompose()`).
+
+    Avec `extractor="stream"`, titre, liens, images et langue viennent d’un
+    parseur événementiel (minima.core.extractor) : aucun arbre n’est construit
+    tant qu’un plugin ne demande pas `soup` ou `text`.
+    """
+
+    def __init__(self, html: str, url: str | None = None, extractor: str = "soup"):
+        self.html = html or ""
+        self.url = url
+        self.extractor = extractor
+
+    @cached_property
+    def _extracted(self) -> dict:
+        return extract_links(self.html)
+
+    @cached_property
+    def digest(self) -> str:
+        """Empreinte SHA256 du corps (clé du cache de résultats)."""
+        return hashlib.sha256(self.html.encode("utf-8", "surrogatepass")).hexdigest()
+
+    @cached_property
+    def soup(self):
+        # bs4 importé au premier arbre demandé (absent avec l’extracteur "stream")
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(self.html, "lxml")
+
+    @cached_property
+    def lower(self) -> str:
+        """Source HTML en minuscules (recherches de sous-chaînes insensibles à la casse)."""
+        return self.html.lower()
+
+    @cached_property
+    def title(self) -> str | None:
+        if self.extractor == "stream":
+            title = self._extracted["title"]
+            return title.strip() if title else None
+        tag = self.soup.title
+        return tag.string.strip() if tag and tag.string else None
+
+    @cached_property
+    def links(self) -> list[str]:
+        if self.extractor == "stream":
+            return self._extracted["links"]
+        return [a.get("href") for a in self.soup.find_all("a", href=True)]
+
+    @cached_property
+    def images(self) -> list[str]:
+        if self.extractor == "stream":
+            return self._extracted["images"]
+        return [img.get("src") for img in self.soup.find_all("img", src=True)]
+
+    @cached_property
+    def lang(self) -> str | None:
+        """Sous-tag principal de `<html lang>` en minuscules, ou None."""
+        if self.extractor == "stream":
+            lang = self._extracted["lang"]
+        else:
+            tag = self.soup.find("html")
+            lang = tag.get("lang") if tag else None
+        return lang.split("-")[0].strip().lower() if lang else None
+
+    @cached_property
+    def text(self) -> str:
+        """Texte visible (hors script, style, head…), séparé par des espaces."""
+        from bs4 import NavigableString
+        parts = []
+        for string in self.soup.find_all(string=True):
+            # Les commentaires, doctypes et CDATA sont des sous-classes de NavigableString
+            if type(string) is not NavigableString or string.parent.name in INVISIBLE_TAGS:
+                continue
+            string = string.strip()
+            if string:
+                parts.append(string)
+        return " ".join(parts)
@@ -0,0 +1,90 @@
+# minima/core/encoding.py
+import codecs
+import re
+
+# Zone du document où l'on cherche <meta charset> (spec HTML : 1024 premiers octets,
+# on est plus large pour les <head> chargés)
+SNIFF_BYTES = 4096
+
+_HEADER_CHARSET = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.I)
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+class BodyTooLarge(Exception):
+    """Corps de réponse au-delà de la taille maximale (politique "abort")."""
+
+
+def _valid(charset):
+    try:
+        return codecs.lookup(charset).name
+    except (LookupError, TypeError):
+        return None
+
+
+def sniff_charset(content_type: str | None, head: bytes) -> str:
+    """Détermine l’encodage : en-tête Content-Type, puis BOM, puis <meta charset>.
+
+    Ne regarde que les premiers octets du document ; retombe sur utf-8.
+    """
+    if content_type:
+        match = _HEADER_CHARSET.search(content_type)
+        if match and _valid(match.group(1)):
+            return _valid(match.group(1))
+    for bom, charset in _BOMS:
+        if head.startswith(bom):
+            return charset
+    match = _META_CHARSET.search(head[:SNIFF_BYTES])
+    if match and _valid(match.group(1).decode("ascii", "ignore")):
+        return _valid(match.group(1).decode("ascii", "ignore"))
+    return "utf-8"
+
+
+class BoundedBody:
+    """Accumulateur de corps de réponse à taille bornée.
+
+    `feed` renvoie False quand il faut arrêter la lecture (politique
+    "truncate") ou lève BodyTooLarge (politique "abort").
+    """
+
+    def __init__(self, max_bytes: int, policy: str = "truncate"):
+        self.max_bytes = int(max_bytes)
+        self.policy = policy
+        self.chunks = []
+        self.size = 0
+        self.truncated = False
+
+    def feed(self, chunk: bytes) -> bool:
+        if self.max_bytes <= 0:
+            self.chunks.append(chunk)
+            self.size += len(chunk)
+            return True
+        room = self.max_bytes - self.size
+        if len(chunk) <= room:
+            self.chunks.append(chunk)
+            self.size += len(chunk)
+            return True
+        if self.policy == "abort":
+            raise BodyTooLarge(f"corps > {self.max_bytes} octets")
+        self.chunks.append(chunk[:room])
+        self.size += room
+        self.truncated = True
+        return False
+
+    def head(self, size: int = SNIFF_BYTES) -> bytes:
+        """Premiers octets reçus, sans recopier tout le corps."""
+        out, n = [], 0
+        for chunk in self.chunks:
+            out.append(chunk)
+            n += len(chunk)
+            if n >= size:
+                break
+        return b"".join(out)[:size]
+
+    def text(self, content_type: str | None) -> str:
+        raw = b"".join(self.chunks)
+        return raw.decode(sniff_charset(content_type, raw[:SNIFF_BYTES]), errors="replace")
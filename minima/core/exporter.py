@@ -8,10 +8,7 @@ from typing import Iterable, Mapping, Any
 from minima.core.logger import logger
 
 EXPORT_DIR = Path("exports")
-EXPORT_DIR.mkdir(parents=True, exist_ok=True)
-
 EXPORT_DB_DIR = Path("Crawl_data")
-EXPORT_DB_DIR.mkdir(parents=True, exist_ok=True)
 
 def _timestamp() -> str:
     """Retourne un timestamp compact pour nommer les fichiers d’export."""
@@ -22,12 +19,17 @@ class Exporter:
     """Gère l'écriture des résultats au format JSON, CSV et SQLite."""
 
     def __init__(self, output_dir: Path = EXPORT_DIR, output_db_dir: Path = EXPORT_DB_DIR,
-                 flush_every: int = 10) -> None:
+                 flush_every: int = 10, fields: list[str] | None = None) -> None:
         self.output_dir = output_dir
         self.output_db_dir = output_db_dir
+        # Dossiers créés à l’instanciation, pas à l’import du module
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_db_dir.mkdir(parents=True, exist_ok=True)
         # La valeur vient maintenant de la config via le main
         self.flush_every = max(1, flush_every) 
         self._buffer = []
+        # Champs exportés (None = tous) ; l’URL est toujours gardée
+        self.fields = ["url"] + [f for f in fields if f != "url"] if fields else None
 
     def _flush_buffer(self):
         """Vide le buffer vers les fichiers et la base de données."""
@@ -45,6 +47,8 @@ class Exporter:
 
     def add_results(self, results: Iterable[Mapping[str, Any]]):
         """Ajoute des résultats au buffer et déclenche le flush si le seuil est atteint."""
+        if self.fields:
+            results = [{k: row[k] for k in self.fields if k in row} for row in results]
         self._buffer.extend(results)
         if len(self._buffer) >= self.flush_every:
             self._flush_buffer()
@@ -0,0 +1,61 @@
+# minima/core/extractor.py
+from lxml import etree
+
+# Taille des morceaux passés au parseur : la mémoire reste constante quelle
+# que soit la page (pas d'arbre, seulement les valeurs retenues)
+FEED_CHUNK = 65536
+
+
+class _LinkTarget:
+    """Cible du parseur événementiel lxml : ne retient que titre, liens, images et langue."""
+
+    def __init__(self):
+        self.title = None
+        self.links = []
+        self.images = []
+        self.lang = None
+        self._title_parts = None
+
+    def start(self, tag, attrib):
+        if tag == "a":
+            href = attrib.get("href")
+            if href is not None:
+                self.links.append(href)
+        elif tag == "img":
+            src = attrib.get("src")
+            if src is not None:
+                self.images.append(src)
+        elif tag == "title" and self.title is None and self._title_parts is None:
+            self._title_parts = []
+        elif tag == "html" and self.lang is None:
+            self.lang = attrib.get("lang")
+
+    def end(self, tag):
+        if tag == "title" and self._title_parts is not None and self.title is None:
+            self.title = "".join(self._title_parts)
+
+    def data(self, data):
+        if self._title_parts is not None and self.title is None:
+            self._title_parts.append(data)
+
+    def close(self):
+        return self
+
+
+def extract_links(html: str) -> dict:
+    """Titre, liens, images et `<html lang>` en une passe, sans construire d’arbre.
+
+    Renvoie {"title", "links", "images", "lang"} ; le titre et la langue
+    sont bruts (non normalisés), None s’ils sont absents.
+    """
+    target = _LinkTarget()
+    parser = etree.HTMLParser(target=target, recover=True)
+    try:
+        for i in range(0, len(html or ""), FEED_CHUNK):
+            parser.feed(html[i:i + FEED_CHUNK])
+        parser.close()
+    except (etree.ParserError, etree.XMLSyntaxError):
+        # Document vide ou illisible : on garde ce qui a été vu
+        pass
+    return {"title": target.title, "links": target.links,
+            "images": target.images, "lang": target.lang}
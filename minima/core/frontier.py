@@ -0,0 +1,88 @@
+# minima/core/frontier.py
+import heapq
+import itertools
+
+
+class PriorityFrontier:
+    """Tas binaire max par score, avec suppression paresseuse.
+
+    Chaque clé (URL) a au plus une entrée valide dans le tas ; une mise à jour
+    de score ou un retrait invalide simplement l’ancienne entrée, qui sera
+    ignorée au moment où elle remonte. À score égal, l’ordre d’insertion est
+    conservé (FIFO).
+    """
+
+    def __init__(self):
+        self._heap = []      # [-score, seq, key]
+        self._entries = {}   # key -> entrée valide
+        self._seq = itertools.count()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def push(self, key, score=0):
+        """Ajoute la clé ou met à jour son score (O(log n))."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == -score:
+            return
+        entry = [-score, next(self._seq), key]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        self._maybe_compact()
+
+    def remove(self, key):
+        """Retire la clé (O(1), l’entrée est purgée plus tard)."""
+        if self._entries.pop(key, None) is not None:
+            self._maybe_compact()
+
+    def score(self, key, default=0):
+        entry = self._entries.get(key)
+        return default if entry is None else -entry[0]
+
+    def scores(self) -> dict:
+        return {key: -entry[0] for key, entry in self._entries.items()}
+
+    def pop(self):
+        """Retire et renvoie la clé de score maximal, ou None si vide."""
+        popped = self.popitem()
+        return None if popped is None else popped[0]
+
+    def popitem(self):
+        """Retire et renvoie (clé, score) de score maximal, ou None si vide."""
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if self._entries.get(entry[2]) is entry:
+                del self._entries[entry[2]]
+                return entry[2], -entry[0]
+        return None
+
+    def peek(self, n=None) -> list:
+        """Renvoie les `n` meilleures clés sans les retirer.
+
+        O(n log n), indépendant de la taille du tas.
+        """
+        if n is None or n >= len(self._entries):
+            return [e[2] for e in sorted(self._entries.values())]
+        heap, result = self._heap, []
+        candidates = [(heap[0], 0)] if heap else []
+        while candidates and len(result) < n:
+            entry, i = heapq.heappop(candidates)
+            if self._entries.get(entry[2]) is entry:
+                result.append(entry[2])
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heapq.heappush(candidates, (heap[child], child))
+        return result
+
+    def clear(self):
+        self._heap.clear()
+        self._entries.clear()
+
+    def _maybe_compact(self):
+        # Trop d’entrées périmées : on reconstruit le tas à partir des entrées valides
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
@@ -1,19 +1,22 @@
-from bs4 import BeautifulSoup
-from langdetect import detect, DetectorFactory
-
-DetectorFactory.seed = 0  # pour résultats reproductibles
+from minima.core.document import ParsedDocument
+from minima.core.language import LanguageDetector
 
 class GenericAnalyzer:
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, language_detector=None):
         self.logger = logger
+        self.language = language_detector or LanguageDetector()
 
     def analyze(self, html, url):
         """Analyse basique du contenu HTML"""
+        return self.analyze_document(ParsedDocument(html, url))
+
+    def analyze_document(self, doc: ParsedDocument):
+        """Analyse basique à partir d'un document déjà parsé."""
+        url = doc.url
         try:
-            soup = BeautifulSoup(html, "lxml")
-            title = soup.title.string.strip() if soup.title else "Sans titre"
-            links = [a.get("href") for a in soup.find_all("a", href=True)]
-            images = [img.get("src") for img in soup.find_all("img", src=True)]
+            title = doc.title or "Sans titre"
+            links = doc.links
+            images = doc.images
             result = {
                 "url": url,
                 "title": title,
@@ -30,20 +33,19 @@ class GenericAnalyzer:
                 self.logger.warning(f"Échec de l’analyse pour {url}: {e}")
             return {"url": url, "error": str(e)}
 
-    def detect_language(self, html: str) -> str:
+    def detect_language(self, html, url=None) -> str:
+        """Langue de la page (HTML brut ou ParsedDocument), cf. LanguageDetector."""
+        if isinstance(html, ParsedDocument):
+            html, url = html.html, url or html.url
         try:
-            # D'abord tenter avec l'attribut lang du HTML
-            soup = BeautifulSoup(html, "html.parser")
-            html_tag = soup.find("html")
-            if html_tag and html_tag.get("lang"):
-                return html_tag["lang"].split("-")[0].lower()
-            
-            # Ensuite détection automatique classique
-            return self._detect_with_library(html)
+            return self.language.detect(html or "", url)
         except Exception:
             return "unknown"
 
     def extract_text(self, html):
         """Extrait le texte brut du HTML"""
+        if isinstance(html, ParsedDocument):
+            return html.text
+        from bs4 import BeautifulSoup
         soup = BeautifulSoup(html, "lxml")
         return soup.get_text(separator=" ", strip=True)
@@ -0,0 +1,102 @@
+# minima/core/http_cache.py
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from minima.core.logger import logger
+
+
+class HttpCache:
+    """Cache HTTP disque pour les recrawls (requêtes conditionnelles).
+
+    Pour chaque URL on garde les validateurs (ETag, Last-Modified) et le corps
+    compressé (zlib). Au fetch suivant, `validators()` fournit les en-têtes
+    If-None-Match / If-Modified-Since ; une réponse 304 est servie depuis le
+    cache. Une entrée plus jeune que `max_age` secondes est servie sans requête.
+    """
+
+    def __init__(self, path="data/http_cache", max_age: float = 0):
+        self.dir = Path(path)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.max_age = float(max_age)
+        self._lock = threading.Lock()
+        self.stats = {"hit": 0, "miss": 0, "revalidated": 0, "stored": 0,
+                      "bytes_saved": 0, "seconds_saved": 0.0}
+
+    def _path(self, url: str) -> Path:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.dir / digest[:2] / f"{digest}.bin"
+
+    def _count(self, key, bytes_saved=0, seconds_saved=0.0):
+        with self._lock:
+            self.stats[key] += 1
+            self.stats["bytes_saved"] += bytes_saved
+            self.stats["seconds_saved"] += max(0.0, seconds_saved)
+
+    def lookup(self, url: str) -> dict | None:
+        """Renvoie les métadonnées de l’entrée (sans le corps), ou None."""
+        try:
+            with open(self._path(url), "rb") as f:
+                return json.loads(f.readline())
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, meta: dict) -> bool:
+        return self.max_age > 0 and time.time() - meta.get("stored_at", 0) < self.max_age
+
+    @staticmethod
+    def validators(meta: dict | None) -> dict:
+        """En-têtes de requête conditionnelle pour une entrée existante."""
+        headers = {}
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def load(self, url: str) -> str | None:
+        try:
+            with open(self._path(url), "rb") as f:
+                f.readline()
+                return zlib.decompress(f.read()).decode("utf-8")
+        except (OSError, ValueError, zlib.error):
+            return None
+
+    def serve(self, url: str, meta: dict, revalidated: bool, elapsed: float = 0.0) -> str | None:
+        """Sert le corps en cache (hit frais ou 304) et comptabilise l’économie."""
+        body = self.load(url)
+        if body is None:
+            return None
+        saved = meta.get("fetch_time", 0.0) - elapsed
+        self._count("revalidated" if revalidated else "hit", meta.get("size", 0), saved)
+        return body
+
+    def store(self, url: str, headers, body: str, fetch_time: float = 0.0):
+        """Enregistre une réponse 200 (compte aussi le miss)."""
+        self._count("miss")
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        if not (etag or last_modified or self.max_age > 0):
+            return  # rien pour revalider : inutile de stocker
+        raw = body.encode("utf-8")
+        meta = {"url": url, "etag": etag, "last_modified": last_modified,
+                "stored_at": time.time(), "fetch_time": round(fetch_time, 3), "size": len(raw)}
+        path = self._path(url)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            tmp = path.with_suffix(f".tmp{threading.get_ident()}")
+            with open(tmp, "wb") as f:
+                f.write(json.dumps(meta).encode("utf-8") + b"\n")
+                f.write(zlib.compress(raw, 6))
+            os.replace(tmp, path)
+            self._count("stored")
+        except OSError as e:
+            logger.warning(f"Cache HTTP : écriture impossible pour {url}: {e}")
+
+    def log_summary(self):
+        s = self.stats
+        logger.info(f"Cache HTTP: hit={s['hit']} revalidated={s['revalidated']} miss={s['miss']} "
+                    f"stored={s['stored']} bytes_saved={s['bytes_saved']} "
+                    f"seconds_saved={round(s['seconds_saved'], 2)}s")
@@ -0,0 +1,143 @@
+# minima/core/language.py
+import html as html_lib
+import re
+import threading
+
+from minima.core.logger import logger
+from minima.core.politeness import host_of
+
+_langdetect = None
+
+
+def _load_langdetect():
+    """Importe langdetect au premier besoin (pages sans langue déclarée)."""
+    global _langdetect
+    if _langdetect is None:
+        from langdetect import DetectorFactory, LangDetectException, detect
+        DetectorFactory.seed = 0  # pour résultats reproductibles
+        _langdetect = (detect, LangDetectException)
+    return _langdetect
+
+
+# Zone où l'on cherche <html lang> / <meta> (octets)
+SNIFF_BYTES = 4096
+
+# Sous-tag principal suivi d'une limite : « english » ou « engl » ne donnent pas « eng »
+_SUBTAG = rb"([A-Za-z]{2,3})(?=[-_\s\"'>/,;])"
+_HTML_LANG = re.compile(rb"<html\b[^>]*?\s(?:xml:)?lang\s*=\s*[\"']?\s*" + _SUBTAG, re.I)
+_META_LANG = re.compile(
+    rb"<meta\b[^>]*?(?:http-equiv\s*=\s*[\"']?content-language|name\s*=\s*[\"']?(?:dc\.)?language)"
+    rb"[^>]*?content\s*=\s*[\"']?\s*" + _SUBTAG,
+    re.I,
+)
+_INVISIBLE = re.compile(r"<(script|style|noscript|template|svg|head)\b.*?</\1\s*>|<!--.*?-->",
+                        re.I | re.S)
+_TAG = re.compile(r"<[^>]*>")
+_SPACES = re.compile(r"\s+")
+
+
+def _primary(tag: str) -> str:
+    return tag.split("-")[0].split("_")[0].strip().lower()
+
+
+def sniff_language(head: bytes, content_language: str | None = None) -> str | None:
+    """Langue déclarée dans les premiers octets d’une page.
+
+    Ordre : `<html lang>`, puis `<meta http-equiv="content-language">` /
+    `<meta name="language">`, puis l’en-tête Content-Language. Renvoie le
+    sous-tag principal en minuscules (« fr » pour « fr-FR »), ou None.
+    """
+    for pattern in (_HTML_LANG, _META_LANG):
+        match = pattern.search(head)
+        if match:
+            return _primary(match.group(1).decode("ascii"))
+    if content_language:
+        # "fr-FR, en" : une page multilingue déclarée n'est pas rejetable sur l'en-tête seul
+        tags = [t for t in content_language.split(",") if t.strip()]
+        if len(tags) == 1:
+            return _primary(tags[0])
+    return None
+
+
+def prefilter_rejects(head: bytes, content_language: str | None, accepted) -> str | None:
+    """Renvoie la langue déclarée si elle est hors `accepted`, sinon None (page à garder)."""
+    lang = sniff_language(head, content_language)
+    if lang and accepted and lang not in accepted:
+        return lang
+    return None
+
+
+def visible_sample(html: str, limit: int = 2000) -> str:
+    """Échantillon borné du texte visible : blocs invisibles et balises retirés par regex."""
+    # Seul le début du document est examiné (les <head> chargés sont inclus)
+    chunk = html[:max(limit * 20, 65536)]
+    text = _TAG.sub(" ", _INVISIBLE.sub(" ", chunk))
+    return _SPACES.sub(" ", html_lib.unescape(text)).strip()[:limit]
+
+
+class LanguageDetector:
+    """Détection de langue en trois niveaux, du moins au plus coûteux.
+
+    1. langue déclarée (`<html lang>`, `<meta>`) lue par regex sur les premiers octets ;
+    2. mémo par hôte : après `memo_after` pages concordantes, l’hôte est réputé
+       stable et ses pages sans langue déclarée sautent la détection ;
+    3. langdetect sur un échantillon borné du texte visible.
+
+    `stats` compte les pages résolues à chaque niveau.
+    """
+
+    def __init__(self, sample_chars: int = 2000, memo_after: int = 5):
+        self.sample_chars = max(1, int(sample_chars))
+        self.memo_after = int(memo_after)  # 0 = pas de mémo par hôte
+        self._memo = {}  # hôte -> (langue, pages concordantes d'affilée)
+        self._lock = threading.Lock()
+        self.stats = {"declared": 0, "memo": 0, "detected": 0, "unknown": 0}
+
+    def _count(self, tier):
+        with self._lock:
+            self.stats[tier] += 1
+
+    def _remember(self, host, lang):
+        if not host or self.memo_after <= 0:
+            return
+        with self._lock:
+            previous, streak = self._memo.get(host, (None, 0))
+            self._memo[host] = (lang, streak + 1 if previous == lang else 1)
+
+    def _memoized(self, host):
+        if not host or self.memo_after <= 0:
+            return None
+        with self._lock:
+            lang, streak = self._memo.get(host, (None, 0))
+        return lang if streak >= self.memo_after else None
+
+    def detect(self, html: str, url: str | None = None) -> str:
+        """Code langue (« fr », « en »…) ou « unknown »."""
+        host = host_of(url) if url else None
+        lang = sniff_language(html[:SNIFF_BYTES].encode("utf-8", "ignore"))
+        if lang:
+            self._count("declared")
+            self._remember(host, lang)
+            return lang
+
+        lang = self._memoized(host)
+        if lang:
+            self._count("memo")
+            return lang
+
+        detect, LangDetectException = _load_langdetect()
+        try:
+            lang = detect(visible_sample(html, self.sample_chars))
+        except LangDetectException:
+            self._count("unknown")
+            return "unknown"
+        lang = _primary(lang)
+        self._count("detected")
+        self._remember(host, lang)
+        return lang
+
+    def log_summary(self):
+        total = sum(self.stats.values())
+        if total:
+            rates = ", ".join(f"{tier} {100 * n / total:.0f}%" for tier, n in self.stats.items())
+            logger.info(f"Détection de langue ({total} pages) : {rates}")
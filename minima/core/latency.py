@@ -0,0 +1,42 @@
+# minima/core/latency.py
+import threading
+from collections import defaultdict, deque
+
+
+class LatencyTracker:
+    """Latences récentes par hôte (fenêtre glissante) et leurs percentiles.
+
+    Sert à déclencher les requêtes « hedgées » : on ne duplique une requête
+    que lorsqu’elle dépasse ce qui est normal pour son hôte (p95 par défaut).
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = max(1, int(window))
+        self.min_samples = max(1, int(min_samples))
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._lock = threading.Lock()
+
+    def record(self, host: str, seconds: float):
+        with self._lock:
+            self._samples[host].append(seconds)
+
+    def percentile(self, host: str, q: float) -> float | None:
+        """Percentile `q` (0-100) des latences de l’hôte, None si trop peu de mesures."""
+        with self._lock:
+            samples = sorted(self._samples.get(host, ()))
+        if len(samples) < self.min_samples:
+            return None
+        index = min(len(samples) - 1, int(round(q / 100 * (len(samples) - 1))))
+        return samples[index]
+
+    def snapshot(self) -> dict:
+        """{hôte: {"p50", "p95", "p99", "n"}} pour les métriques de fin de run."""
+        with self._lock:
+            hosts = {host: sorted(s) for host, s in self._samples.items() if s}
+        out = {}
+        for host, samples in hosts.items():
+            last = len(samples) - 1
+            out[host] = {f"p{q}": round(samples[int(round(q / 100 * last))], 3)
+                         for q in (50, 95, 99)}
+            out[host]["n"] = len(samples)
+        return out
@@ -1,12 +1,14 @@
 import logging
-from logging.handlers import RotatingFileHandler
+import threading
 from pathlib import Path
-import os
-import yaml
 
 CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "config.yaml"
 
 def setup_logger():
+    # Imports différés : rien de tout cela n’est payé tant qu’aucun message n’est émis
+    import yaml
+    from logging.handlers import RotatingFileHandler
+
     if CONFIG_PATH.exists():
         with open(CONFIG_PATH, "r", encoding="utf-8") as f:
             cfg = yaml.safe_load(f) or {}
@@ -31,6 +33,48 @@ def setup_logger():
     root_logger.addHandler(console)
     return root_logger
 
-logger = setup_logger()# logger.py
+
+class _DeferredSetup(logging.Handler):
+    """Configure les vrais handlers (YAML, fichier de log) au premier message émis.
+
+    Importer le logger ne lit plus la configuration et ne crée plus logs/ :
+    les commandes qui n’écrivent rien démarrent sans ce coût. C’est un handler
+    du logger "minima", pas un filtre : les messages des loggers enfants
+    ("minima.x") remontent à ses handlers sans passer par ses filtres. Les
+    handlers créés par `setup` sur `target` lui sont confiés et reçoivent
+    tous les messages, dont le déclencheur, une seule fois.
+    """
+
+    def __init__(self, target, setup=setup_logger):
+        super().__init__()
+        self._target = target
+        self._setup = setup
+        self._setup_lock = threading.Lock()
+        self._handlers = None
+
+    def handle(self, record):
+        if self._handlers is None:
+            with self._setup_lock:
+                if self._handlers is None:
+                    before = list(self._target.handlers)
+                    self._setup()
+                    added = [h for h in self._target.handlers if h not in before]
+                    # Retirés du logger : la boucle d’appel en cours ne les verra pas deux fois
+                    for handler in added:
+                        self._target.removeHandler(handler)
+                    self._handlers = added
+        for handler in self._handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record):
+        self.handle(record)
+
+
+logger = logging.getLogger("minima")
+logger.setLevel(logging.INFO)
+logger.addHandler(_DeferredSetup(logger))
+# logger.py
 def get_logger(name=None):
     return logging.getLogger("minima" if name is None else name)
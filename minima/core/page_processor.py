@@ -0,0 +1,107 @@
+# minima/core/page_processor.py
+from minima.core.document import ParsedDocument
+from minima.core.logger import logger
+from minima.core.plugin_runner import PluginRunner
+from minima.core.result_cache import fingerprint
+
+
+class PageProcessor:
+    """Traitement d’une page téléchargée : filtre de langue, analyse, plugins.
+
+    Partagé par la boucle par lots de `main` et par le pipeline en flux.
+    La page est parsée une seule fois (ParsedDocument) : les plugins qui
+    exposent `process_document(doc)` la reçoivent, les autres gardent
+    l’ancienne signature `process(url, html)`. L’ordre et les dépendances
+    des plugins sont gérés par un PluginRunner (voir `plugin_options`).
+
+    Avec un `result_cache` (ResultCache), langue, analyse et sorties des
+    plugins d’un corps déjà vu sont reprises sans parser la page.
+    """
+
+    def __init__(self, analyzer, plugins, accepted_languages, extractor="soup", plugin_options=None,
+                 result_cache=None):
+        self.analyzer = analyzer
+        self.cache = result_cache
+        if isinstance(plugins, PluginRunner):
+            self.plugins = plugins
+        else:
+            self.plugins = PluginRunner(plugins, cache=result_cache, **(plugin_options or {}))
+        self.accepted_languages = accepted_languages
+        # "soup" (arbre BeautifulSoup) ou "stream" (extraction sans arbre)
+        self.extractor = extractor
+        if result_cache is not None:
+            # Toute modification du code d’analyse invalide ses entrées
+            code = fingerprint(type(analyzer).__module__, "minima.core.document",
+                               "minima.core.extractor", "minima.core.language")
+            self._analysis_key = f"analyse:{code}:{extractor}"
+
+    def _prepare(self, item: dict, html: str):
+        """Filtre de langue puis analyse.
+
+        Renvoie (doc, résultat, langue), ou None si la page est ignorée.
+        """
+        url = item["url"]
+        doc = ParsedDocument(html, url, extractor=self.extractor)
+
+        cached = key = None
+        if self.cache is not None:
+            key = f"{self._analysis_key}:{doc.digest}"
+            cached = self.cache.get(key)
+
+        # Filtrage langue
+        lang = cached["lang"] if cached else self.analyzer.detect_language(doc)
+        if lang not in self.accepted_languages:
+            if key and not cached:
+                self.cache.put(key, {"lang": lang, "result": None})
+            logger.info(f"Ignoré (Langue {lang}) : {url}")
+            return None
+
+        # Analyse technique (l’URL n’est pas dans l’entrée : un miroir la réutilise)
+        if cached and cached["result"] is not None:
+            result = dict(cached["result"], url=url)
+        else:
+            if hasattr(self.analyzer, "analyze_document"):
+                result = self.analyzer.analyze_document(doc)
+            else:
+                result = self.analyzer.analyze(html, url)
+            if key and "error" not in result:
+                stored = {k: v for k, v in result.items() if k != "url"}
+                self.cache.put(key, {"lang": lang, "result": stored})
+        result['score'] = item.get('score', 0)
+        return doc, result, lang
+
+    def process(self, item: dict, html: str) -> dict | None:
+        """Renvoie le résultat enrichi, ou None si la page est ignorée."""
+        return self.process_batch([(item, html)])[0]
+
+    def process_batch(self, jobs: list) -> list:
+        """Analyse [(item, html), ...] dans l’ordre (même interface qu’AnalysisPool).
+
+        Les pages sont traitées par tranches de `plugins.chunk_size` : les plugins
+        tournent une fois par tranche (PluginRunner.run_batch), ce qui profite aux
+        plugins à `process_batch`, et seuls les documents parsés d’une tranche
+        sont en mémoire à un instant donné.
+        """
+        step = self.plugins.chunk_size
+        results = []
+        for start in range(0, len(jobs), step):
+            results.extend(self._process_chunk(jobs[start:start + step]))
+        return results
+
+    def _process_chunk(self, jobs: list) -> list:
+        prepared = [self._prepare(item, html) for item, html in jobs]
+        kept = [p for p in prepared if p is not None]
+        self.plugins.run_batch([doc for doc, _, _ in kept], [result for _, result, _ in kept])
+        for doc, _, lang in kept:
+            logger.info(f"OK ({lang}) : {doc.url}")
+        return [p[1] if p is not None else None for p in prepared]
+
+    def log_stats(self):
+        self.plugins.stats.log_summary()
+        if self.cache is not None:
+            self.cache.log_summary()
+
+    def close(self):
+        self.plugins.close()
+        if self.cache is not None:
+            self.cache.close()
@@ -0,0 +1,136 @@
+# minima/core/pipeline.py
+import queue
+import threading
+import time
+from minima.core.logger import logger
+from minima.core.politeness import HostScheduler
+
+_STOP = object()
+
+
+class StreamingPipeline:
+    """Pipeline producteur/consommateur : fetch -> analyse -> export.
+
+    Chaque page téléchargée part aussitôt vers l’analyse via une file bornée,
+    sans attendre le reste du lot ; les liens découverts reviennent dans la
+    frontière et sont redistribués en continu aux workers de fetch. Réseau et
+    CPU se recouvrent, et un hôte lent ne bloque plus tout un tour.
+
+    Seul le thread appelant `run` touche à la queue persistante et au callback
+    `on_done` (export, découverte de liens) : ils n’ont pas besoin d’être thread-safe.
+    """
+
+    def __init__(self, scraper, processor, on_done, scheduler=None,
+                 fetch_workers=5, analysis_workers=1, buffer_size=100, max_in_flight=None,
+                 analysis_batch=1):
+        self.scraper = scraper
+        self.processor = processor
+        self.on_done = on_done
+        self.fetch_workers = max(1, int(fetch_workers))
+        self.analysis_workers = max(1, int(analysis_workers))
+        # Pages regroupées par appel à processor.process_batch (pool de processus)
+        self.analysis_batch = max(1, int(analysis_batch))
+        self.scheduler = scheduler or HostScheduler(max_per_host=self.fetch_workers)
+        # Nombre d'URLs sorties de la frontière et pas encore terminées
+        self.max_in_flight = int(max_in_flight or self.fetch_workers * 4)
+        self._fetch = scraper.fetch_html  # moteur "threads" (cf. create_scraper)
+        self._items = {}                                   # url -> item en cours
+        self._parse_q = queue.Queue(maxsize=buffer_size)  # pages à analyser (bornée)
+        self._done_q = queue.Queue()                       # (item, résultat | None)
+        self._stop = threading.Event()
+
+    def _fetch_worker(self):
+        while not self._stop.is_set():
+            url = self.scheduler.acquire(timeout=0.2)
+            if url is None:
+                continue
+            try:
+                html = self._fetch(url)
+            except Exception as e:
+                logger.warning(f"Échec inattendu sur {url} : {e}")
+                html = None
+            finally:
+                self.scheduler.release(url)
+            item = self._items.pop(url)
+            if html:
+                self._parse_q.put((item, html))
+            else:
+                self._done_q.put((item, None))
+
+    def _analysis_worker(self):
+        while (job := self._parse_q.get()) is not _STOP:
+            jobs = [job]
+            # Lot opportuniste : on prend ce qui attend déjà, sans attendre davantage
+            while len(jobs) < self.analysis_batch:
+                try:
+                    job = self._parse_q.get_nowait()
+                except queue.Empty:
+                    break
+                if job is _STOP:
+                    self._parse_q.put(_STOP)  # rendu pour ce thread, au prochain tour
+                    break
+                jobs.append(job)
+            try:
+                if len(jobs) > 1:
+                    results = self.processor.process_batch(jobs)
+                else:
+                    results = [self.processor.process(*jobs[0])]
+            except Exception as e:
+                logger.warning(f"Échec de l’analyse pour {len(jobs)} pages: {e}")
+                results = [None] * len(jobs)
+            for (item, _), result in zip(jobs, results):
+                self._done_q.put((item, result))
+
+    def run(self, frontier) -> int:
+        """Traite la frontière jusqu’à épuisement ; renvoie le nombre d’items terminés."""
+        threads = [threading.Thread(target=self._fetch_worker, daemon=True)
+                   for _ in range(self.fetch_workers)]
+        threads += [threading.Thread(target=self._analysis_worker, daemon=True)
+                    for _ in range(self.analysis_workers)]
+        for t in threads:
+            t.start()
+
+        # Frontière avec nouveaux essais différés : délai avant le prochain item dû
+        next_ready_in = getattr(frontier, "next_ready_in", None)
+        in_flight = done = 0
+        try:
+            while True:
+                # Alimente les workers tant que la frontière a des URLs dues
+                # et qu'il reste de la place
+                while in_flight < self.max_in_flight and not frontier.is_empty():
+                    item = frontier.get()
+                    if item is None:
+                        break  # il ne reste que des URLs différées
+                    self._items[item["url"]] = item
+                    self.scheduler.add(item["url"])
+                    in_flight += 1
+                if in_flight >= self.max_in_flight:
+                    # Plein : rien à distribuer avant qu’un item se termine
+                    item, result = self._done_q.get()
+                else:
+                    # Place libre mais frontière vide ou seulement des URLs différées
+                    wait = next_ready_in() if next_ready_in and not frontier.is_empty() else None
+                    if wait is not None:
+                        wait = max(wait, 0.01)  # jamais de timeout nul (boucle active)
+                    if in_flight == 0:
+                        if wait is None:
+                            break
+                        time.sleep(wait)
+                        continue
+                    try:
+                        # Réveil à l'échéance du prochain item différé, même si rien ne termine
+                        item, result = self._done_q.get(timeout=wait)
+                    except queue.Empty:
+                        continue
+                in_flight -= 1
+                done += 1
+                self.on_done(item, result)
+        finally:
+            self._stop.set()
+            for _ in range(self.analysis_workers):
+                try:
+                    self._parse_q.put_nowait(_STOP)
+                except queue.Full:
+                    break  # arrêt anticipé : les threads démons s'arrêteront avec le processus
+        logger.info(f"Pipeline terminé ({done} pages traitées)")
+        return done
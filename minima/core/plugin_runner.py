@@ -0,0 +1,331 @@
+# minima/core/plugin_runner.py
+import hashlib
+import json
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import yaml
+
+from minima.core.errors import ConfigError
+from minima.core.logger import logger
+from minima.core.plugin_stats import PluginBreaker, PluginStats
+from minima.core.politeness import host_of
+from minima.core.result_cache import fingerprint
+
+PLUGINS_CONFIG_PATH = Path(__file__).resolve().parents[2] / "config" / "plugins.yaml"
+
+
+def load_pipeline_spec(path=None) -> dict:
+    """Lit config/plugins.yaml : ordre du pipeline et déclarations par plugin."""
+    path = Path(path) if path else PLUGINS_CONFIG_PATH
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        logger.warning(f"Fichier de pipeline introuvable: {path}")
+        return {}
+    except yaml.YAMLError as e:
+        raise ConfigError(f"Erreur YAML dans {path}: {e}")
+
+
+def pipeline_options(cfg: dict, path=None) -> dict:
+    """Options de PluginRunner (sérialisables, transmises aux processus d’analyse)."""
+    spec = load_pipeline_spec(path)
+    return {
+        "order": spec.get("pipeline"),
+        "declarations": spec.get("plugins") or {},
+        "export_fields": cfg.get("export_fields") or None,
+        "threads": int(cfg.get("plugin_threads", 1)),
+        "batch_size": int(cfg.get("plugin_batch_size", 32)),
+        "budget_ms": float(cfg.get("plugin_budget_ms", 0)),
+        "breaker_threshold": int(cfg.get("plugin_breaker_threshold", 5)),
+        "breaker_hosts": int(cfg.get("plugin_breaker_hosts", 3)),
+    }
+
+
+def plugin_name(plugin) -> str:
+    """Nom court du plugin (tel qu’écrit dans plugins.yaml), même importé par paquet."""
+    return getattr(plugin, "__name__", repr(plugin)).rsplit(".", 1)[-1]
+
+
+def _names(value) -> tuple:
+    if value is None:
+        return ()
+    return (value,) if isinstance(value, str) else tuple(value)
+
+
+class PluginNode:
+    """Un plugin du pipeline et ce qu’il lit (REQUIRES) ou produit (PROVIDES)."""
+
+    def __init__(self, module, declaration=None, batch_size=32, cache=None):
+        declaration = declaration or {}
+        self.module = module
+        self.name = plugin_name(module)
+        self.requires = _names(declaration.get("requires", getattr(module, "REQUIRES", None)))
+        provides = declaration.get("provides", getattr(module, "PROVIDES", None))
+        # Sans déclaration, les champs produits sont inconnus : le plugin n’est jamais sauté
+        self.provides = None if provides is None else _names(provides)
+        self.batched = hasattr(module, "process_batch")
+        self.batch_size = max(1, int(declaration.get("batch_size", batch_size)))
+        # Cache de résultats : seulement pour les plugins validés (empreinte connue)
+        self.sha = getattr(module, "__sha256__", None)
+        cacheable = declaration.get("cache", getattr(module, "CACHEABLE", True))
+        self.cache = cache if cache is not None and self.sha and cacheable else None
+        self.version = self.sha
+        data_files = getattr(module, "CACHE_FILES", ()) if self.cache is not None else ()
+        if data_files:
+            # Fichiers lus par le plugin (ex. base de signatures) : les modifier invalide le cache
+            self.version = f"{self.sha}:{fingerprint(*map(Path, data_files))[:16]}"
+        if self.requires and not (self.batched or hasattr(module, "process_document")):
+            raise ConfigError(f"Plugin {self.name} : REQUIRES impose "
+                              f"process_document(doc, fields) ou process_batch")
+
+    def call(self, doc, fields):
+        plugin = self.module
+        if self.requires:
+            return plugin.process_document(doc, fields)
+        if hasattr(plugin, "process_document"):
+            return plugin.process_document(doc)
+        if hasattr(plugin, "process"):
+            return plugin.process(doc.url, doc.html)
+        return None
+
+    def cache_key(self, doc, fields) -> str:
+        key = f"plugin:{self.name}:{self.version}:{doc.digest}"
+        if self.requires:
+            # Les champs lus font partie de l’entrée du plugin
+            raw = json.dumps(fields, sort_keys=True, ensure_ascii=False, default=str)
+            raw = raw.encode("utf-8")
+            key += ":" + hashlib.sha256(raw).hexdigest()[:16]
+        return key
+
+    def call_batch(self, docs, fields):
+        """process_batch(urls, htmls[, fields]) sur un lot ; un résultat par page."""
+        args = ([doc.url for doc in docs], [doc.html for doc in docs])
+        if self.requires:
+            args += (fields,)
+        out = list(self.module.process_batch(*args) or ())
+        if len(out) != len(docs):
+            raise ValueError(f"{len(out)} résultats pour {len(docs)} pages")
+        return out
+
+
+class PluginRunner:
+    """Exécute les plugins selon le DAG de leurs dépendances.
+
+    L’ordre vient de `pipeline` (config/plugins.yaml) ; un plugin dont un champ
+    REQUIRES est produit par un autre passe après lui, les plugins d’un même
+    niveau sont indépendants et tournent en parallèle sur `threads` threads.
+    Avec `export_fields`, seuls les plugins dont un champ est exporté ou lu
+    en aval sont exécutés. Les résultats sont fusionnés dans l’ordre du
+    pipeline (à champ égal, le dernier plugin l’emporte, comme avant).
+
+    Un plugin qui expose `process_batch(urls, htmls)` (plus `fields` s’il
+    déclare REQUIRES) reçoit les pages par lots de `batch_size` (réglable par
+    plugin dans plugins.yaml) ; les autres restent appelés page par page.
+
+    Chaque appel est mesuré (`stats`). Un appel qui lève une exception ou
+    dépasse `budget_ms` par page compte comme un échec pour le disjoncteur
+    (`breaker_threshold` échecs consécutifs : plugin coupé pour l’hôte,
+    coupé sur `breaker_hosts` hôtes : coupé pour le run). Le budget est
+    constaté après coup : un appel en cours n’est jamais interrompu.
+
+    Avec un `cache` (ResultCache), la sortie d’un plugin validé est reprise
+    telle quelle pour un corps de page déjà traité par la même version du
+    plugin (déclarer `cache: false` pour un plugin qui dépend de l’URL, et
+    `CACHE_FILES` pour les fichiers de données dont dépend sa sortie).
+    """
+
+    def __init__(self, plugins, order=None, declarations=None, export_fields=None, threads=1,
+                 batch_size=32, budget_ms=0, breaker_threshold=5, breaker_hosts=3, stats=None,
+                 cache=None):
+        declarations = declarations or {}
+        by_name = {plugin_name(p): p for p in plugins}
+        if order:
+            for name in order:
+                if name not in by_name:
+                    logger.warning(f"Plugin du pipeline absent ou non approuvé: {name}")
+            for name in by_name:
+                if name not in order:
+                    logger.info(f"Plugin approuvé hors pipeline, ignoré: {name}")
+            for name in declarations:
+                if name not in order:
+                    logger.warning(f"Plugin déclaré dans plugins.yaml mais absent du pipeline, "
+                                   f"jamais exécuté: {name}")
+            modules = [by_name[name] for name in order if name in by_name]
+        else:
+            modules = list(plugins)
+        nodes = [PluginNode(m, declarations.get(plugin_name(m)), batch_size, cache)
+                 for m in modules]
+        self.nodes = self._prune(nodes, export_fields)
+        self.levels = self._levels(self.nodes)
+        # Pages par appel à run_batch : le plus grand lot demandé par un plugin
+        self.chunk_size = max([node.batch_size for node in self.nodes if node.batched],
+                              default=max(1, int(batch_size)))
+        self.threads = max(1, int(threads))
+        self.budget = float(budget_ms) / 1000
+        self.stats = stats or PluginStats()
+        self.breaker = PluginBreaker(breaker_threshold, breaker_hosts, stats=self.stats)
+        self._executor = None
+        if self.threads > 1 and any(len(level) > 1 for level in self.levels):
+            self._executor = ThreadPoolExecutor(max_workers=self.threads,
+                                                thread_name_prefix="plugin")
+
+    @staticmethod
+    def _prune(nodes, export_fields):
+        """Remonte le DAG depuis les champs exportés ; garde les plugins utiles."""
+        if not export_fields:
+            return nodes
+        needed, kept = set(export_fields), set()
+        changed = True
+        while changed:  # point fixe : un plugin gardé rend utiles ceux dont il lit les champs
+            changed = False
+            for node in nodes:
+                useful = node.provides is None or needed.intersection(node.provides)
+                if node.name not in kept and useful:
+                    kept.add(node.name)
+                    needed.update(node.requires)
+                    changed = True
+        for node in nodes:
+            if node.name not in kept:
+                logger.info(f"Plugin sauté (aucun champ consommé): {node.name}")
+        return [node for node in nodes if node.name in kept]
+
+    @staticmethod
+    def _levels(nodes):
+        """Tri topologique par niveaux (Kahn), stable selon l’ordre du pipeline."""
+        providers = {}
+        for node in nodes:
+            for field in node.provides or ():
+                providers.setdefault(field, []).append(node.name)
+        deps = {node.name: {p for f in node.requires for p in providers.get(f, ())
+                            if p != node.name}
+                for node in nodes}
+        levels, done = [], set()
+        while len(done) < len(nodes):
+            level = [node for node in nodes if node.name not in done and deps[node.name] <= done]
+            if not level:
+                cycle = sorted(name for name in deps if name not in done)
+                raise ConfigError(f"Dépendances circulaires entre plugins: {', '.join(cycle)}")
+            levels.append(level)
+            done.update(node.name for node in level)
+        return levels
+
+    @property
+    def names(self) -> list[str]:
+        return [node.name for node in self.nodes]
+
+    def _timed(self, node, fn, docs, fields, hosts):
+        """Appelle fn(docs, fields) et renvoie un résultat par page ; mesure et disjoncteur.
+
+        Un résultat qui n’est pas un dict compte comme une erreur du plugin et
+        est écarté ; les autres pages du lot gardent le leur.
+        """
+        start = time.perf_counter()
+        error = None
+        try:
+            values = fn(docs, fields)
+        except Exception as e:
+            error = e
+            values = [None] * len(docs)
+        else:
+            invalid = [v for v in values if v and not isinstance(v, Mapping)]
+            if invalid:
+                error = TypeError(f"résultat {type(invalid[0]).__name__} au lieu d’un dict")
+                values = [v if isinstance(v, Mapping) else None for v in values]
+        elapsed = time.perf_counter() - start
+        over = self.budget > 0 and elapsed > self.budget * len(docs)
+        if error is not None:
+            logger.warning(f"Erreur plugin {node.name} ({len(docs)} page(s)) : {error}")
+        out_bytes = sum(len(json.dumps(v, ensure_ascii=False, default=str).encode("utf-8"))
+                        for v in values if v)
+        self.stats.record(node.name, elapsed, len(docs), error is not None, over, out_bytes)
+        if error is not None:
+            reason = f"erreur {error}"
+        else:
+            reason = f"{elapsed * 1000:.1f} ms, budget dépassé"
+        for host in set(hosts):
+            self.breaker.record(node.name, host, error is None and not over, reason)
+        return values
+
+    def _call_all(self, node, docs, fields):
+        """Résultats d’un plugin pour chaque page : process_batch s’il existe, sinon page par page.
+
+        Les pages déjà en cache ne rappellent pas le plugin ; celles d’un hôte où
+        il est coupé par le disjoncteur donnent None.
+        """
+        inputs = [{f: page.get(f) for f in node.requires} for page in fields]
+        hosts = [host_of(doc.url) if doc.url else "" for doc in docs]
+        values = [None] * len(docs)
+        keys = {}
+        todo = []
+        for i in range(len(docs)):
+            if node.cache is not None:
+                keys[i] = node.cache_key(docs[i], inputs[i])
+                cached = node.cache.get(keys[i])
+                if cached is not None:
+                    values[i] = cached
+                    self.stats.cached(node.name)
+                    continue
+            todo.append(i)
+        if node.batched:
+            allowed = [i for i in todo if self.breaker.allows(node.name, hosts[i])]
+            if len(allowed) < len(todo):
+                self.stats.skipped(node.name, len(todo) - len(allowed))
+            for start in range(0, len(allowed), node.batch_size):
+                chunk = allowed[start:start + node.batch_size]
+                out = self._timed(node, node.call_batch, [docs[i] for i in chunk],
+                                  [inputs[i] for i in chunk], [hosts[i] for i in chunk])
+                for i, value in zip(chunk, out):
+                    values[i] = value
+        else:
+            def call(page_docs, page_fields):
+                return [node.call(page_docs[0], page_fields[0])]
+
+            for i in todo:
+                if not self.breaker.allows(node.name, hosts[i]):
+                    self.stats.skipped(node.name)
+                    continue
+                values[i] = self._timed(node, call, [docs[i]], [inputs[i]], [hosts[i]])[0]
+        if node.cache is not None:
+            for i in todo:
+                if values[i] is not None:
+                    node.cache.put(keys[i], values[i])
+        return values
+
+    def run(self, doc, result: dict) -> dict:
+        """Exécute le pipeline sur un document et enrichit `result` en place."""
+        return self.run_batch([doc], [result])[0]
+
+    def run_batch(self, docs: list, results: list) -> list:
+        """Exécute le pipeline sur plusieurs documents ; enrichit chaque résultat en place.
+
+        Chaque plugin est appelé une fois par niveau pour toutes les pages :
+        les plugins à `process_batch` les reçoivent par lots, les autres page
+        par page.
+        """
+        outputs = [{} for _ in docs]
+        fields = [dict(result) for result in results]
+        for level in self.levels:
+            if self._executor is not None and len(level) > 1:
+                values = list(self._executor.map(
+                    lambda node: self._call_all(node, docs, fields), level))
+            else:
+                values = [self._call_all(node, docs, fields) for node in level]
+            # Les niveaux suivent l’ordre du pipeline : fusion dans ce même ordre
+            for node, per_page in zip(level, values):
+                for i, value in enumerate(per_page):
+                    outputs[i][node.name] = value
+                    if value:
+                        fields[i].update(value)
+        for result, out in zip(results, outputs):
+            for node in self.nodes:
+                if out.get(node.name):
+                    result.update(out[node.name])
+        return results
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
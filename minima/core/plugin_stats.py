@@ -0,0 +1,144 @@
+# minima/core/plugin_stats.py
+import threading
+from collections import defaultdict
+
+from minima.core.latency import LatencyTracker
+from minima.core.logger import logger
+
+
+class PluginStats:
+    """Instrumentation par plugin : appels, pages, erreurs, temps (total, p95),
+    octets produits, dépassements de budget et désactivations.
+
+    Avec `keep_events`, chaque mesure est aussi journalisée pour être remontée
+    (`drain`) puis fusionnée (`merge`) dans le processus principal : c’est ainsi
+    que le pool d’analyse agrège les compteurs de ses processus.
+    """
+
+    def __init__(self, keep_events: bool = False, window: int = 1000):
+        self._lock = threading.Lock()
+        self._totals = defaultdict(lambda: {"calls": 0, "pages": 0, "errors": 0, "over_budget": 0,
+                                            "skipped": 0, "cached": 0, "seconds": 0.0, "bytes": 0})
+        self._times = LatencyTracker(window=window, min_samples=1)
+        self.disabled = []  # (plugin, hôte ou None pour tout le run, raison)
+        self._events = [] if keep_events else None
+
+    def record(self, name, seconds, pages=1, error=False, over=False, out_bytes=0):
+        with self._lock:
+            t = self._totals[name]
+            t["calls"] += 1
+            t["pages"] += pages
+            t["errors"] += int(error)
+            t["over_budget"] += int(over)
+            t["seconds"] += seconds
+            t["bytes"] += out_bytes
+            if self._events is not None:
+                self._events.append(("call", name, seconds, pages, error, over, out_bytes))
+        self._times.record(name, seconds)
+
+    def skipped(self, name, pages=1):
+        with self._lock:
+            self._totals[name]["skipped"] += pages
+            if self._events is not None:
+                self._events.append(("skip", name, pages))
+
+    def cached(self, name, pages=1):
+        """Pages dont le résultat vient du cache de résultats (plugin non appelé)."""
+        with self._lock:
+            self._totals[name]["cached"] += pages
+            if self._events is not None:
+                self._events.append(("cached", name, pages))
+
+    def note_disabled(self, name, host, reason):
+        with self._lock:
+            self.disabled.append((name, host, reason))
+            if self._events is not None:
+                self._events.append(("disabled", name, host, reason))
+
+    def drain(self) -> list:
+        """Mesures enregistrées depuis le dernier appel (vide sans `keep_events`)."""
+        with self._lock:
+            if self._events is None:
+                return []
+            events, self._events = self._events, []
+        return events
+
+    def merge(self, events):
+        for event in events:
+            kind, args = event[0], event[1:]
+            if kind == "call":
+                self.record(*args)
+            elif kind == "skip":
+                self.skipped(*args)
+            elif kind == "cached":
+                self.cached(*args)
+            elif kind == "disabled":
+                self.note_disabled(*args)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            totals = {name: dict(t) for name, t in self._totals.items()}
+        for name, t in totals.items():
+            p95 = self._times.percentile(name, 95)
+            t["p95_ms"] = round(p95 * 1000, 2) if p95 is not None else None
+            t["seconds"] = round(t["seconds"], 3)
+        return totals
+
+    def log_summary(self):
+        """Résumé de fin de run, plugins les plus coûteux en premier."""
+        snap = self.snapshot()
+        for name, t in sorted(snap.items(), key=lambda kv: kv[1]["seconds"], reverse=True):
+            logger.info(f"Plugin {name}: {t['calls']} appels ({t['pages']} pages) "
+                        f"en {t['seconds']}s, p95 {t['p95_ms']} ms, {t['errors']} erreurs, "
+                        f"{t['over_budget']} hors budget, "
+                        f"{t['skipped']} pages sautées, {t['cached']} depuis le cache, "
+                        f"{t['bytes'] / 1024:.1f} Ko produits")
+        for name, host, reason in self.disabled:
+            scope = f"pour {host}" if host is not None else "pour tout le run"
+            logger.warning(f"Plugin {name} désactivé {scope} ({reason})")
+
+
+class PluginBreaker:
+    """Disjoncteur par (plugin, hôte).
+
+    Après `threshold` échecs consécutifs (exception ou budget dépassé) sur un
+    hôte, le plugin n’y est plus appelé ; désactivé sur `host_limit` hôtes, il
+    l’est pour tout le run. `threshold` à 0 désactive le disjoncteur.
+    """
+
+    def __init__(self, threshold: int = 5, host_limit: int = 3, stats: PluginStats | None = None):
+        self.threshold = int(threshold)
+        self.host_limit = int(host_limit)
+        self.stats = stats
+        self._lock = threading.Lock()
+        self._strikes = defaultdict(int)
+        self._open_hosts = defaultdict(set)
+        self._open_run = set()
+
+    def allows(self, name, host) -> bool:
+        with self._lock:
+            return name not in self._open_run and host not in self._open_hosts.get(name, ())
+
+    def record(self, name, host, ok: bool, reason: str = ""):
+        if self.threshold <= 0:
+            return
+        tripped = []
+        with self._lock:
+            key = (name, host)
+            if ok:
+                self._strikes.pop(key, None)
+                return
+            self._strikes[key] += 1
+            if self._strikes[key] < self.threshold or host in self._open_hosts[name]:
+                return
+            self._open_hosts[name].add(host)
+            tripped.append((name, host, f"{self.threshold} échecs consécutifs, dernier : {reason}"))
+            if self.host_limit > 0 and len(self._open_hosts[name]) >= self.host_limit \
+                    and name not in self._open_run:
+                self._open_run.add(name)
+                tripped.append((name, None, f"désactivé sur {len(self._open_hosts[name])} hôtes"))
+        for name, host, why in tripped:
+            scope = f"pour {host}" if host is not None else "pour tout le run"
+            logger.warning(f"Plugin {name} désactivé {scope} : {why}")
+            if self.stats is not None:
+                self.stats.note_disabled(name, host, why)
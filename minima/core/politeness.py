@@ -0,0 +1,140 @@
+# minima/core/politeness.py
+import heapq
+import itertools
+import threading
+import time
+from collections import defaultdict, deque
+from urllib.parse import urlparse
+
+
+def host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+class HostScheduler:
+    """Ordonnanceur de politesse par hôte.
+
+    Chaque hôte a sa file d’URLs prêtes, un intervalle minimal entre deux
+    requêtes et un nombre maximal de requêtes simultanées. Un tas trié par
+    date de disponibilité donne à chaque worker la prochaine URL dont l’hôte
+    est dû : le crawl avance au rythme cumulé de tous les hôtes sans qu’aucun
+    ne soit sollicité plus que configuré.
+    """
+
+    def __init__(self, min_interval: float = 0.0, max_per_host: int = 2,
+                 host_limits: dict | None = None, controller=None):
+        self.min_interval = float(min_interval)
+        self.max_per_host = max(1, int(max_per_host))
+        # Surcharges par hôte : {"exemple.com": {"delay": 2, "max_per_host": 1}}
+        self.host_limits = host_limits or {}
+        # Contrôleur AIMD optionnel : plafonne dynamiquement chaque hôte et
+        # repousse ceux qui sont sous Retry-After
+        self.controller = controller
+        self._queues = defaultdict(deque)   # hôte -> URLs en attente
+        self._active = defaultdict(int)     # hôte -> requêtes en cours
+        self._next_time = {}                # hôte -> date de la prochaine requête autorisée
+        self._heap = []                     # (date de disponibilité, seq, hôte)
+        self._scheduled = set()             # hôtes présents dans le tas
+        self._seq = itertools.count()
+        self._pending = 0
+        self._cond = threading.Condition()
+
+    def _interval(self, host):
+        return float(self.host_limits.get(host, {}).get("delay", self.min_interval))
+
+    def _capacity(self, host):
+        cap = max(1, int(self.host_limits.get(host, {}).get("max_per_host", self.max_per_host)))
+        if self.controller is not None:
+            cap = min(cap, self.controller.host_limit(host))
+        return cap
+
+    def _ready_time(self, host):
+        ready = self._next_time.get(host, 0.0)
+        if self.controller is not None:
+            ready = max(ready, self.controller.blocked_until(host))
+        return ready
+
+    def _schedule(self, host):
+        # Un hôte est dans le tas s'il a des URLs en attente et de la capacité libre
+        if host in self._scheduled or not self._queues[host]:
+            return
+        if self._active[host] >= self._capacity(host):
+            return
+        heapq.heappush(self._heap, (self._ready_time(host), next(self._seq), host))
+        self._scheduled.add(host)
+
+    def add(self, url: str):
+        with self._cond:
+            host = host_of(url)
+            self._queues[host].append(url)
+            self._pending += 1
+            self._schedule(host)
+            self._cond.notify()
+
+    def __len__(self):
+        return self._pending
+
+    def acquire(self, timeout: float | None = None) -> str | None:
+        """Bloque jusqu’à ce qu’un hôte soit dû et renvoie son URL suivante.
+
+        Renvoie None quand il ne reste plus rien à distribuer (ou au timeout).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if self._heap and self._heap[0][0] <= now:
+                    _, _, host = heapq.heappop(self._heap)
+                    self._scheduled.discard(host)
+                    if self._ready_time(host) > now or self._active[host] >= self._capacity(host):
+                        # L'hôte a été freiné depuis sa mise en tas (Retry-After, limite AIMD)
+                        self._schedule(host)
+                        continue
+                    url = self._queues[host].popleft()
+                    self._pending -= 1
+                    self._active[host] += 1
+                    self._next_time[host] = now + self._interval(host)
+                    self._schedule(host)
+                    return url
+                if self._pending == 0:
+                    return None
+                # Soit le prochain hôte n'est pas encore dû, soit tous sont à leur plafond
+                wait = self._heap[0][0] - now if self._heap else None
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        return None
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._cond.wait(wait)
+
+    def try_reserve(self, url: str) -> bool:
+        """Prend sans attendre un slot de plus sur l’hôte de `url` (requête hedgée).
+
+        Refusé si l’hôte est à son plafond ou pas encore dû ; à libérer par `release`.
+        """
+        with self._cond:
+            host = host_of(url)
+            now = time.monotonic()
+            if self._active[host] >= self._capacity(host) or self._ready_time(host) > now:
+                return False
+            self._active[host] += 1
+            self._next_time[host] = now + self._interval(host)
+            return True
+
+    def release(self, url: str):
+        """Signale la fin d’une requête : libère un slot de l’hôte."""
+        with self._cond:
+            host = host_of(url)
+            self._active[host] = max(0, self._active[host] - 1)
+            self._schedule(host)
+            self._cond.notify_all()
+
+    def drain(self) -> list[str]:
+        """Retire et renvoie les URLs pas encore distribuées (fin de lot anticipée)."""
+        with self._cond:
+            urls = [url for urls in self._queues.values() for url in urls]
+            self._queues.clear()
+            self._heap, self._pending = [], 0
+            self._scheduled.clear()
+            self._cond.notify_all()
+            return urls
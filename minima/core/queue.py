@@ -1,91 +1,387 @@
+# minima/core/queue.py
 import os
 import json
+import heapq
+import time
 from minima.core.logger import logger
+from minima.core.errors import QueueError
+from minima.core.frontier import PriorityFrontier
+
+
+def _key(item):
+    """Clé d’index d’un item : son URL (ou l’item lui-même s’il s’agit d’une chaîne)."""
+    if isinstance(item, dict):
+        return item.get("url")
+    return item
+
 
 class PersistentQueue:
-    def __init__(self, path, flush_every=1):
+    def __init__(self, path, flush_every=1, journal=False, compact_every=1000,
+                 seen_filter=None, keep_processed=True, read_only=False):
         self.path = path
+        # Lecture seule : cf. open_queue
+        self.read_only = read_only
+        if not read_only:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
         self.flush_every = max(1, flush_every)  # Nombre d'opérations avant flush
         self._counter = 0
+        # Mode journalisé : chaque opération est ajoutée en fin de journal (coût O(1)),
+        # le snapshot complet n'est réécrit qu'à la compaction
+        self.journal = journal
+        self.journal_path = f"{path}.journal"
+        self.compact_every = max(1, compact_every)
+        self._journal_file = None
+        self._journal_count = 0
         # Chaque item est un dict {"url": ..., "depth": ..., "score": ...}
-        self.data = {"pending": [], "processed": [], "scores": {}}
+        # Index par URL : appartenance, ajout et retrait en O(1)
+        self._pending = {}    # url -> item (ordre d'insertion conservé)
+        self._active = {}     # url -> (item, score) sortis par get() mais pas encore traités
+        self._processed = {}  # url -> item
+        # Tas de priorité sur les URLs en attente : pop et top-N en O(log n)
+        self._frontier = PriorityFrontier()
+        # Items en attente d'un nouvel essai (champ "not_before" dans l'item) :
+        # hors du tas de priorité jusqu'à leur échéance
+        self._deferred = {}        # url -> score
+        self._deferred_heap = []   # (not_before, url)
+        # Filtre compact des URLs traitées (BloomFilter) ; sans keep_processed,
+        # les enregistrements complets ne sont plus gardés en mémoire ni dans queue.json
+        self._seen = seen_filter
+        self.keep_processed = keep_processed or seen_filter is None
         self._load()
 
+    @property
+    def data(self):
+        """Vue sérialisable de la queue (format historique de queue.json)."""
+        # Les items en cours de traitement sont sauvegardés comme en attente :
+        # après un arrêt brutal, ils seront repris au prochain lancement
+        scores = self._frontier.scores()
+        scores.update((key, score) for key, (_, score) in self._active.items())
+        scores.update(self._deferred)
+        return {
+            "pending": list(self._pending.values()) + [item for item, _ in self._active.values()],
+            "processed": list(self._processed.values()),
+            "scores": scores,
+        }
+
     def _load(self):
         if os.path.exists(self.path):
             try:
                 with open(self.path, "r", encoding="utf-8") as f:
                     loaded = json.load(f)
-                    self.data["pending"] = loaded.get("pending", [])
-                    self.data["processed"] = loaded.get("processed", [])
-                    self.data["scores"] = loaded.get("scores", {})
-                # Nettoyage pour éviter les doublons
-                self.data["pending"] = [item for item in self.data["pending"] if item not in self.data["processed"]]
-                self._save()
-                logger.info(f"Queue chargée depuis {self.path} "
-                            f"({len(self.data['pending'])} en attente, "
-                            f"{len(self.data['processed'])} traitées)")
+                # Reconstruction des index ; les doublons éventuels des anciens
+                # fichiers sont éliminés au passage (première occurrence gardée)
+                for item in loaded.get("processed", []):
+                    if self._seen is not None and not self.read_only:
+                        self._seen.add(_key(item))
+                    if self.keep_processed:
+                        self._processed.setdefault(_key(item), item)
+                scores = loaded.get("scores", {})
+                for item in loaded.get("pending", []):
+                    key = _key(item)
+                    if key not in self._pending and not self.is_processed(key):
+                        self._enqueue(key, item, scores.get(key, 0))
             except Exception as e:
                 logger.warning(f"Échec du chargement de la queue: {e}")
-        else:
+                return
+        elif not (self.journal and os.path.exists(self.journal_path)):
+            if self.read_only:
+                return
             logger.info(f"Aucune queue trouvée, création d'une nouvelle: {self.path}")
             self._save()
+            return
+
+        replayed = self._replay_journal() if self.journal else 0
+        # Items sortis avant l'arrêt mais jamais traités : de nouveau distribuables
+        for key, (item, score) in self._active.items():
+            self._enqueue(key, item, score)
+        self._active = {}
+        if not self.read_only:
+            self._save()
+        logger.info(f"Queue chargée depuis {self.path} "
+                    f"({len(self._pending)} en attente, "
+                    f"{len(self._processed)} traitées, "
+                    f"{replayed} opérations rejouées)")
+
+    def _replay_journal(self) -> int:
+        """Rejoue le journal après le snapshot (reprise après crash)."""
+        if not os.path.exists(self.journal_path):
+            return 0
+        count = 0
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    # Dernière ligne tronquée par un arrêt brutal : on s'arrête là
+                    logger.warning(f"Journal tronqué ignoré après {count} opérations")
+                    break
+                op = event.get("op")
+                if op == "add":
+                    self._apply_add(event["item"], event.get("score", 0))
+                elif op == "pop":
+                    self._apply_pop(event["key"])
+                elif op == "score":
+                    self._apply_score(event["key"], event["score"])
+                elif op == "done":
+                    self._apply_done(event["item"])
+                elif op == "retry":
+                    self._apply_retry(event["item"])
+                count += 1
+        return count
 
     def _save(self):
+        """Écrit le snapshot complet et, en mode journalisé, vide le journal."""
+        if self.read_only:
+            raise QueueError(f"Queue ouverte en lecture seule: {self.path}")
+        if self._seen is not None:
+            self._seen.flush()
         try:
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, indent=2)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=None if self.journal else 2)
+            os.replace(tmp_path, self.path)
         except Exception as e:
             logger.error(f"Erreur lors de la sauvegarde de la queue: {e}")
+            return
+        if self.journal:
+            # Le snapshot contient tout : le journal peut repartir de zéro
+            if self._journal_file:
+                self._journal_file.close()
+            self._journal_file = open(self.journal_path, "w", encoding="utf-8")
+            self._journal_count = 0
+            self._counter = 0
 
-    def _maybe_flush(self):
+    def _maybe_flush(self, event):
+        if self.read_only:
+            raise QueueError(f"Queue ouverte en lecture seule: {self.path}")
+        if self.journal:
+            self._append(event)
+            return
         self._counter += 1
         if self._counter >= self.flush_every:
             self._save()
             self._counter = 0
 
+    def _append(self, event):
+        """Ajoute une opération au journal ; compacte tous les `compact_every` événements."""
+        if self._journal_file is None:
+            self._journal_file = open(self.journal_path, "a", encoding="utf-8")
+        self._journal_file.write(json.dumps(event, separators=(",", ":")) + "\n")
+        self._journal_count += 1
+        self._counter += 1
+        if self._counter >= self.flush_every:
+            self._journal_file.flush()
+            self._counter = 0
+        if self._journal_count >= self.compact_every:
+            self._save()
+
+    def _enqueue(self, key, item, score):
+        """Met un item en attente : dans le tas, ou en différé si son not_before est à venir."""
+        self._pending[key] = item
+        not_before = item.get("not_before", 0) if isinstance(item, dict) else 0
+        if not_before > time.time():
+            self._deferred[key] = score
+            heapq.heappush(self._deferred_heap, (not_before, key))
+        else:
+            self._frontier.push(key, score)
+
+    def _promote_due(self):
+        """Fait passer dans le tas de priorité les items différés arrivés à échéance."""
+        now = time.time()
+        while self._deferred_heap and self._deferred_heap[0][0] <= now:
+            not_before, key = heapq.heappop(self._deferred_heap)
+            # Entrée périmée si l'item a été replanifié ou traité entre-temps
+            if key in self._deferred and self._pending[key].get("not_before") == not_before:
+                self._frontier.push(key, self._deferred.pop(key))
+
+    def _apply_add(self, item, score) -> bool:
+        key = _key(item)
+        if self.is_known(key):
+            return False
+        self._enqueue(key, item, score)
+        return True
+
+    def _apply_pop(self, key):
+        if key in self._pending:
+            self._active[key] = (self._pending.pop(key), self._frontier.score(key))
+            self._frontier.remove(key)
+
+    def _apply_done(self, item) -> bool:
+        key = _key(item)
+        self._pending.pop(key, None)
+        self._active.pop(key, None)
+        self._deferred.pop(key, None)
+        self._frontier.remove(key)
+        if self._seen is not None:
+            # En lecture seule, le filtre est consulté sans être modifié
+            added = key not in self._seen if self.read_only else self._seen.add(key)
+            if self.keep_processed and key not in self._processed:
+                self._processed[key] = item
+            return added
+        if key in self._processed:
+            return False
+        self._processed[key] = item
+        return True
+
+    def _apply_score(self, key, score) -> bool:
+        if key not in self._pending:
+            return False
+        if key in self._deferred:
+            self._deferred[key] = score
+        else:
+            self._frontier.push(key, score)
+        return True
+
+    def _apply_retry(self, item) -> bool:
+        key = _key(item)
+        if key in self._active:
+            _, score = self._active.pop(key)
+        elif key in self._deferred:
+            score = self._deferred.pop(key)
+        elif key in self._pending:
+            score = self._frontier.score(key)
+            self._frontier.remove(key)
+        else:
+            return False
+        self._pending.pop(key, None)
+        self._enqueue(key, item, score)
+        return True
+
     def add(self, item, score=0):
-        """Ajoute un item dict à la queue si il n’existe pas déjà."""
-        if item not in self.data["pending"] and item not in self.data["processed"]:
-            self.data["pending"].append(item)
-            self.data["scores"][item["url"]] = score
-            logger.info(f"Added to queue: {item}")
-            self._maybe_flush()
+        """Ajoute un item dict à la queue si son URL n’est pas déjà connue."""
+        if not self._apply_add(item, score):
+            return
+        logger.info(f"Added to queue: {item}")
+        self._maybe_flush({"op": "add", "item": item, "score": score})
 
     def get(self):
-        """Récupère l’item avec le score le plus élevé."""
-        if self.is_empty():
+        """Récupère l’item prêt avec le score le plus élevé (None si aucun n’est dû)."""
+        self._promote_due()
+        if not self._frontier:
             return None
-        self.data["pending"].sort(key=lambda x: self.data["scores"].get(x["url"], 0), reverse=True)
-        item = self.data["pending"].pop(0)
-        self._maybe_flush()
+        key, score = self._frontier.popitem()
+        item = self._pending.pop(key)
+        self._active[key] = (item, score)
+        self._maybe_flush({"op": "pop", "key": key})
         return item
 
     def mark_processed(self, item):
-        """Marque un item dict comme traité et nettoie pending."""
-        self.data["pending"] = [i for i in self.data["pending"] if i != item]
-        if item not in self.data["processed"]:
-            self.data["processed"].append(item)
-            self.data["scores"].pop(item["url"], None)
+        """Marque un item dict comme traité et le retire de pending."""
+        if self._apply_done(item):
             logger.info(f"Marqué comme traité: {item}")
-        self._maybe_flush()
+        self._maybe_flush({"op": "done", "item": item})
+
+    def reschedule(self, item, delay: float):
+        """Remet un item en attente pour un nouvel essai dans `delay` secondes.
+
+        Le nombre de tentatives et l’échéance sont stockés dans l’item
+        ("attempts", "not_before") et survivent donc à un redémarrage.
+        """
+        item = dict(item, attempts=item.get("attempts", 0) + 1,
+                    not_before=round(time.time() + delay, 3))
+        if self._apply_retry(item):
+            logger.info(f"Nouvel essai dans {delay:.1f}s: {item['url']}")
+            self._maybe_flush({"op": "retry", "item": item})
+        return item
+
+    def next_ready_in(self) -> float | None:
+        """Secondes avant qu’un item soit dû (0 s’il y en a un), None si la queue est vide."""
+        self._promote_due()
+        if self._frontier:
+            return 0.0
+        while self._deferred_heap:
+            not_before, key = self._deferred_heap[0]
+            if key in self._deferred and self._pending[key].get("not_before") == not_before:
+                return max(0.0, not_before - time.time())
+            heapq.heappop(self._deferred_heap)
+        return None
+
+    def update_score(self, url, score):
+        """Modifie la priorité d’une URL en attente (O(log n))."""
+        if self._apply_score(url, score):
+            self._maybe_flush({"op": "score", "key": url, "score": score})
+
+    def is_known(self, url) -> bool:
+        """Indique si l’URL est déjà en attente ou traitée."""
+        return url in self._pending or url in self._active or self.is_processed(url)
+
+    def is_processed(self, url) -> bool:
+        if url in self._processed:
+            return True
+        return self._seen is not None and url in self._seen
+
+    def __contains__(self, url):
+        return self.is_known(url)
+
+    def counts(self) -> dict:
+        processed = len(self._processed) if self._seen is None else len(self._seen)
+        return {"pending": len(self._pending), "processed": processed}
 
     def force_flush(self):
-        """Flush immédiat, par ex. avant Ctrl+C."""
+        """Flush immédiat, par ex. avant Ctrl+C (compacte le journal le cas échéant)."""
         self._save()
         logger.info("Queue flush forcé")
 
+    def close(self):
+        """Compacte et ferme le journal."""
+        if not self.read_only:
+            self._save()
+        if self._journal_file:
+            self._journal_file.close()
+            self._journal_file = None
+        if self._seen is not None:
+            self._seen.close()
+
     def is_empty(self):
-        return len(self.data["pending"]) == 0
+        return len(self._pending) == 0
 
     def clear(self):
-        self.data = {"pending": [], "processed": [], "scores": {}}
+        self._pending, self._active, self._processed = {}, {}, {}
+        self._deferred, self._deferred_heap = {}, []
+        self._frontier.clear()
+        if self._seen is not None:
+            self._seen.clear()
         self._save()
         logger.info("Queue réinitialisée")
 
-    def remaining_urls(self) -> list[dict]:
-        return sorted(
-            self.data.get("pending", []),
-            key=lambda x: self.data["scores"].get(x["url"], 0),
-            reverse=True
+    def remaining_urls(self, limit: int | None = None) -> list[dict]:
+        """Items prêts par score décroissant (les `limit` premiers lus dans le tas)."""
+        self._promote_due()
+        return [self._pending[key] for key in self._frontier.peek(limit)]
+
+
+def open_queue(cfg: dict, path: str, read_only: bool = False):
+    """Instancie la file choisie par `queue_backend` ("json" ou "sqlite").
+
+    Avec `read_only`, la file est lue sans être modifiée (pas de sauvegarde, de
+    compaction ni de reprise des items en cours) : pour les commandes d’état
+    comme `queue-status`, qui ne doivent pas modifier la file qu’elles décrivent.
+    """
+    backend = cfg.get("queue_backend", "json")
+    flush_every = int(cfg.get("queue_flush_every", 1))
+    if backend == "sqlite":
+        from minima.core.sqlite_queue import SQLiteQueue
+        return SQLiteQueue(os.path.splitext(path)[0] + ".db", batch_size=flush_every,
+                           read_only=read_only)
+    if backend == "json":
+        seen_filter = None
+        seen_path = os.path.splitext(path)[0] + ".seen"
+        missing = read_only and not os.path.exists(seen_path)
+        if cfg.get("queue_seen_filter", False) and not missing:
+            from minima.core.seen_set import BloomFilter
+            seen_filter = BloomFilter(
+                seen_path,
+                capacity=int(cfg.get("queue_seen_capacity", 1_000_000)),
+                error_rate=float(cfg.get("queue_seen_error_rate", 0.001)),
+                read_only=read_only,
+            )
+        return PersistentQueue(
+            path,
+            flush_every=flush_every,
+            journal=bool(cfg.get("queue_journal", False)),
+            compact_every=int(cfg.get("queue_compact_every", 1000)),
+            seen_filter=seen_filter,
+            keep_processed=bool(cfg.get("queue_keep_processed", True)),
+            read_only=read_only,
         )
+    raise QueueError(f"Backend de queue inconnu: {backend}")
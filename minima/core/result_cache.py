@@ -0,0 +1,130 @@
+# minima/core/result_cache.py
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+
+from minima.core.logger import logger
+
+
+def fingerprint(*modules) -> str:
+    """Empreinte SHA256 du code source de modules, ou du contenu de fichiers
+    passés en `Path` (invalide le cache quand ils changent)."""
+    h = hashlib.sha256()
+    for module in modules:
+        module = sys.modules.get(module, module) if isinstance(module, str) else module
+        path = module if isinstance(module, os.PathLike) else getattr(module, "__file__", None)
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                h.update(f.read())
+        else:
+            h.update(repr(module).encode("utf-8"))
+    return h.hexdigest()
+
+
+class ResultCache:
+    """Cache disque des résultats d’analyse et de plugins, indexé par contenu.
+
+    La clé associe l’empreinte SHA256 du corps de la page à celle du code qui
+    produit le résultat (SHA256 validé du plugin et des fichiers de données
+    qu’il déclare, ou empreinte des modules d’analyse) : pages identiques
+    (miroirs, variantes à paramètres de suivi, recrawls) servies sans parsing,
+    et un plugin modifié ne relit jamais ses anciennes entrées. Les valeurs
+    sont du JSON compressé (zlib) dans SQLite ; au-delà de `max_bytes`, les
+    entrées les moins récemment lues sont évincées. Plusieurs processus peuvent
+    partager le même fichier.
+    """
+
+    def __init__(self, path="data/result_cache.db", max_bytes=256 * 1024 * 1024, batch_size=100):
+        self.path = str(path)
+        self.max_bytes = int(max_bytes)
+        self.batch_size = max(1, batch_size)
+        self._ops = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "evicted": 0}
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                used REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_results_used ON results(used)")
+        self.conn.commit()
+        self._size = self._total_size()
+
+    def _total_size(self) -> int:
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def _maybe_commit(self):
+        self._ops += 1
+        if self._ops >= self.batch_size:
+            self.conn.commit()
+            self._ops = 0
+
+    def get(self, key: str):
+        """Valeur en cache, ou None (la lecture rafraîchit la position LRU)."""
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            self.conn.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+            self._maybe_commit()
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, key: str, value):
+        blob = zlib.compress(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+        with self._lock:
+            old = self.conn.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+            self.conn.execute("INSERT OR REPLACE INTO results (key, value, size, used) "
+                              "VALUES (?, ?, ?, ?)", (key, blob, len(blob), time.time()))
+            self._size += len(blob) - (old[0] if old else 0)
+            self.stats["stored"] += 1
+            self._maybe_commit()
+            if self.max_bytes > 0 and self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Supprime les entrées les plus anciennement lues jusqu’à 90 % de `max_bytes`."""
+        # Taille réelle : d’autres processus écrivent peut-être dans le même fichier
+        self._size = self._total_size()
+        excess = self._size - int(self.max_bytes * 0.9)
+        victims, freed = [], 0
+        for key, size in self.conn.execute("SELECT key, size FROM results ORDER BY used"):
+            if freed >= excess:
+                break
+            victims.append((key,))
+            freed += size
+        self.conn.executemany("DELETE FROM results WHERE key = ?", victims)
+        self.conn.commit()
+        self._ops = 0
+        self._size -= freed
+        self.stats["evicted"] += len(victims)
+        logger.debug(f"Cache de résultats : {len(victims)} entrées évincées ({freed} octets)")
+
+    def commit(self):
+        with self._lock:
+            self.conn.commit()
+            self._ops = 0
+
+    def close(self):
+        with self._lock:
+            self.conn.commit()
+            self.conn.close()
+
+    def log_summary(self):
+        s = self.stats
+        logger.info(f"Cache de résultats: {s['hits']} réutilisés, {s['misses']} absents, "
+                    f"{s['stored']} enregistrés, {s['evicted']} évincés "
+                    f"({self._size / 1024 / 1024:.1f} Mo)")
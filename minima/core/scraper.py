@@ -1,12 +1,27 @@
 import requests
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
 from bs4 import BeautifulSoup
 from minima.core.logger import logger
 from minima.core.config_loader import get
+from minima.core.errors import ConfigError
+from minima.core.http_cache import HttpCache
+from minima.core.encoding import BoundedBody, BodyTooLarge
+from minima.core.language import prefilter_rejects
+from minima.core.politeness import host_of
+from minima.core.concurrency import parse_retry_after
+from minima.core.latency import LatencyTracker
+
+# Extensions à ignorer (partagées par tous les moteurs de fetch)
+EXCLUDED_EXT = (
+    '.jpg', '.jpeg', '.png', '.gif', '.pdf', '.zip',
+    '.mp4', '.mp3', '.docx', '.xlsx', '.pptx', '.exe'
+)
 
 class Scraper:
-    def __init__(self):
+    def __init__(self, scheduler=None, controller=None):
         self.session = requests.Session()
         self.headers = get("headers", {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; MinimaBot/0.9)",
@@ -16,12 +31,56 @@ class Scraper:
         self.timeout = int(get("timeout", 10))
         self.max_workers = int(get("max_workers", 5))
         self.retries = int(get("retries", 3))
+        # Ordonnanceur de politesse par hôte (HostScheduler), optionnel
+        self.scheduler = scheduler
+        # Contrôleur de concurrence adaptatif (AdaptiveConcurrency), optionnel :
+        # remplace les pauses fixes sur 403/429 par des limites AIMD et le Retry-After
+        self.controller = controller
 
         # --- AJOUT : Extensions à ignorer ---
-        self.excluded_ext = (
-            '.jpg', '.jpeg', '.png', '.gif', '.pdf', '.zip', 
-            '.mp4', '.mp3', '.docx', '.xlsx', '.pptx', '.exe'
-        )
+        self.excluded_ext = EXCLUDED_EXT
+
+        # Taille maximale d'un corps de page (0 = illimitée) et politique au-delà :
+        # "truncate" garde le début de la page, "abort" l'ignore
+        self.max_body_bytes = int(get("max_body_bytes", 5 * 1024 * 1024))
+        self.oversize_policy = get("oversize_policy", "truncate")
+
+        # Préfiltre de langue : on lit les premiers Ko, et si la langue déclarée
+        # est refusée on coupe le transfert avant de télécharger le reste
+        self.language_prefilter = bool(get("language_prefilter", False))
+        self.prefilter_bytes = int(get("language_prefilter_bytes", 8192))
+        self.accepted_languages = get("accepted_languages", ["en", "fr"])
+
+        self.stats = {"prefilter_rejected": 0, "prefilter_bytes_read": 0,
+                      "deadline_exceeded": 0, "batch_deadline_skipped": 0,
+                      "hedged": 0, "hedge_wins": 0}
+        self._stats_lock = threading.Lock()
+
+        # Nouveaux essais différés : au lieu de dormir dans le thread, fetch_html
+        # rend la main et l'URL est replanifiée dans la frontière (cf. pop_retry)
+        self.deferred_retries = bool(get("deferred_retries", False))
+        self._retry_hints = {}
+
+        # Latence de queue : délai total par page (le `timeout` de requests ne borne
+        # que chaque lecture) et par lot de fetch_all (0 = pas de limite)
+        self.fetch_deadline = float(get("fetch_deadline", 30))
+        self.batch_deadline = float(get("batch_deadline", 0))
+        # Requêtes hedgées : une copie part quand la première dépasse le percentile
+        # `hedge_percentile` des latences de l'hôte (0 = désactivé)
+        self.latency = LatencyTracker(window=int(get("latency_window", 200)),
+                                      min_samples=int(get("hedge_min_samples", 20)))
+        hedging = get("hedge_requests", False)
+        self.hedge_percentile = float(get("hedge_percentile", 95)) if hedging else 0
+        self._hedge_pool = None
+        if self.hedge_percentile:
+            self._hedge_pool = ThreadPoolExecutor(max_workers=2 * self.max_workers,
+                                                  thread_name_prefix="hedge")
+
+        # Cache HTTP conditionnel (ETag / Last-Modified) pour les recrawls
+        self.cache = None
+        if get("http_cache", False):
+            self.cache = HttpCache(get("http_cache_dir", "data/http_cache"),
+                                   max_age=float(get("http_cache_max_age", 0)))
 
     def fetch_html(self, url: str):
         """Télécharge la page SEULEMENT si c'est du contenu textuel."""
@@ -31,31 +90,212 @@ class Scraper:
             logger.info(f"Ignoré (Fichier média) : {url}")
             return None
 
-        for attempt in range(1, self.retries + 1):
+        cached = self.cache.lookup(url) if self.cache else None
+        if cached and self.cache.is_fresh(cached):
+            body = self.cache.serve(url, cached, revalidated=False)
+            if body is not None:
+                return body
+        if self._hedge_pool:
+            return self._fetch_hedged(url, cached)
+        return self._fetch_network(url, cached)
+
+    def _fetch_hedged(self, url: str, cached):
+        """Lance une seconde requête si la première dépasse le percentile de l'hôte."""
+        hedge_after = self.latency.percentile(host_of(url), self.hedge_percentile)
+        if hedge_after is None:
+            # Pas encore assez de mesures pour cet hôte
+            return self._fetch_network(url, cached)
+        first = self._hedge_pool.submit(self._fetch_network, url, cached)
+        try:
+            return first.result(timeout=hedge_after)
+        except FutureTimeout:
+            pass
+        if self.scheduler is not None:
+            # La copie compte dans le plafond de l'hôte : pas de hedge sur un hôte saturé
+            if not self.scheduler.try_reserve(url):
+                return first.result()
+        second = self._hedge_pool.submit(self._fetch_network, url, cached)
+        if self.scheduler is not None:
+            second.add_done_callback(lambda _: self.scheduler.release(url))
+        with self._stats_lock:
+            self.stats["hedged"] += 1
+        pending = {first, second}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                html = future.result()
+                if html is not None:
+                    if future is second:
+                        with self._stats_lock:
+                            self.stats["hedge_wins"] += 1
+                    return html
+        return None
+
+    def _fetch_network(self, url: str, cached):
+        """Requête(s) réseau pour une page, bornées par `fetch_deadline`."""
+        conditional = HttpCache.validators(cached)
+        host = host_of(url)
+        deadline = time.monotonic() + self.fetch_deadline if self.fetch_deadline > 0 else None
+        # En mode différé, une seule tentative : l'échec repart dans la frontière
+        attempts = 1 if self.deferred_retries else self.retries
+        retryable, retry_after = False, None
+        for attempt in range(1, attempts + 1):
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            if self.controller:
+                # Attend un slot (global + hôte) et l'éventuel Retry-After de l'hôte
+                self.controller.acquire(host)
+            status, retry_after = None, None
+            start = time.monotonic()
+            latency = 0.0
             try:
                 # On utilise stream=True pour vérifier le header avant de tout télécharger
-                resp = self.session.get(url, timeout=self.timeout, stream=True)
-                
+                timeout = self.timeout if deadline is None \
+                    else max(0.1, min(self.timeout, deadline - time.monotonic()))
+                resp = self.session.get(url, timeout=timeout, stream=True, headers=conditional)
+                latency = time.monotonic() - start
+                status, retry_after = resp.status_code, resp.headers.get("Retry-After")
+
+                if resp.status_code == 304 and cached:
+                    resp.close()
+                    body = self.cache.serve(url, cached, revalidated=True,
+                                            elapsed=time.monotonic() - start)
+                    if body is not None:
+                        return body
+                    # Corps en cache illisible : on refait une requête complète
+                    conditional = {}
+                    retryable = True
+                    continue
+
                 if resp.status_code == 200:
                     # 2. Vérification de sécurité par le Content-Type
                     content_type = resp.headers.get('Content-Type', '').lower()
                     if 'text/html' not in content_type:
+                        resp.close()
                         logger.warning(f"Ignoré (Format non-HTML: {content_type}) : {url}")
                         return None
-                    
+
                     # On récupère le texte seulement si c'est du HTML
-                    return resp.text
-                
-                elif resp.status_code in (403, 429):
+                    text = self._read_body(resp, url, deadline)
+                    if text is None:
+                        return None
+                    self.latency.record(host, time.monotonic() - start)
+                    if self.cache:
+                        self.cache.store(url, resp.headers, text, time.monotonic() - start)
+                    return text
+
+                resp.close()
+                if resp.status_code in (403, 429):
                     logger.warning(f"Tentative {attempt} : Blocage {resp.status_code}")
-                    time.sleep(2 * attempt)
+                    retryable = True
+                    if not (self.controller or self.deferred_retries):
+                        time.sleep(2 * attempt)
                 else:
+                    retryable = resp.status_code >= 500
                     break
             except requests.RequestException as e:
+                latency = time.monotonic() - start
                 logger.debug(f"Erreur réseau sur {url} : {e}")
-                time.sleep(1)
+                retryable = True
+                if not (self.controller or self.deferred_retries):
+                    time.sleep(1)
+            finally:
+                if self.controller:
+                    self.controller.release(host, latency, status, retry_after)
+        if retryable and self.deferred_retries:
+            self._note_retry(url, parse_retry_after(retry_after) or 0.0)
         return None
-        
+
+    def _note_retry(self, url: str, delay: float):
+        with self._stats_lock:
+            self._retry_hints[url] = delay
+
+    def pop_retry(self, url: str) -> float | None:
+        """Délai Retry-After (0 si absent) si le dernier échec sur `url` mérite un
+        nouvel essai différé, None sinon."""
+        with self._stats_lock:
+            return self._retry_hints.pop(url, None)
+
+    def _read_body(self, resp, url: str, deadline: float | None = None) -> str | None:
+        """Lit le corps par morceaux, borné à `max_body_bytes`, et le décode.
+
+        L'encodage est déterminé sur les premiers Ko (en-tête, BOM, <meta charset>)
+        plutôt que par une détection statistique sur tout le corps.
+        """
+        content_type = resp.headers.get("Content-Type")
+        declared = resp.headers.get("Content-Length", "")
+        body = BoundedBody(self.max_body_bytes, self.oversize_policy)
+        # Chaque lecture ne respecte que `timeout` : à l'échéance, le socket est
+        # coupé depuis un timer pour débloquer une lecture en cours (serveur goutte à goutte)
+        expired = threading.Event()
+        watchdog = None
+        if deadline is not None:
+            watchdog = threading.Timer(max(0.0, deadline - time.monotonic()),
+                                       self._expire_response, (resp, expired))
+            watchdog.daemon = True
+            watchdog.start()
+        try:
+            if self.oversize_policy == "abort" and declared.isdigit() \
+                    and 0 < self.max_body_bytes < int(declared):
+                raise BodyTooLarge(f"Content-Length {declared} > {self.max_body_bytes} octets")
+            checked = not self.language_prefilter
+            for chunk in resp.iter_content(chunk_size=16384):
+                if expired.is_set() or (deadline is not None and time.monotonic() > deadline):
+                    return self._deadline_exceeded(url)
+                if chunk and not body.feed(chunk):
+                    logger.warning(f"Page tronquée à {self.max_body_bytes} octets : {url}")
+                    break
+                if not checked and body.size >= self.prefilter_bytes:
+                    checked = True
+                    if self._rejected_language(body, resp, url):
+                        return None
+            if expired.is_set():
+                return self._deadline_exceeded(url)  # corps coupé net, pas une fin de page
+            if not checked and self._rejected_language(body, resp, url):
+                return None
+        except BodyTooLarge as e:
+            logger.warning(f"Ignoré (page trop volumineuse, {e}) : {url}")
+            return None
+        except Exception:
+            if expired.is_set():
+                return self._deadline_exceeded(url)
+            raise
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+            resp.close()
+        return body.text(content_type)
+
+    @staticmethod
+    def _expire_response(resp, expired: threading.Event):
+        """Échéance de `fetch_deadline` : coupe la connexion sous la lecture en cours."""
+        expired.set()
+        raw = getattr(resp, "raw", None)
+        try:
+            if hasattr(raw, "shutdown"):
+                raw.shutdown()  # urllib3 >= 2.3 : débloque un recv() en attente
+            else:
+                resp.close()
+        except Exception as e:
+            logger.debug(f"Coupure de la connexion impossible : {e}")
+
+    def _deadline_exceeded(self, url: str):
+        logger.warning(f"Abandon (délai total de {self.fetch_deadline}s dépassé) : {url}")
+        with self._stats_lock:
+            self.stats["deadline_exceeded"] += 1
+        return None
+
+    def _rejected_language(self, body: BoundedBody, resp, url: str) -> bool:
+        lang = prefilter_rejects(body.head(self.prefilter_bytes),
+                                 resp.headers.get("Content-Language"), self.accepted_languages)
+        if lang is None:
+            return False
+        with self._stats_lock:
+            self.stats["prefilter_rejected"] += 1
+            self.stats["prefilter_bytes_read"] += body.size
+        logger.info(f"Ignoré (Langue {lang}, préfiltre) : {url}")
+        return True
+
     def fetch_preview(self, url: str, max_chars: int = 5000) -> str:
             """Récupère seulement un extrait du HTML pour détecter la langue."""
             try:
@@ -90,13 +330,121 @@ class Scraper:
         results = {}
         start = time.time()
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        if self.scheduler is not None:
+            results = self._fetch_scheduled(urls)
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
             futures = {executor.submit(self.fetch_html, url): url for url in urls}
-            for future in as_completed(futures):
-                url = futures[future]
-                results[url] = future.result()
+            done, _ = wait(futures, timeout=self.batch_deadline or None)
+            for future in done:
+                results[futures[future]] = future.result()
+            # Au-delà du délai du lot, on n'attend pas les retardataires
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._skip_late(urls, results)
 
         duration = round(time.time() - start, 2)
         rps = round(len(urls) / duration, 2) if duration > 0 else 0
         logger.info(f"Fetch terminé ({len(urls)} URLs en {duration}s, {rps} RPS)")
         return results
+
+    def log_stats(self):
+        """Résumé de fin de run des compteurs du scraper."""
+        if self.cache:
+            self.cache.log_summary()
+        if self.controller:
+            snap = self.controller.snapshot()
+            hosts = ", ".join(f"{h}={v['limit']}" for h, v in snap["hosts"].items())
+            logger.info(f"Concurrence adaptative: global={snap['global_limit']} hôtes: {hosts}")
+        latencies = self.latency.snapshot()
+        slowest = sorted(latencies.items(), key=lambda kv: kv[1]["p95"], reverse=True)[:5]
+        for host, q in slowest:
+            logger.info(f"Latence {host}: p50={q['p50']}s p95={q['p95']}s p99={q['p99']}s "
+                        f"({q['n']} pages)")
+        stats = self.stats
+        if stats["deadline_exceeded"] or stats["batch_deadline_skipped"] or stats["hedged"]:
+            logger.info(f"Délais: {stats['deadline_exceeded']} pages abandonnées, "
+                        f"{stats['batch_deadline_skipped']} reportées (fin de lot), "
+                        f"{stats['hedged']} requêtes hedgées ({stats['hedge_wins']} gagnantes)")
+        if self.language_prefilter:
+            logger.info(f"Préfiltre langue: {self.stats['prefilter_rejected']} pages rejetées "
+                        f"après {self.stats['prefilter_bytes_read']} octets lus")
+
+    def _skip_late(self, urls: list[str], results: dict):
+        """URLs non terminées à l'échéance du lot : résultat None et nouvel essai différé."""
+        late = [url for url in urls if url not in results]
+        for url in late:
+            results[url] = None
+            self._note_retry(url, 0.0)
+        if late:
+            with self._stats_lock:
+                self.stats["batch_deadline_skipped"] += len(late)
+            logger.warning(f"Délai du lot dépassé : {len(late)} URLs reportées")
+
+    def _fetch_scheduled(self, urls: list[str]) -> dict[str, str | None]:
+        """Chaque worker prend la prochaine URL dont l’hôte est dû selon le scheduler."""
+        results, lock = {}, threading.Lock()
+        end = time.monotonic() + self.batch_deadline if self.batch_deadline > 0 else None
+        for url in urls:
+            self.scheduler.add(url)
+
+        def worker():
+            while True:
+                timeout = None if end is None else end - time.monotonic()
+                if timeout is not None and timeout <= 0:
+                    return
+                url = self.scheduler.acquire(timeout=timeout)
+                if url is None:
+                    return
+                try:
+                    html = self.fetch_html(url)
+                except Exception as e:
+                    logger.warning(f"Échec inattendu sur {url} : {e}")
+                    html = None
+                finally:
+                    self.scheduler.release(url)
+                with lock:
+                    results[url] = html
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        workers = [executor.submit(worker) for _ in range(min(self.max_workers, len(urls)))]
+        wait(workers, timeout=self.batch_deadline or None)
+        executor.shutdown(wait=False)
+        # Les URLs pas encore distribuées ne doivent pas rester dans le scheduler
+        self.scheduler.drain()
+        # Copie : les fetchs encore en vol complètent `results` après le retour
+        with lock:
+            return dict(results)
+
+
+def create_scraper(cfg: dict, scheduler=None, controller=None):
+    """Instancie le moteur de fetch choisi par `scraper_engine` ("threads" ou "async")."""
+    engine = cfg.get("scraper_engine", "threads")
+    if engine == "async":
+        if cfg.get("streaming", False):
+            # Le pipeline en flux demande les pages une à une depuis ses threads :
+            # chaque appel ouvrirait sa propre boucle asyncio et sa session HTTP
+            raise ConfigError("streaming: true nécessite scraper_engine 'threads' "
+                              "(le moteur async télécharge par lots)")
+        try:
+            from minima.core.async_scraper import AsyncScraper
+        except ImportError as e:
+            raise ConfigError(f"scraper_engine 'async' nécessite aiohttp "
+                              f"(pip install aiohttp): {e}")
+        return AsyncScraper(
+            timeout=int(cfg.get("timeout", 10)),
+            retries=int(cfg.get("retries", 3)),
+            headers=cfg.get("headers"),
+            concurrency=int(cfg.get("async_concurrency", 500)),
+            min_interval=float(cfg.get("delay", 0)),
+            max_per_host=int(cfg.get("max_per_host", 2)),
+            max_body_bytes=int(cfg.get("max_body_bytes", 5 * 1024 * 1024)),
+            oversize_policy=cfg.get("oversize_policy", "truncate"),
+            accepted_languages=cfg.get("accepted_languages", ["en", "fr"]),
+            prefilter_bytes=int(cfg.get("language_prefilter_bytes", 8192))
+            if cfg.get("language_prefilter", False) else 0,
+            deferred_retries=bool(cfg.get("deferred_retries", False)),
+            batch_deadline=float(cfg.get("batch_deadline", 0)),
+        )
+    if engine == "threads":
+        return Scraper(scheduler=scheduler, controller=controller)
+    raise ConfigError(f"Moteur de scraping inconnu: {engine}")
@@ -0,0 +1,105 @@
+# minima/core/seen_set.py
+import hashlib
+import math
+import mmap
+import os
+import struct
+from minima.core.logger import logger
+
+_MAGIC = b"MBLF"
+_HEADER = struct.Struct("<4sIQIQ")  # magic, version, nb de bits, nb de hashs, nb d'éléments
+
+
+class BloomFilter:
+    """Ensemble probabiliste d’URLs déjà vues, persisté dans un fichier mmap.
+
+    Quelques bits par URL (≈ 14,4 bits pour 0,1 % de faux positifs) au lieu
+    d’un dict complet : `url in seen` ne renvoie jamais de faux négatif, mais
+    peut renvoyer un faux positif au taux configuré.
+    """
+
+    def __init__(self, path, capacity=1_000_000, error_rate=0.001, read_only=False):
+        self.path = str(path)
+        self.read_only = read_only
+        if os.path.exists(self.path) and os.path.getsize(self.path) >= _HEADER.size:
+            self._open_existing()
+        elif read_only:
+            raise FileNotFoundError(f"Filtre des URLs vues introuvable: {self.path}")
+        else:
+            self._create(int(capacity), float(error_rate))
+        logger.info(f"Filtre des URLs vues: {self.path} ({self.count} éléments, "
+                    f"{self.num_bits // 8} octets, {self.num_hashes} hashs)")
+
+    def _create(self, capacity, error_rate):
+        if not 0 < error_rate < 1:
+            raise ValueError(f"Taux de faux positifs invalide: {error_rate}")
+        capacity = max(1, capacity)
+        num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        num_bits = (num_bits + 7) // 8 * 8
+        self.num_bits = num_bits
+        self.num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self.count = 0
+        with open(self.path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, 1, self.num_bits, self.num_hashes, 0))
+            f.truncate(_HEADER.size + num_bits // 8)
+        self._map()
+
+    def _open_existing(self):
+        with open(self.path, "rb") as f:
+            magic, _, num_bits, num_hashes, count = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError(f"Fichier de filtre invalide: {self.path}")
+        self.num_bits, self.num_hashes, self.count = num_bits, num_hashes, count
+        self._map()
+
+    def _map(self):
+        if self.read_only:
+            self._file = open(self.path, "rb")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            return
+        self._file = open(self.path, "r+b")
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+
+    def _positions(self, url):
+        # Double hachage (Kirsch-Mitzenmacher) à partir d'un seul digest de 128 bits
+        digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, url) -> bool:
+        """Ajoute l’URL ; renvoie False si elle était (probablement) déjà présente."""
+        mm, offset, added = self._mm, _HEADER.size, False
+        for pos in self._positions(url):
+            byte, mask = offset + (pos >> 3), 1 << (pos & 7)
+            if not mm[byte] & mask:
+                mm[byte] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, url):
+        mm, offset = self._mm, _HEADER.size
+        return all(mm[offset + (pos >> 3)] & (1 << (pos & 7)) for pos in self._positions(url))
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self._mm[_HEADER.size:] = bytes(self.num_bits // 8)
+        self.count = 0
+        self.flush()
+
+    def flush(self):
+        if self.read_only:
+            return
+        header = _HEADER.pack(_MAGIC, 1, self.num_bits, self.num_hashes, self.count)
+        self._mm[:_HEADER.size] = header
+        self._mm.flush()
+
+    def close(self):
+        if self._mm.closed:
+            return
+        self.flush()
+        self._mm.close()
+        self._file.close()
@@ -0,0 +1,184 @@
+# minima/core/signatures.py
+import re
+from collections import defaultdict
+from pathlib import Path
+
+import yaml
+
+from minima.core.errors import ConfigError
+
+_META_TAG = re.compile(r"<meta\b[^>]*>", re.I)
+_SCRIPT_SRC = re.compile(r"<script\b[^>]*?\bsrc\s*=\s*[\"']?([^\"'\s>]+)", re.I)
+_ATTR = re.compile(r"([\w:-]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+))")
+
+
+def _trie_pattern(words) -> str:
+    """Alternation de littéraux factorisée en trie : (?:wp-(?:content|includes)/|…).
+
+    Le moteur de regex ne compare alors qu’un caractère par branche et par
+    nœud : le coût par position ne croît plus avec le nombre de signatures.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Fin de mot possible ici : la suite est optionnelle (gourmande = plus long match)
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class _Matcher:
+    """Littéraux : une regex-trie sensible à la casse, appliquée au texte en minuscules
+    (re.I désactive l’optimisation de préfixe de sre : ~8x plus lent). Regex : une
+    alternative combinée, insensible à la casse, un groupe nommé par motif.
+
+    Tous les motifs présents sont rapportés, même imbriqués ou chevauchants :
+    la recherche reprend au caractère qui suit le début de chaque match. Un
+    match littéral vaut aussi pour les littéraux qui en sont des préfixes ; à
+    chaque début de match regex, les motifs regex pas encore trouvés sont
+    essayés un par un à cette position.
+    """
+
+    def __init__(self, literals: dict, regexes: list):
+        self.literals = literals            # littéral en minuscules -> {technos}
+        self._by_match = {}                 # texte matché -> technos de ses préfixes littéraux
+        self.groups = {}                    # nom de groupe -> techno
+        self.patterns = []                  # (techno, regex compilée) par motif
+        self.literal_regex = re.compile(_trie_pattern(literals)) if literals else None
+        parts = []
+        for i, (tech, pattern) in enumerate(regexes):
+            self.groups[f"r{i}"] = tech
+            self.patterns.append((tech, re.compile(pattern, re.I)))
+            parts.append(f"(?P<r{i}>{pattern})")
+        self.regex = re.compile("|".join(parts), re.I) if parts else None
+
+    def __bool__(self):
+        return self.literal_regex is not None or self.regex is not None
+
+    def _techs(self, matched: str) -> set:
+        # Le trie rend le plus long littéral à une position ; les plus courts en sont des préfixes
+        techs = self._by_match.get(matched)
+        if techs is None:
+            techs = set()
+            for end in range(1, len(matched) + 1):
+                techs |= self.literals.get(matched[:end], set())
+            self._by_match[matched] = techs
+        return techs
+
+    def scan(self, text: str, found: set, lower: str | None = None):
+        if not text:
+            return
+        if self.literal_regex is not None:
+            search = self.literal_regex.search
+            haystack = text.lower() if lower is None else lower
+            pos = 0
+            while (match := search(haystack, pos)) is not None:
+                found.update(self._techs(match.group()))
+                pos = match.start() + 1
+        if self.regex is not None:
+            # L’alternative ne rend qu’un groupe par match : les autres motifs sont
+            # essayés à la même position, jusqu’à ce que toutes les technos soient vues
+            search = self.regex.search
+            pending = [(tech, regex) for tech, regex in self.patterns if tech not in found]
+            pos = 0
+            while pending and (match := search(text, pos)) is not None:
+                start = match.start()
+                found.add(self.groups[match.lastgroup])
+                remaining = []
+                for tech, regex in pending:
+                    if tech in found:
+                        continue
+                    if regex.match(text, start):
+                        found.add(tech)
+                    else:
+                        remaining.append((tech, regex))
+                pending = remaining
+                pos = start + 1
+
+
+def _add_patterns(patterns, tech, literals, regexes, where):
+    for pattern in patterns or []:
+        if not isinstance(pattern, str) or not pattern:
+            raise ConfigError(f"Signature invalide pour {tech} ({where}): {pattern!r}")
+        if pattern.startswith("re:"):
+            try:
+                re.compile(pattern[3:])
+            except re.error as e:
+                raise ConfigError(f"Regex invalide pour {tech} ({where}): {e}")
+            regexes.append((tech, pattern[3:]))
+        else:
+            literals[pattern.lower()].add(tech)
+
+
+class SignatureEngine:
+    """Détection de technologies pilotée par une base de signatures.
+
+    Chaque technologie déclare des motifs `html` (source brute), `script`
+    (attributs src), `meta` (nom -> motif du content) et `headers`
+    (en-tête -> motif). Un motif est un littéral, ou une regex s’il commence
+    par « re: ». Tout est compilé au chargement : une passe par zone, quel
+    que soit le nombre de signatures, sans construire d’arbre.
+    """
+
+    def __init__(self, signatures: dict):
+        self.categories = {}
+        html_lit, html_re = defaultdict(set), []
+        script_lit, script_re = defaultdict(set), []
+        meta = defaultdict(lambda: (defaultdict(set), []))
+        headers = defaultdict(lambda: (defaultdict(set), []))
+        for tech, sig in (signatures or {}).items():
+            sig = sig or {}
+            self.categories[tech] = sig.get("category", "other")
+            _add_patterns(sig.get("html"), tech, html_lit, html_re, "html")
+            _add_patterns(sig.get("script"), tech, script_lit, script_re, "script")
+            for name, patterns in (sig.get("meta") or {}).items():
+                patterns = [patterns] if isinstance(patterns, str) else patterns
+                _add_patterns(patterns, tech, *meta[name.lower()], f"meta {name}")
+            for name, patterns in (sig.get("headers") or {}).items():
+                patterns = [patterns] if isinstance(patterns, str) else patterns
+                _add_patterns(patterns, tech, *headers[name.lower()], f"header {name}")
+        self._html = _Matcher(html_lit, html_re)
+        self._script = _Matcher(script_lit, script_re)
+        self._meta = {name: _Matcher(*pair) for name, pair in meta.items()}
+        self._headers = {name: _Matcher(*pair) for name, pair in headers.items()}
+
+    @classmethod
+    def load(cls, path) -> "SignatureEngine":
+        try:
+            with open(Path(path), "r", encoding="utf-8") as f:
+                return cls(yaml.safe_load(f) or {})
+        except (OSError, yaml.YAMLError) as e:
+            raise ConfigError(f"Base de signatures illisible ({path}): {e}")
+
+    def __len__(self):
+        return len(self.categories)
+
+    def detect(self, html: str, headers: dict | None = None, lower: str | None = None) -> set[str]:
+        """Technologies reconnues.
+
+        `lower` évite de recalculer html.lower() (ParsedDocument.lower).
+        """
+        found = set()
+        self._html.scan(html, found, lower)
+        if self._script:
+            self._script.scan("\n".join(_SCRIPT_SRC.findall(html)), found)
+        if self._meta:
+            for tag in _META_TAG.findall(html):
+                attrs = {k.lower(): a or b or c for k, a, b, c in _ATTR.findall(tag)}
+                matcher = self._meta.get(attrs.get("name", attrs.get("property", "")).lower())
+                if matcher:
+                    matcher.scan(attrs.get("content", ""), found)
+        for name, value in (headers or {}).items():
+            matcher = self._headers.get(name.lower())
+            if matcher:
+                matcher.scan(value, found)
+        return found
@@ -0,0 +1,176 @@
+# minima/core/sqlite_queue.py
+import json
+import os
+import sqlite3
+import time
+from minima.core.logger import logger
+from minima.core.queue import _key
+
+PENDING, ACTIVE, DONE = 0, 1, 2
+
+
+class SQLiteQueue:
+    """File persistante adossée à SQLite, même API que PersistentQueue.
+
+    Les items vivent dans une table indexée par URL (état, profondeur, score) :
+    rien n’est chargé en mémoire au démarrage et les écritures sont regroupées
+    en transactions de `batch_size` opérations.
+    """
+
+    def __init__(self, path, batch_size=100, read_only=False):
+        self.path = str(path)
+        self.batch_size = max(1, batch_size)
+        self._ops = 0
+        if read_only:
+            self._open_read_only()
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS frontier (
+                url TEXT PRIMARY KEY,
+                state INTEGER NOT NULL,
+                depth INTEGER DEFAULT 0,
+                score REAL DEFAULT 0,
+                item TEXT NOT NULL,
+                not_before REAL DEFAULT 0
+            )
+        """)
+        # Bases créées avant les nouveaux essais différés : ajout de la colonne
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(frontier)")}
+        if "not_before" not in columns:
+            self.conn.execute("ALTER TABLE frontier ADD COLUMN not_before REAL DEFAULT 0")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_frontier_state_score "
+                          "ON frontier(state, score DESC)")
+        # Les items sortis par get() mais jamais traités (arrêt brutal) repartent en attente
+        recovered = self.conn.execute("UPDATE frontier SET state = ? WHERE state = ?",
+                                      (PENDING, ACTIVE)).rowcount
+        self.conn.commit()
+        counts = self.counts()
+        logger.info(f"Queue SQLite ouverte: {self.path} ({counts['pending']} en attente, "
+                    f"{counts['processed']} traitées, {recovered} récupérées)")
+
+    def _open_read_only(self):
+        """Ouvre la base existante en lecture seule."""
+        if os.path.exists(self.path):
+            self.conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            return
+        # Base absente : file vide en mémoire, rien n’est créé sur disque
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("CREATE TABLE frontier (url TEXT PRIMARY KEY, state INTEGER NOT NULL, "
+                          "depth INTEGER DEFAULT 0, score REAL DEFAULT 0, item TEXT NOT NULL, "
+                          "not_before REAL DEFAULT 0)")
+
+    def _maybe_commit(self):
+        self._ops += 1
+        if self._ops >= self.batch_size:
+            self.conn.commit()
+            self._ops = 0
+
+    def add(self, item, score=0):
+        """Ajoute un item dict à la queue si son URL n’est pas déjà connue."""
+        depth = item.get("depth", 0) if isinstance(item, dict) else 0
+        cur = self.conn.execute(
+            "INSERT OR IGNORE INTO frontier (url, state, depth, score, item) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (_key(item), PENDING, depth, score, json.dumps(item, ensure_ascii=False)),
+        )
+        if cur.rowcount:
+            logger.info(f"Added to queue: {item}")
+            self._maybe_commit()
+
+    def get(self):
+        """Récupère l’item prêt avec le score le plus élevé (None si aucun n’est dû)."""
+        row = self.conn.execute(
+            "SELECT url, item FROM frontier WHERE state = ? AND not_before <= ? "
+            "ORDER BY score DESC, rowid LIMIT 1",
+            (PENDING, time.time()),
+        ).fetchone()
+        if row is None:
+            return None
+        self.conn.execute("UPDATE frontier SET state = ? WHERE url = ?", (ACTIVE, row[0]))
+        self._maybe_commit()
+        return json.loads(row[1])
+
+    def mark_processed(self, item):
+        """Marque un item comme traité (l’insère s’il était inconnu)."""
+        depth = item.get("depth", 0) if isinstance(item, dict) else 0
+        cur = self.conn.execute(
+            "INSERT INTO frontier (url, state, depth, score, item) VALUES (?, ?, ?, 0, ?) "
+            "ON CONFLICT(url) DO UPDATE SET state = excluded.state WHERE state != excluded.state",
+            (_key(item), DONE, depth, json.dumps(item, ensure_ascii=False)),
+        )
+        if cur.rowcount:
+            logger.info(f"Marqué comme traité: {item}")
+        self._maybe_commit()
+
+    def reschedule(self, item, delay: float):
+        """Remet un item en attente pour un nouvel essai dans `delay` secondes."""
+        not_before = round(time.time() + delay, 3)
+        item = dict(item, attempts=item.get("attempts", 0) + 1, not_before=not_before)
+        cur = self.conn.execute(
+            "UPDATE frontier SET state = ?, not_before = ?, item = ? WHERE url = ? AND state != ?",
+            (PENDING, not_before, json.dumps(item, ensure_ascii=False), _key(item), DONE),
+        )
+        if cur.rowcount:
+            logger.info(f"Nouvel essai dans {delay:.1f}s: {item['url']}")
+            self._maybe_commit()
+        return item
+
+    def next_ready_in(self) -> float | None:
+        """Secondes avant qu’un item soit dû (0 s’il y en a un), None si la queue est vide."""
+        row = self.conn.execute("SELECT MIN(not_before) FROM frontier WHERE state = ?",
+                                (PENDING,)).fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - time.time())
+
+    def update_score(self, url, score):
+        """Modifie la priorité d’une URL en attente."""
+        self.conn.execute("UPDATE frontier SET score = ? WHERE url = ? AND state = ?",
+                          (score, url, PENDING))
+        self._maybe_commit()
+
+    def is_known(self, url) -> bool:
+        row = self.conn.execute("SELECT 1 FROM frontier WHERE url = ?", (url,)).fetchone()
+        return row is not None
+
+    def is_processed(self, url) -> bool:
+        return self.conn.execute("SELECT 1 FROM frontier WHERE url = ? AND state = ?",
+                                 (url, DONE)).fetchone() is not None
+
+    def __contains__(self, url):
+        return self.is_known(url)
+
+    def counts(self) -> dict:
+        rows = dict(self.conn.execute("SELECT state, COUNT(*) FROM frontier GROUP BY state"))
+        return {"pending": rows.get(PENDING, 0), "processed": rows.get(DONE, 0)}
+
+    def force_flush(self):
+        self.conn.commit()
+        self._ops = 0
+        logger.info("Queue flush forcé")
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def is_empty(self):
+        return self.conn.execute("SELECT 1 FROM frontier WHERE state = ? LIMIT 1",
+                                 (PENDING,)).fetchone() is None
+
+    def clear(self):
+        self.conn.execute("DELETE FROM frontier")
+        self.conn.commit()
+        logger.info("Queue réinitialisée")
+
+    def remaining_urls(self, limit: int | None = None) -> list[dict]:
+        """Items prêts, du score le plus élevé au plus faible (lecture indexée)."""
+        rows = self.conn.execute(
+            "SELECT item FROM frontier WHERE state = ? AND not_before <= ? "
+            "ORDER BY score DESC, rowid LIMIT ?",
+            (PENDING, time.time(), -1 if limit is None else limit),
+        )
+        return [json.loads(r[0]) for r in rows]
@@ -1,17 +1,11 @@
 import os
-import time
 import yaml
 import signal
+import time
 from urllib.parse import urljoin, urlparse
 
 from minima.core.logger import logger
-from minima.core.queue import PersistentQueue
-from minima.core.scraper import Scraper
-from minima.core.generic_analyzer import GenericAnalyzer
-from minima.core.exporter import Exporter
-from minima.core.config_loader import ensure_paths
 from minima.core.errors import MinimaError
-from minima.plugins.plugin_validator import validate_all
 
 # --- Configuration des Chemins ---
 CONFIG_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../config/config.yaml"))
@@ -58,10 +52,29 @@ def load_config(config_path=None):
         return {}
 
 def main(config_path: str = None):
+    # Imports lourds (requests, bs4, lxml…) différés ici : `queue-status` et
+    # `plugins-list` importent ce module pour load_config/QUEUE_PATH seulement
+    from minima.core.queue import open_queue
+    from minima.core.scraper import create_scraper
+    from minima.core.politeness import HostScheduler
+    from minima.core.concurrency import AdaptiveConcurrency, backoff_delay
+    from minima.core.generic_analyzer import GenericAnalyzer
+    from minima.core.language import LanguageDetector
+    from minima.core.page_processor import PageProcessor
+    from minima.core.plugin_runner import pipeline_options
+    from minima.core.result_cache import ResultCache
+    from minima.core.analysis_pool import AnalysisPool
+    from minima.core.pipeline import StreamingPipeline
+    from minima.core.exporter import Exporter
+    from minima.core.config_loader import ensure_paths, set_config
+    from minima.plugins.plugin_validator import validate_all, VALIDATION_CACHE_PATH
+
     logger.info("=== MINIMA V1.0 : LANCEMENT OFFICIEL ===")
     try:
         ensure_paths()
         cfg = load_config(config_path)
+        # Les composants qui lisent config_loader.get() voient la même configuration
+        set_config(cfg)
 
         # Paramètres
         mode = cfg.get("mode", "scrap")
@@ -69,13 +82,65 @@ def main(config_path: str = None):
         delay = cfg.get("delay", 0)
         accepted_languages = cfg.get("accepted_languages", ["en", "fr"])
         export_flush_every = int(cfg.get("export_flush_every", 10))
+        batch_size = cfg.get("queue_batch_size")
 
         # Initialisation
-        valid_plugins = validate_all(PLUGIN_DIR)
-        queue = PersistentQueue(QUEUE_PATH)
-        analyzer = GenericAnalyzer(logger=logger)
-        exporter = Exporter(flush_every=export_flush_every)
-        scraper = Scraper()
+        # Plugins validés (empreintes en cache par mtime/taille), importés au premier usage
+        use_validation_cache = cfg.get("plugin_validation_cache", True)
+        validation_cache = VALIDATION_CACHE_PATH if use_validation_cache else None
+        valid_plugins = validate_all(PLUGIN_DIR, cache_path=validation_cache)
+        queue = open_queue(cfg, QUEUE_PATH)
+        language_options = {
+            "sample_chars": int(cfg.get("language_sample_chars", 2000)),
+            "memo_after": int(cfg.get("language_memo_after", 5)),
+        }
+        analyzer = GenericAnalyzer(logger=logger,
+                                   language_detector=LanguageDetector(**language_options))
+        exporter = Exporter(flush_every=export_flush_every, fields=cfg.get("export_fields") or None)
+        # Ordre, dépendances et élagage des plugins : config/plugins.yaml + export_fields
+        plugin_options = pipeline_options(cfg)
+        # La politesse est gérée par hôte : `delay` est l'intervalle minimal entre
+        # deux requêtes vers un même hôte, et non plus une pause globale
+        # Concurrence adaptative (AIMD) : les limites suivent les 429/403 et la latence
+        controller = None
+        if cfg.get("adaptive_concurrency", False):
+            controller = AdaptiveConcurrency(
+                initial=int(cfg.get("adaptive_initial_limit", 4)),
+                max_global=int(cfg.get("max_workers", 5)),
+                max_per_host=int(cfg.get("max_per_host", 2)),
+            )
+        scheduler = HostScheduler(
+            min_interval=delay,
+            max_per_host=int(cfg.get("max_per_host", 2)),
+            host_limits=cfg.get("host_limits"),
+            controller=controller,
+        )
+        scraper = create_scraper(cfg, scheduler=scheduler, controller=controller)
+        # Cache des résultats d’analyse et de plugins, indexé par contenu
+        cache_options = None
+        if cfg.get("result_cache", False):
+            cache_options = {
+                "path": cfg.get("result_cache_path", "data/result_cache.db"),
+                "max_bytes": int(float(cfg.get("result_cache_max_mb", 256)) * 1024 * 1024),
+            }
+        # Analyse dans un pool de processus (hors GIL) ou dans le processus courant
+        analysis_processes = int(cfg.get("analysis_processes", 0))
+        if analysis_processes > 0:
+            processor = AnalysisPool(
+                analysis_processes, valid_plugins, accepted_languages,
+                extractor=cfg.get("extractor", "soup"),
+                language_options=language_options,
+                chunk_size=int(cfg.get("analysis_chunk_size", 8)),
+                compress_level=int(cfg.get("analysis_compress_level", 0)),
+                plugin_options=plugin_options,
+                cache_options=cache_options,
+            )
+        else:
+            result_cache = ResultCache(**cache_options) if cache_options else None
+            processor = PageProcessor(analyzer, valid_plugins, accepted_languages,
+                                      extractor=cfg.get("extractor", "soup"),
+                                      plugin_options=plugin_options,
+                                      result_cache=result_cache)
 
         # URLs de départ avec normalisation
         for url in cfg.get("urls", []):
@@ -92,6 +157,7 @@ def main(config_path: str = None):
             
             try:
                 exporter.flush()
+                queue.close()
                 print("✅ Données exportées avec succès.")
             except Exception as e:
                 print(f"❌ Erreur lors du flush final : {e}")
@@ -102,56 +168,76 @@ def main(config_path: str = None):
 
         signal.signal(signal.SIGINT, handle_sigint)
         
+        retries = int(cfg.get("retries", 3))
+        retry_base_delay = float(cfg.get("retry_base_delay", 2))
+        retry_max_delay = float(cfg.get("retry_max_delay", 300))
+
+        def reschedule_failed(item):
+            """Échec réessayable : l'URL repart dans la frontière avec un backoff."""
+            retry_after = scraper.pop_retry(item["url"]) if hasattr(scraper, "pop_retry") else None
+            attempts = item.get("attempts", 0)
+            if retry_after is None or attempts + 1 >= retries:
+                return False
+            delay = backoff_delay(attempts, retry_base_delay, retry_max_delay, retry_after)
+            queue.reschedule(item, delay)
+            return True
+
+        def on_page_done(item, result):
+            """Fin de traitement d'une page : export et découverte de liens."""
+            if result is None and reschedule_failed(item):
+                return
+            queue.mark_processed(item)
+            if result is None:
+                return
+            exporter.add_results([result])
+
+            # Découverte de liens & Déduplication
+            url, depth = item["url"], item["depth"]
+            if "crawl" in mode and depth < max_depth:
+                for link in result.get("links", []):
+                    full_url = normalize_url(urljoin(url, link))
+                    # La queue gère déjà le 'if full_url not in processed' en interne
+                    queue.add({"url": full_url, "depth": depth + 1, "score": 0})
+
         # Boucle de traitement
-        while not queue.is_empty():
-            items_to_fetch = queue.remaining_urls()
-            if not items_to_fetch: break
+        if cfg.get("streaming", False):
+            # Pipeline en flux : fetch, analyse et export se recouvrent
+            StreamingPipeline(
+                scraper, processor, on_page_done, scheduler=scheduler,
+                fetch_workers=int(cfg.get("max_workers", 5)),
+                analysis_workers=analysis_processes or int(cfg.get("analysis_threads", 1)),
+                buffer_size=int(cfg.get("pipeline_buffer_size", 100)),
+                analysis_batch=int(cfg.get("analysis_chunk_size", 8)) if analysis_processes
+                else int(cfg.get("plugin_batch_size", 32)),
+            ).run(queue)
 
-            # Récupération groupée
+        while not queue.is_empty():
+            items_to_fetch = queue.remaining_urls(limit=batch_size)
+            if not items_to_fetch:
+                # Il ne reste que des URLs en attente d'un nouvel essai
+                wait = queue.next_ready_in()
+                if wait is None:
+                    break
+                time.sleep(wait)
+                continue
+
+            # Récupération groupée (mode par lots)
             html_map = scraper.fetch_all([item["url"] for item in items_to_fetch])
 
-            for item in items_to_fetch:
-                url, depth = item["url"], item["depth"]
-                html = html_map.get(url)
-
-                if not html:
-                    queue.mark_processed(item)
-                    continue
-
-                # Filtrage langue
-                lang = analyzer.detect_language(html)
-                if lang not in accepted_languages:
-                    logger.info(f"Ignoré (Langue {lang}) : {url}")
-                    queue.mark_processed(item)
-                    continue
-
-                # Analyse technique + Plugins
-                result = analyzer.analyze(html, url)
-                result['score'] = item.get('score', 0)
-
-                for plugin in valid_plugins:
-                    try:
-                        if hasattr(plugin, "process"):
-                            p_res = plugin.process(url, html)
-                            if p_res: result.update(p_res)
-                    except Exception as e:
-                        logger.warning(f"Erreur plugin {getattr(plugin, '__name__', 'plg')} : {e}")
-
-                # Fin de traitement & Export
-                queue.mark_processed(item)
-                exporter.add_results([result])
-                logger.info(f"OK ({lang}) : {url}")
-
-                # Découverte de liens & Déduplication
-                if "crawl" in mode and depth < max_depth:
-                    for link in result.get("links", []):
-                        full_url = normalize_url(urljoin(url, link))
-                        # La queue gère déjà le 'if full_url not in processed' en interne
-                        queue.add({"url": full_url, "depth": depth + 1, "score": 0})
-
-                if delay > 0: time.sleep(delay)
+            fetched = [(item, html_map.get(item["url"])) for item in items_to_fetch]
+            results = iter(processor.process_batch([job for job in fetched if job[1]]))
+            for item, html in fetched:
+                on_page_done(item, next(results) if html else None)
 
         exporter.flush()
+        queue.close()
+        if hasattr(processor, "close"):
+            processor.close()
+        if hasattr(processor, "log_stats"):
+            processor.log_stats()
+        if hasattr(scraper, "log_stats"):
+            scraper.log_stats()
+        analyzer.language.log_summary()
         logger.info("=== TRAVAIL TERMINÉ ===")
 
     except Exception as e:
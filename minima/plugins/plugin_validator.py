@@ -1,11 +1,16 @@
 import os
+import json
 import hashlib
+import threading
 from pathlib import Path
 from minima.core.logger import logger
 import importlib.util
 
 PLUGIN_DIR = Path(__file__).parent
 HASH_FILE = PLUGIN_DIR / "trusted_hashes.txt"
+# Empreintes déjà calculées, par fichier (mtime + taille) : évite de relire
+# les plugins à chaque démarrage
+VALIDATION_CACHE_PATH = Path(__file__).resolve().parents[2] / "data" / "plugin_validation.json"
 
 
 def sha256sum(path: Path) -> str:
@@ -64,7 +69,81 @@ def validate_plugins() -> list[Path]:
     return valid_plugins
 
 
-def validate_all(plugin_dir):
+def load_plugin(file, expected_sha: str | None = None):
+    """Importe un plugin par son chemin ; refuse s'il ne correspond plus à `expected_sha`."""
+    file = Path(file)
+    if expected_sha is not None and sha256sum(file) != expected_sha:
+        raise ImportError(f"Plugin modifié depuis sa validation: {file.name}")
+    spec = importlib.util.spec_from_file_location(file.stem, file)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    setattr(mod, "__name__", file.stem)
+    setattr(mod, "__sha256__", expected_sha or sha256sum(file))
+    return mod
+
+
+class LazyPlugin:
+    """Plugin validé dont l’import est différé au premier attribut demandé.
+
+    `__name__`, `__file__` et `__sha256__` sont connus sans importer le module :
+    lister les plugins ou les transmettre au pool d’analyse ne coûte rien.
+    L’import passe par load_plugin, qui revérifie l’empreinte sur le fichier.
+    """
+
+    def __init__(self, file, sha: str):
+        self.__file__ = str(file)
+        self.__name__ = Path(file).stem
+        self.__sha256__ = sha
+        self._module = None
+        self._load_lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def _load(self):
+        with self._load_lock:
+            if self._module is None:
+                self._module = load_plugin(self.__file__, self.__sha256__)
+        return self._module
+
+    def __getattr__(self, name):
+        # Appelé seulement pour les attributs absents du proxy
+        if name.startswith("__") or name in {"_module", "_load_lock"}:
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+
+    def __repr__(self):
+        return f"<LazyPlugin {self.__name__}{'' if self.loaded else ' (non importé)'}>"
+
+
+def _read_validation_cache(path) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_validation_cache(path, entries: dict):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=1, sort_keys=True)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Cache de validation des plugins non écrit: {e}")
+
+
+def validate_all(plugin_dir, cache_path=VALIDATION_CACHE_PATH, lazy: bool = True):
+    """Plugins dont l’empreinte SHA256 figure dans trusted_hashes.txt.
+
+    Avec `cache_path`, l’empreinte d’un fichier dont mtime et taille n’ont pas
+    changé est reprise du cache au lieu d’être recalculée (None : toujours
+    recalculer). Avec `lazy`, les plugins sont renvoyés sous forme de
+    LazyPlugin, importés seulement quand ils servent.
+    """
     valid_plugins = []
     if not os.path.exists(plugin_dir):
         logger.warning(f"Dossier plugins introuvable: {plugin_dir}")
@@ -73,6 +152,8 @@ def validate_all(plugin_dir):
     with open(os.path.join(plugin_dir, "trusted_hashes.txt"), "r", encoding="utf-8") as f:
         trusted = [line.strip().split()[0] for line in f if line.strip()]
 
+    cache = _read_validation_cache(cache_path) if cache_path else {}
+    seen = {}
     approved_count = 0
     total = 0
 
@@ -81,18 +162,23 @@ def validate_all(plugin_dir):
             continue  # on ignore ces fichiers internes
 
         total += 1
-        sha = hashlib.sha256(open(file, "rb").read()).hexdigest()
+        st = file.stat()
+        key = str(file.resolve())
+        entry = cache.get(key)
+        if entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            sha = entry["sha256"]
+        else:
+            sha = sha256sum(file)
+        seen[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": sha}
         if sha not in trusted:
             logger.warning(f"Plugin rejeté (signature inconnue): {file.name}")
             continue
         logger.info(f"Plugin approuvé: {file.name}")
         approved_count += 1
-        spec = importlib.util.spec_from_file_location(file.stem, file)
-        mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)
-        setattr(mod, "__name__", file.stem)
-        valid_plugins.append(mod)
+        valid_plugins.append(LazyPlugin(file, sha) if lazy else load_plugin(file, sha))
 
+    if cache_path and seen != {k: cache[k] for k in seen if k in cache}:
+        _write_validation_cache(cache_path, {**cache, **seen})
 
     logger.info(f"Validation plugins: {approved_count}/{total} approuvés")
     return valid_plugins
@@ -1,42 +1,33 @@
-import re
-from bs4 import BeautifulSoup
-from minima.core.logger import logger
+from pathlib import Path
+from minima.core.document import ParsedDocument
+from minima.core.signatures import SignatureEngine
+
+# Base de signatures (CMS, analytics, frameworks…), compilée une fois à l’import
+SIGNATURES_PATH = Path(__file__).resolve().parents[2] / "config" / "tech_signatures.yaml"
+ENGINE = SignatureEngine.load(SIGNATURES_PATH)
+# La sortie dépend aussi de ce fichier : le modifier invalide le cache de résultats
+CACHE_FILES = (SIGNATURES_PATH,)
+
+# Champs produits (pipeline de plugins, config/plugins.yaml)
+PROVIDES = ("technologies", "is_wordpress", "tech_stack")
+
 
 def process(url, html):
     """Détecte les technologies CMS et Analytics sans bloquer le crawl."""
     if not html:
         return {"tech_stack": "unknown"}
+    return process_document(ParsedDocument(html, url))
+
+
+def process_document(doc):
+    """Même détection, sur le document déjà parsé par le PageProcessor.
 
-    soup = BeautifulSoup(html, "html.parser")
-    techs = []
-    
-    # --- 1. DÉTECTION CMS ---
-    # Recherche de WordPress
-    if soup.find("meta", attrs={"name": "generator", "content": re.compile(r"WordPress", re.I)}) \
-       or "/wp-content/" in html or "/wp-includes/" in html:
-        techs.append("WordPress")
-    
-    # Recherche de Shopify
-    if "shopify-pay" in html or "/cdn.shopify.com/" in html:
-        techs.append("Shopify")
-
-    # --- 2. DÉTECTION ANALYTICS / TRACKING ---
-    if "googletagmanager.com" in html or "google-analytics.com" in html:
-        techs.append("Google Analytics/GTM")
-    
-    if "facebook.net/en_US/fbevents.js" in html:
-        techs.append("Facebook Pixel")
-
-    # --- 3. DÉTECTION FRAMEWORKS CSS/JS ---
-    if "bootstrap" in html.lower():
-        techs.append("Bootstrap")
-    if "tailwind" in html.lower():
-        techs.append("Tailwind CSS")
-    if "react" in html.lower() or "__next" in html:
-        techs.append("React/Next.js")
+    Une passe de regex sur le source (et sa version en minuscules partagée) : aucun arbre.
+    """
+    techs = ENGINE.detect(doc.html, lower=doc.lower)
 
     # On retourne un dictionnaire propre
     return {
-        "technologies": list(set(techs)) if techs else ["Unknown"],
+        "technologies": sorted(techs) if techs else ["Unknown"],
         "is_wordpress": "WordPress" in techs
-    }
\ No newline at end of file
+    }
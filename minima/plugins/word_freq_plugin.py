@@ -1,7 +1,14 @@
+import atexit
 import collections
+import json
+import os
 import re
-from bs4 import BeautifulSoup
+import threading
+from pathlib import Path
+from minima.core import config_loader
+from minima.core.document import ParsedDocument
 from minima.core.logger import logger
+from minima.core.politeness import host_of
 
 # On définit les cibles ici, dans le plugin
 SMART_TARGETS = [
@@ -10,44 +17,186 @@ SMART_TARGETS = [
     {"name": "Article Universel", "tag": "article"},
     {"name": "Contenu Principal", "tag": "main"}
 ]
+TARGETS_BY_NAME = {target["name"]: target for target in SMART_TARGETS}
+
+# Bruit technique ignoré pour l'analyse
+NOISE_TAGS = frozenset(["script", "style", "noscript", "svg", "iframe", "nav", "footer"])
+
+# Champs produits (pipeline de plugins, config/plugins.yaml)
+PROVIDES = ("top_words",)
 
 STOPWORDS = {"le", "la", "les", "des", "du", "un", "une", "et", "en", "est", "pour", "dans", "par", "qui", "que", "sur", "aux"}
 
-def find_content_zone(soup):
-    """Trouve la zone de texte utile au milieu du HTML complet."""
+
+def _is_noise(tag):
+    """Vrai si le tag est (ou est contenu dans) une balise de bruit."""
+    while tag is not None:
+        if tag.name in NOISE_TAGS:
+            return True
+        tag = tag.parent
+    return False
+
+
+class ZoneCache:
+    """Cible SMART_TARGETS qui a marché pour chaque hôte (même gabarit = même zone).
+
+    LRU borné à `max_hosts` hôtes, sauvegardé en JSON toutes les `save_every`
+    modifications et à la sortie. Chaque processus d’analyse a sa copie : le
+    dernier qui écrit gagne, sans gravité pour un cache.
+    """
+
+    def __init__(self, path=None, max_hosts=1024, save_every=100):
+        self.path = Path(path) if path else None
+        self.max_hosts = max(1, int(max_hosts))
+        self.save_every = save_every
+        self._hosts = collections.OrderedDict()
+        self._dirty = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    for host, name in json.load(f).items():
+                        if name in TARGETS_BY_NAME:
+                            self._hosts[host] = name
+                while len(self._hosts) > self.max_hosts:
+                    self._hosts.popitem(last=False)
+            except (OSError, ValueError, AttributeError) as e:
+                logger.warning(f"Cache des zones illisible ({self.path}), ignoré: {e}")
+
+    def get(self, host):
+        with self._lock:
+            name = self._hosts.get(host)
+            if name:
+                self._hosts.move_to_end(host)
+            return name
+
+    def record(self, hit: bool):
+        """Compte un succès ou un échec de la cible en cache (threads du pipeline)."""
+        with self._lock:
+            self.stats["hits" if hit else "misses"] += 1
+
+    def put(self, host, name):
+        with self._lock:
+            if self._hosts.get(host) == name:
+                return
+            self._hosts[host] = name
+            self._hosts.move_to_end(host)
+            if len(self._hosts) > self.max_hosts:
+                self._hosts.popitem(last=False)
+            self._dirty += 1
+            due = self.save_every and self._dirty >= self.save_every
+        if due:
+            self.save()
+
+    def save(self):
+        """Écriture atomique (fichier temporaire puis remplacement)."""
+        with self._lock:
+            if not self.path or not self._dirty:
+                return
+            snapshot, self._dirty = dict(self._hosts), 0
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Sauvegarde du cache des zones impossible ({self.path}): {e}")
+
+
+_ZONE_CACHE = None
+_ZONE_CACHE_LOCK = threading.Lock()
+
+
+def zone_cache():
+    """Cache partagé du plugin, créé au premier usage (config chargée entre-temps)."""
+    global _ZONE_CACHE
+    with _ZONE_CACHE_LOCK:
+        if _ZONE_CACHE is None:
+            _ZONE_CACHE = ZoneCache(config_loader.get("zone_cache_file", ""),
+                                    config_loader.get("zone_cache_size", 1024))
+            atexit.register(_ZONE_CACHE.save)
+        return _ZONE_CACHE
+
+
+def _find_target(soup, target):
+    """Premier élément de la cible hors bruit (un <article> de menu ne masque pas le vrai).
+
+    Parcours paresseux : on s’arrête au premier candidat retenu au lieu de
+    collecter toutes les occurrences de l’arbre.
+    """
+    if "class" in target:
+        query = {"class_": target["class"]}
+    else:
+        query = {"name": target["tag"]}
+    tag = soup.find(**query)
+    while tag is not None and _is_noise(tag):
+        tag = tag.find_next(**query)
+    return tag
+
+
+def find_content_zone(soup, host=None, cache=None):
+    """Trouve la zone de texte utile au milieu du HTML complet.
+
+    Avec un hôte, la cible retenue pour ses pages précédentes est essayée en
+    premier : un seul parcours de l’arbre au lieu de jusqu’à quatre. Si elle
+    échoue, recherche complète dans l’ordre de SMART_TARGETS.
+    """
+    if host and cache is None:
+        cache = zone_cache()
+    cached = cache.get(host) if host else None
+    if cached:
+        result = _find_target(soup, TARGETS_BY_NAME[cached])
+        if result:
+            cache.record(hit=True)
+            return result
+    if host:
+        cache.record(hit=False)
     for target in SMART_TARGETS:
-        result = None
-        if "class" in target:
-            result = soup.find(class_=target["class"])
-        elif "tag" in target:
-            result = soup.find(target["tag"])
-        
+        if target["name"] == cached:
+            continue
+        result = _find_target(soup, target)
         if result:
+            if host:
+                cache.put(host, target["name"])
             return result
     return soup.body or soup # Fallback si rien n'est trouvé
 
+
+def _visible_text(tag):
+    """Texte du tag sans celui des balises de bruit (l'arbre partagé n'est pas modifié)."""
+    parts = []
+    for string in tag.strings:
+        parent = string.parent
+        while parent is not tag and parent.name not in NOISE_TAGS:
+            parent = parent.parent
+        if parent is tag:
+            parts.append(string)
+    return "".join(parts)
+
+
 def process(url, html):
     """Analyse chirurgicale de la fréquence des mots."""
     if not html:
         return {"top_words": {}}
+    return process_document(ParsedDocument(html, url))
 
-    soup = BeautifulSoup(html, "html.parser")
-
-    # 1. Nettoyage du bruit technique (uniquement pour l'analyse)
-    for noise in soup(["script", "style", "noscript", "svg", "iframe", "nav", "footer"]):
-        noise.decompose()
 
-    # 2. On cible la zone de contenu pour éviter les menus/sidebar
-    content_area = find_content_zone(soup)
+def process_document(doc):
+    """Fréquence des mots sur le document déjà parsé par le PageProcessor."""
+    # 1. On cible la zone de contenu pour éviter les menus/sidebar
+    content_area = find_content_zone(doc.soup, host_of(doc.url) if doc.url else None)
 
-    # 3. Extraction du texte (Titres, Paragraphes, Listes)
-    text_parts = [tag.get_text() for tag in content_area.find_all(['p', 'h1', 'h2', 'h3', 'li'])]
+    # 2. Extraction du texte (Titres, Paragraphes, Listes), hors bruit technique
+    text_parts = [_visible_text(tag) for tag in content_area.find_all(['p', 'h1', 'h2', 'h3', 'li'])
+                  if not _is_noise(tag)]
     full_text = " ".join(text_parts).lower()
 
-    # 4. Nettoyage des chiffres (évite janv1, fév2) et ponctuation
+    # 3. Nettoyage des chiffres (évite janv1, fév2) et ponctuation
     full_text = re.sub(r'\d+', ' ', full_text)
     
-    # 5. Extraction et filtrage
+    # 4. Extraction et filtrage
     words = re.findall(r'\b[a-z]{3,}\b', full_text)
     filtered_words = [w for w in words if w not in STOPWORDS]
     
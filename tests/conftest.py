@@ -1,13 +1,23 @@
+import os
 import pytest
 import tempfile
 import shutil
+import threading
+from http.server import ThreadingHTTPServer
 from minima.core.config_loader import load_config, ensure_paths
 
+
 @pytest.fixture(scope="session", autouse=True)
-def setup_env():
+def setup_env(tmp_path_factory):
+    # Session lancée dans un dossier temporaire : data/ (dont le cache HTTP),
+    # logs/ et exports/ ne sont pas créés dans le dépôt
+    previous = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("minima"))
     ensure_paths()
     load_config()
     yield
+    os.chdir(previous)
+
 
 @pytest.fixture
 def temp_dir():
@@ -15,3 +25,13 @@ def temp_dir():
     yield tmp
     shutil.rmtree(tmp)
 
+
+@pytest.fixture
+def server(request):
+    """Serveur HTTP local ; le handler est passé par paramétrage indirect :
+    @pytest.mark.parametrize("server", [MonHandler], indirect=True)."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), request.param)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
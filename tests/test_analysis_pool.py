@@ -0,0 +1,33 @@
+import pytest
+from minima.core.analysis_pool import AnalysisPool
+from minima.core.generic_analyzer import GenericAnalyzer
+from minima.core.page_processor import PageProcessor
+from minima.plugins import tech_detector_plugin, word_freq_plugin
+from minima.plugins.plugin_validator import load_plugin
+
+PAGES = [
+    ({"url": f"https://ex.com/{i}", "score": i},
+     f"<html lang='{'fr' if i % 3 else 'es'}'><head><title>Page {i}</title></head>"
+     f"<body><article><p>conseil ministres {i}</p><a href='/{i}'>l</a></article></body></html>")
+    for i in range(10)
+]
+
+
+@pytest.mark.parametrize("compress_level", [0, 6])
+def test_pool_matches_in_process_results(compress_level):
+    plugins = [tech_detector_plugin, word_freq_plugin]
+    expected = PageProcessor(GenericAnalyzer(), plugins, ["fr"]).process_batch(PAGES)
+    pool = AnalysisPool(2, plugins, ["fr"], chunk_size=3, compress_level=compress_level)
+    try:
+        assert pool.process_batch(PAGES) == expected
+        assert pool.process(*PAGES[1])["title"] == "Page 1"
+        # Mesures des plugins remontées des processus d’analyse
+        assert pool.plugin_stats.snapshot()["word_freq_plugin"]["pages"] == 7
+    finally:
+        pool.close()
+    assert expected[0] is None and expected[1]["top_words"]["conseil"] == 1
+
+
+def test_load_plugin_rejects_modified_file():
+    with pytest.raises(ImportError):
+        load_plugin(tech_detector_plugin.__file__, "0" * 64)
@@ -0,0 +1,44 @@
+from http.server import BaseHTTPRequestHandler
+import pytest
+
+# Moteur optionnel : module sauté si aiohttp n’est pas installé
+AsyncScraper = pytest.importorskip("minima.core.async_scraper").AsyncScraper
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith("/json"):
+            body, ctype, status = b"{}", "application/json", 200
+        elif self.path.startswith("/missing"):
+            body, ctype, status = b"", "text/html", 404
+        else:
+            body, ctype = f"<html>{self.path}</html>".encode(), "text/html; charset=utf-8"
+            status = 200
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.mark.parametrize("server", [Handler], indirect=True)
+def test_async_fetch_all_filters_like_fetch_html(server):
+    s = AsyncScraper(timeout=5, retries=1, concurrency=50)
+    urls = [f"{server}/page{i}" for i in range(20)] + [
+        f"{server}/json", f"{server}/missing", f"{server}/image.png"]
+    results = s.fetch_all(urls)
+
+    assert results[f"{server}/page3"] == "<html>/page3</html>"
+    assert results[f"{server}/json"] is None
+    assert results[f"{server}/missing"] is None
+    assert results[f"{server}/image.png"] is None
+    assert s.fetch(f"{server}/one") == "<html>/one</html>"
+
+
+def test_create_scraper_selects_engine():
+    from minima.core.scraper import create_scraper, Scraper
+    assert isinstance(create_scraper({}), Scraper)
+    assert isinstance(create_scraper({"scraper_engine": "async"}), AsyncScraper)
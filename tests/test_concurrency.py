@@ -0,0 +1,54 @@
+import time
+
+from minima.core.concurrency import AIMDLimit, AdaptiveConcurrency, backoff_delay, parse_retry_after
+from minima.core.politeness import HostScheduler
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after("100000", max_delay=60) == 60
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("n'importe quoi") is None
+    # Date HTTP passée : pas d'attente
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_aimd_increases_then_cuts():
+    limit = AIMDLimit(initial=2, max_limit=10)
+    for _ in range(20):
+        limit.on_success(0.1, now=time.monotonic())
+    assert int(limit.limit) > 2
+    before = limit.limit
+    limit.on_failure(now=time.monotonic() + 10)
+    assert limit.limit == max(1, before * 0.5)
+
+
+def test_throttle_blocks_host_with_retry_after():
+    ctrl = AdaptiveConcurrency(initial=4, max_per_host=4)
+    assert ctrl.acquire("a.com", timeout=0.1)
+    ctrl.release("a.com", 0.1, status=429, retry_after="1")
+    assert ctrl.host_limit("a.com") == 2
+    assert ctrl.blocked_until("a.com") > time.monotonic() + 0.5
+    # L'hôte freiné attend, un autre hôte passe
+    assert not ctrl.acquire("a.com", timeout=0.1)
+    assert ctrl.acquire("b.com", timeout=0.1)
+    # Le throttling d'un hôte ne réduit pas la limite globale
+    assert ctrl.snapshot()["global_limit"] == 4
+
+
+def test_scheduler_respects_controller_limits():
+    ctrl = AdaptiveConcurrency(initial=1, max_per_host=4)
+    sched = HostScheduler(max_per_host=4, controller=ctrl)
+    for i in range(3):
+        sched.add(f"https://a.com/{i}")
+    assert sched.acquire(timeout=0.1) is not None
+    # Limite AIMD à 1 : le deuxième appel attend la libération du slot
+    assert sched.acquire(timeout=0.1) is None
+
+
+def test_backoff_delay_grows_with_jitter_and_honours_retry_after():
+    for attempt in range(4):
+        delay = backoff_delay(attempt, base=2, cap=10)
+        full = min(10, 2 * 2 ** attempt)
+        assert full / 2 <= delay <= full
+    assert backoff_delay(0, base=2, retry_after=30) == 30
@@ -0,0 +1,51 @@
+import bs4
+from minima.core.document import ParsedDocument
+from minima.core.generic_analyzer import GenericAnalyzer
+from minima.core.page_processor import PageProcessor
+from minima.plugins import tech_detector_plugin, word_freq_plugin
+
+HTML = """<html lang="fr-FR"><head><title> Accueil </title><script>var react = 1;</script></head>
+<body><nav><p>menu menu menu</p></nav>
+<article><h1>Burkina actualité</h1><p>Le conseil des ministres conseil <script>x()</script></p>
+<a href="/a">a</a><img src="/i.png"></article><footer><p>copyright</p></footer></body></html>"""
+
+
+def test_views_are_lazy_and_cached():
+    doc = ParsedDocument(HTML, "https://ex.com/")
+    assert "soup" not in doc.__dict__
+    assert doc.title == "Accueil"
+    assert doc.soup is doc.soup
+    assert doc.lang == "fr"
+    assert doc.links == ["/a"] and doc.images == ["/i.png"]
+    assert "conseil" in doc.text and "react" not in doc.text and "x()" not in doc.text
+
+
+def test_page_is_parsed_once(monkeypatch):
+    parses = []
+    original = bs4.BeautifulSoup.__init__
+
+    def counting_init(self, *args, **kwargs):
+        parses.append(args[1] if len(args) > 1 else kwargs.get("features"))
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(bs4.BeautifulSoup, "__init__", counting_init)
+    processor = PageProcessor(GenericAnalyzer(), [tech_detector_plugin, word_freq_plugin], ["fr"])
+    result = processor.process({"url": "https://ex.com/", "score": 1}, HTML)
+
+    assert parses == ["lxml"]
+    assert result["title"] == "Accueil"
+    assert "React/Next.js" in result["technologies"]
+    # Le bruit (nav, footer, script) n'est pas compté et l'arbre partagé reste intact
+    assert "menu" not in result["top_words"] and "copyright" not in result["top_words"]
+    assert result["top_words"]["conseil"] == 2
+
+
+def test_legacy_plugin_signature_still_supported():
+    class Legacy:
+        @staticmethod
+        def process(url, html):
+            return {"legacy_len": len(html)}
+
+    processor = PageProcessor(GenericAnalyzer(), [Legacy], ["fr"])
+    assert processor.process({"url": "https://ex.com/"}, HTML)["legacy_len"] == len(HTML)
+    assert word_freq_plugin.process("https://ex.com/", HTML)["top_words"]["conseil"] == 2
@@ -0,0 +1,35 @@
+import codecs
+import pytest
+from minima.core.encoding import BoundedBody, BodyTooLarge, sniff_charset
+
+
+def test_header_charset_wins():
+    assert sniff_charset("text/html; charset=ISO-8859-1", b"<meta charset='utf-8'>") == "iso8859-1"
+
+
+def test_bom_then_meta():
+    assert sniff_charset("text/html", codecs.BOM_UTF8 + b"<html>") == "utf-8-sig"
+    head = b"<html><head><meta http-equiv='Content-Type' content='text/html; charset=windows-1252'>"
+    assert sniff_charset("text/html", head) == "cp1252"
+    assert sniff_charset(None, b"<html><meta charset=bogus>") == "utf-8"
+
+
+def test_truncate_policy():
+    body = BoundedBody(10, "truncate")
+    assert body.feed(b"12345678")
+    assert not body.feed(b"abcdef")
+    assert body.truncated and body.size == 10
+    assert body.text("text/html") == "12345678ab"
+
+
+def test_abort_policy():
+    body = BoundedBody(4, "abort")
+    with pytest.raises(BodyTooLarge):
+        body.feed(b"12345")
+
+
+def test_decoding_uses_meta_charset():
+    html = "<html><head><meta charset='latin-1'></head><body>café</body></html>".encode("latin-1")
+    body = BoundedBody(0)
+    body.feed(html)
+    assert "café" in body.text("text/html")
@@ -0,0 +1,23 @@
+from minima.core.document import ParsedDocument
+from minima.core.extractor import extract_links
+from minima.core.generic_analyzer import GenericAnalyzer
+
+HTML = """<!DOCTYPE html><html lang="fr-BF"><head><title> Accueil </title>
+<script>document.write('<a href="faux">')</script></head>
+<body><a href="/a">a</a><a name="ancre">x</a><A HREF="/b">b</A>
+<img src="/i.png"><img alt="sans src"></body></html>"""
+
+
+def test_extract_links_without_tree():
+    out = extract_links(HTML)
+    assert out == {"title": " Accueil ", "links": ["/a", "/b"], "images": ["/i.png"],
+                   "lang": "fr-BF"}
+    assert extract_links("") == {"title": None, "links": [], "images": [], "lang": None}
+
+
+def test_stream_document_matches_soup_analysis():
+    analyzer = GenericAnalyzer()
+    doc = ParsedDocument(HTML, "https://ex.com/", extractor="stream")
+    assert analyzer.analyze_document(doc) == analyzer.analyze(HTML, "https://ex.com/")
+    assert doc.lang == "fr"
+    assert "soup" not in doc.__dict__  # aucun arbre construit
@@ -0,0 +1,23 @@
+import random
+from minima.core.frontier import PriorityFrontier
+
+
+def test_pop_and_peek_match_sorted_order():
+    f = PriorityFrontier()
+    rng = random.Random(0)
+    scores = {f"u{i}": rng.randint(0, 20) for i in range(500)}
+    for key, score in scores.items():
+        f.push(key, score)
+    for key in list(scores)[:200]:
+        if rng.random() < 0.5:
+            f.remove(key)
+            del scores[key]
+        else:
+            scores[key] = rng.randint(0, 20)
+            f.push(key, scores[key])
+    expected = sorted(scores, key=lambda k: -scores[k])
+    assert [scores[k] for k in f.peek(50)] == [scores[k] for k in expected[:50]]
+    assert len(f) == len(scores)
+    popped = [f.pop() for _ in range(len(scores))]
+    assert [scores[k] for k in popped] == [scores[k] for k in expected]
+    assert f.pop() is None
@@ -0,0 +1,65 @@
+from http.server import BaseHTTPRequestHandler
+import pytest
+from minima.core.http_cache import HttpCache
+from minima.core.scraper import Scraper
+
+BODY = "<html lang='fr'><body>" + "é" * 500 + "</body></html>"
+
+
+class EtagHandler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        EtagHandler.requests_seen.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = BODY.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_store_and_validators(temp_dir):
+    cache = HttpCache(temp_dir)
+    headers = {"ETag": '"x"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    cache.store("https://a.com", headers, "<p>hé</p>")
+    meta = cache.lookup("https://a.com")
+    assert HttpCache.validators(meta) == {"If-None-Match": '"x"',
+                                          "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    assert cache.load("https://a.com") == "<p>hé</p>"
+    cache.store("https://b.com", {}, "sans validateur")
+    assert cache.lookup("https://b.com") is None
+
+
+@pytest.mark.parametrize("server", [EtagHandler], indirect=True)
+def test_scraper_revalidates_with_304(server, temp_dir):
+    s = Scraper()
+    s.cache = HttpCache(temp_dir)
+    url = f"{server}/page"
+    EtagHandler.requests_seen = []
+    assert s.fetch_html(url) == BODY
+    assert s.fetch_html(url) == BODY
+    assert EtagHandler.requests_seen == [None, '"v1"']
+    assert s.cache.stats["miss"] == 1
+    assert s.cache.stats["revalidated"] == 1
+    assert s.cache.stats["bytes_saved"] == len(BODY.encode("utf-8"))
+
+
+@pytest.mark.parametrize("server", [EtagHandler], indirect=True)
+def test_fresh_entry_served_without_request(server, temp_dir):
+    s = Scraper()
+    s.cache = HttpCache(temp_dir, max_age=60)
+    url = f"{server}/fresh"
+    EtagHandler.requests_seen = []
+    s.fetch_html(url)
+    assert s.fetch_html(url) == BODY
+    assert len(EtagHandler.requests_seen) == 1
+    assert s.cache.stats["hit"] == 1
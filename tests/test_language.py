@@ -0,0 +1,78 @@
+from http.server import BaseHTTPRequestHandler
+import pytest
+from minima.core.language import LanguageDetector, prefilter_rejects, sniff_language, visible_sample
+from minima.core.scraper import Scraper
+
+
+def test_sniff_language_sources():
+    assert sniff_language(b"<!doctype html><html class='x' lang=\"fr-FR\">") == "fr"
+    assert sniff_language(b"<html xml:lang='es'>") == "es"
+    assert sniff_language(b"<html><head><meta http-equiv='Content-Language' content='de'>") == "de"
+    assert sniff_language(b"<html>", "en-US") == "en"
+    assert sniff_language(b"<html>", "fr, en") is None
+    assert sniff_language(b"<html><body>") is None
+
+
+def test_sniff_language_requires_a_subtag_boundary():
+    assert sniff_language(b"<html lang=\"english\">") is None
+    assert sniff_language(b"<html lang='engl'>") is None
+    assert sniff_language(b"<html lang=en>") == "en"
+    assert sniff_language(b"<html lang=\"zh_TW\">") == "zh"
+    assert sniff_language(b"<meta name='language' content='french'>") is None
+
+
+def test_prefilter_rejects_only_declared_foreign_pages():
+    assert prefilter_rejects(b"<html lang='es'>", None, ["en", "fr"]) == "es"
+    assert prefilter_rejects(b"<html lang='fr'>", None, ["en", "fr"]) is None
+    assert prefilter_rejects(b"<html>", None, ["en", "fr"]) is None
+
+
+class BigPageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        lang = self.path.strip("/")
+        body = f"<html lang='{lang}'><body>".encode() + b"x" * 2_000_000
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.mark.parametrize("server", [BigPageHandler], indirect=True)
+def test_scraper_aborts_rejected_language_early(server):
+    s = Scraper()
+    s.cache = None
+    s.language_prefilter, s.accepted_languages = True, ["fr"]
+    assert s.fetch_html(f"{server}/es") is None
+    assert s.stats["prefilter_rejected"] == 1
+    assert s.stats["prefilter_bytes_read"] < 100_000
+    assert s.fetch_html(f"{server}/fr").startswith("<html lang='fr'>")
+
+
+FR_TEXT = ("Le conseil des ministres s'est réuni ce mercredi au palais présidentiel "
+           "sous la présidence du chef de l'État pour examiner plusieurs dossiers.")
+
+
+def test_visible_sample_strips_markup():
+    html = ("<html><head><style>p{}</style></head><body><script>var a;</script>"
+            "<p>Bonjour &amp; merci</p><!-- x --></body>")
+    assert visible_sample(html) == "Bonjour & merci"
+    assert len(visible_sample("<p>" + "mot " * 5000 + "</p>", limit=100)) == 100
+
+
+def test_detector_tiers_and_host_memo():
+    det = LanguageDetector(memo_after=2)
+    assert det.detect("<html lang='en'><body>x</body></html>", "https://a.com/1") == "en"
+    page = f"<html><body><p>{FR_TEXT}</p></body></html>"
+    assert det.detect(page, "https://b.com/1") == "fr"
+    assert det.detect(page, "https://b.com/2") == "fr"
+    # Hôte stable : plus de détection, même pour une page sans texte
+    assert det.detect("<html><body></body></html>", "https://b.com/3") == "fr"
+    assert det.detect("<html><body></body></html>", "https://c.com/") == "unknown"
+    assert det.stats == {"declared": 1, "memo": 1, "detected": 2, "unknown": 1}
@@ -0,0 +1,20 @@
+from minima.core.latency import LatencyTracker
+
+
+def test_percentiles_need_min_samples():
+    t = LatencyTracker(window=100, min_samples=10)
+    for i in range(9):
+        t.record("a.com", i / 10)
+    assert t.percentile("a.com", 95) is None
+    t.record("a.com", 5.0)
+    assert t.percentile("a.com", 50) == 0.4
+    assert t.percentile("a.com", 100) == 5.0
+
+
+def test_window_and_snapshot():
+    t = LatencyTracker(window=5, min_samples=1)
+    for v in [10, 10, 1, 1, 1, 1, 1]:
+        t.record("a.com", v)
+    assert t.percentile("a.com", 99) == 1  # les anciennes mesures sont sorties de la fenêtre
+    snap = t.snapshot()
+    assert snap["a.com"] == {"p50": 1, "p95": 1, "p99": 1, "n": 5}
@@ -14,3 +14,41 @@ def test_logger_output(caplog):
 
 def get_logger(name=None):
     return logging.getLogger("minima" if name is None else name)
+
+
+def test_deferred_setup_emits_first_record_once():
+    from minima.core.logger import _DeferredSetup
+
+    messages = []
+
+    class Counting(logging.Handler):
+        def emit(self, record):
+            messages.append(record.getMessage())
+
+    lazy = logging.getLogger("test_logger_deferred")
+    lazy.propagate = False
+    lazy.setLevel(logging.INFO)
+    lazy.addHandler(_DeferredSetup(lazy, lambda: lazy.addHandler(Counting())))
+    lazy.info("FIRST")
+    lazy.info("SECOND")
+    assert messages == ["FIRST", "SECOND"]
+    assert len(lazy.handlers) == 1
+
+
+def test_deferred_setup_triggered_by_a_child_logger():
+    from minima.core.logger import _DeferredSetup
+
+    messages = []
+
+    class Counting(logging.Handler):
+        def emit(self, record):
+            messages.append(record.getMessage())
+
+    parent = logging.getLogger("test_logger_parent")
+    parent.propagate = False
+    parent.setLevel(logging.INFO)
+    parent.addHandler(_DeferredSetup(parent, lambda: parent.addHandler(Counting())))
+    child = logging.getLogger("test_logger_parent.enfant")
+    child.info("FIRST")
+    child.info("SECOND")
+    assert messages == ["FIRST", "SECOND"]
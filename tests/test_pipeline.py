@@ -0,0 +1,134 @@
+import os
+import threading
+import time
+import pytest
+from minima.core.errors import ConfigError
+from minima.core.pipeline import StreamingPipeline
+from minima.core.politeness import HostScheduler
+from minima.core.queue import PersistentQueue
+from minima.core.scraper import create_scraper
+
+
+class FakeScraper:
+    def __init__(self, pages, slow=()):
+        self.pages, self.slow = pages, set(slow)
+
+    def fetch_html(self, url):
+        if url in self.slow:
+            time.sleep(0.3)
+        return self.pages.get(url)
+
+
+class EchoProcessor:
+    def __init__(self):
+        self.thread_names = set()
+
+    def process(self, item, html):
+        self.thread_names.add(threading.current_thread().name)
+        return {"url": item["url"], "links": html.split()}
+
+
+def test_pipeline_streams_and_feeds_back_links(temp_dir):
+    pages = {
+        "https://a.com/": "https://a.com/1 https://b.com/",
+        "https://a.com/1": "",
+        "https://b.com/": "https://a.com/ https://b.com/2",
+        "https://b.com/2": "x",
+    }
+    frontier = PersistentQueue(os.path.join(temp_dir, "queue.json"))
+    frontier.add({"url": "https://a.com/", "depth": 0})
+    order = []
+
+    def on_done(item, result):
+        frontier.mark_processed(item)
+        order.append(item["url"])
+        for link in (result or {}).get("links", []):
+            if link.startswith("http"):
+                frontier.add({"url": link, "depth": item["depth"] + 1})
+
+    processor = EchoProcessor()
+    done = StreamingPipeline(FakeScraper(pages), processor, on_done,
+                             scheduler=HostScheduler(max_per_host=2), fetch_workers=3).run(frontier)
+
+    assert done == 4
+    assert sorted(order) == sorted(pages)
+    assert frontier.is_empty()
+    assert threading.current_thread().name not in processor.thread_names
+
+
+def test_slow_host_does_not_block_others(temp_dir):
+    pages = {f"https://fast.com/{i}": "ok" for i in range(5)}
+    pages["https://slow.com/"] = "ok"
+    frontier = PersistentQueue(os.path.join(temp_dir, "queue.json"))
+    frontier.add({"url": "https://slow.com/", "depth": 0}, score=10)
+    for i in range(5):
+        frontier.add({"url": f"https://fast.com/{i}", "depth": 0})
+    order = []
+
+    def on_done(item, result):
+        frontier.mark_processed(item)
+        order.append(item["url"])
+
+    StreamingPipeline(FakeScraper(pages, slow={"https://slow.com/"}), EchoProcessor(), on_done,
+                      fetch_workers=2).run(frontier)
+    assert order[-1] == "https://slow.com/"
+
+
+def test_failed_fetch_is_retried_without_blocking(temp_dir):
+    class FlakyScraper(FakeScraper):
+        def __init__(self, pages):
+            super().__init__(pages)
+            self.calls = {}
+
+        def fetch_html(self, url):
+            self.calls[url] = self.calls.get(url, 0) + 1
+            return None if url == "https://flaky.com/" and self.calls[url] == 1 else "ok"
+
+    frontier = PersistentQueue(os.path.join(temp_dir, "queue.json"))
+    for url in ["https://flaky.com/", "https://a.com/1", "https://a.com/2"]:
+        frontier.add({"url": url, "depth": 0})
+    order = []
+
+    def on_done(item, result):
+        if result is None:
+            frontier.reschedule(item, delay=0.3)
+            return
+        frontier.mark_processed(item)
+        order.append(item["url"])
+
+    scraper = FlakyScraper({})
+    StreamingPipeline(scraper, EchoProcessor(), on_done, fetch_workers=2).run(frontier)
+    assert order[-1] == "https://flaky.com/"
+    assert scraper.calls["https://flaky.com/"] == 2
+    assert frontier.is_empty()
+
+
+def test_full_pipeline_blocks_instead_of_spinning(temp_dir):
+    class CountingQueue(PersistentQueue):
+        calls = 0
+
+        def next_ready_in(self):
+            CountingQueue.calls += 1
+            return super().next_ready_in()
+
+    pages = {f"https://h{i}.com/": "ok" for i in range(12)}
+    frontier = CountingQueue(os.path.join(temp_dir, "queue.json"))
+    for url in pages:
+        frontier.add({"url": url, "depth": 0})
+
+    def on_done(item, result):
+        frontier.mark_processed(item)
+
+    slow = FakeScraper(pages, slow=set(pages))  # 0,3 s par page, au plus 3 en vol
+    done = StreamingPipeline(slow, EchoProcessor(), on_done, fetch_workers=3,
+                             max_in_flight=3).run(frontier)
+    assert done == 12
+    # Au plus quelques appels par page terminée, et non des milliers d’itérations à vide
+    assert CountingQueue.calls < 50
+
+
+def test_streaming_rejects_the_async_engine():
+    # Une boucle asyncio et une session par URL : ni réutilisation des connexions,
+    # ni concurrence du moteur async
+    with pytest.raises(ConfigError, match="streaming"):
+        create_scraper({"scraper_engine": "async", "streaming": True})
@@ -0,0 +1,142 @@
+import types
+import weakref
+
+import pytest
+
+from minima.core import page_processor
+from minima.core.document import ParsedDocument
+from minima.core.generic_analyzer import GenericAnalyzer
+from minima.core.errors import ConfigError
+from minima.core.plugin_runner import PluginRunner, load_pipeline_spec, plugin_name
+from minima.plugins.plugin_validator import PLUGIN_DIR, validate_all
+
+DOC = ParsedDocument("<html><body><p>un deux trois</p></body></html>", "https://ex.com/")
+
+
+def make_plugin(name, provides=None, requires=None, fn=None, calls=None):
+    mod = types.ModuleType(name)
+    if provides is not None:
+        mod.PROVIDES = provides
+    if requires is not None:
+        mod.REQUIRES = requires
+
+    def process_document(doc, fields=None):
+        if calls is not None:
+            calls.append(name)
+        return fn(doc, fields)
+
+    mod.process_document = process_document
+    return mod
+
+
+def test_dependencies_order_levels_and_feed_fields():
+    words = make_plugin("words", ("words",), fn=lambda doc, f: {"words": doc.html.count(" ")})
+    stats = make_plugin("stats", ("ratio",), ("words", "title"),
+                        fn=lambda doc, f: {"ratio": f"{f['title']}:{f['words']}"})
+    other = make_plugin("other", ("other",), fn=lambda doc, f: {"other": 1})
+    runner = PluginRunner([stats, words, other], order=["stats", "words", "other"])
+    assert [[n.name for n in level] for level in runner.levels] == [["words", "other"], ["stats"]]
+    result = runner.run(DOC, {"title": "T"})
+    assert result == {"title": "T", "words": 2, "ratio": "T:2", "other": 1}
+
+
+def test_unconsumed_plugins_are_skipped_and_cycles_rejected():
+    calls = []
+    a = make_plugin("a", ("x",), fn=lambda doc, f: {"x": 1}, calls=calls)
+    b = make_plugin("b", ("y",), ("x",), fn=lambda doc, f: {"y": f["x"] + 1}, calls=calls)
+    c = make_plugin("c", ("z",), fn=lambda doc, f: {"z": 0}, calls=calls)
+    legacy = types.ModuleType("legacy")
+    legacy.process = lambda url, html: {"legacy": True}
+    runner = PluginRunner([a, b, c, legacy], export_fields=["url", "y"])
+    assert runner.names == ["a", "b", "legacy"]  # legacy : champs inconnus, jamais sauté
+    assert runner.run(DOC, {}) == {"x": 1, "y": 2, "legacy": True}
+    assert calls == ["a", "b"]
+
+    with pytest.raises(ConfigError):  # a lit y (produit par b) et b lit x (produit par a)
+        PluginRunner([a, b], declarations={"a": {"requires": ["y"], "provides": ["x"]}})
+
+
+def test_non_dict_result_is_a_plugin_error_and_dropped():
+    bad = make_plugin("bad", ("x",), fn=lambda doc, f: "oops")
+    good = make_plugin("good", ("y",), fn=lambda doc, f: {"y": 1})
+    runner = PluginRunner([bad, good], breaker_threshold=2, breaker_hosts=0)
+    docs = [ParsedDocument("<p>x</p>", f"https://ex.com/{i}") for i in range(3)]
+    results = runner.run_batch(docs, [{"url": doc.url} for doc in docs])
+    assert [r["y"] for r in results] == [1, 1, 1] and not any("x" in r for r in results)
+    assert runner.stats.snapshot()["bad"]["errors"] == 2  # coupé pour l’hôte ensuite
+    assert runner.stats.snapshot()["bad"]["skipped"] == 1
+    assert not runner.breaker.allows("bad", "ex.com")
+
+
+def test_pipeline_order_from_plugins_yaml_and_threads(caplog):
+    spec = load_pipeline_spec()
+    assert spec["pipeline"][:2] == ["tech_detector_plugin", "word_freq_plugin"]
+    assert set(spec["plugins"]) <= set(spec["pipeline"])  # aucune déclaration orpheline
+    first = make_plugin("first", ("v",), fn=lambda doc, f: {"v": "first"})
+    last = make_plugin("last", ("v",), fn=lambda doc, f: {"v": "last"})
+    runner = PluginRunner([last, first], order=["first", "last", "absent"], threads=2)
+    try:
+        assert runner.run(DOC, {})["v"] == "last"  # fusion dans l’ordre du pipeline
+    finally:
+        runner.close()
+
+    PluginRunner([first], order=["first"], declarations={"oublié": {"provides": ["x"]}})
+    assert "absent du pipeline, jamais exécuté: oublié" in caplog.text
+
+
+def test_shipped_core_plugin_is_trusted_and_runs():
+    spec = load_pipeline_spec()
+    approved = {plugin_name(p): p for p in validate_all(PLUGIN_DIR, cache_path=None)}
+    assert "core_plugin" in approved  # empreinte à jour dans trusted_hashes.txt
+    runner = PluginRunner([approved["core_plugin"]], order=spec["pipeline"],
+                          declarations=spec["plugins"])
+    assert runner.names == ["core_plugin"]
+    result = runner.run(ParsedDocument("<p>x</p>", "https://ex.com/"), {"url": "https://ex.com/"})
+    assert result["plugin_result"].endswith("a traité https://ex.com/")
+
+
+def test_batch_plugins_get_pages_in_chunks_legacy_ones_per_page():
+    calls = []
+    batch = types.ModuleType("batch")
+    batch.PROVIDES = ("n",)
+
+    def process_batch(urls, htmls):
+        calls.append(len(urls))
+        if "boom" in urls:
+            raise RuntimeError("lot en erreur")
+        return [{"n": len(html)} for html in htmls]
+
+    batch.process_batch = process_batch
+    legacy = types.ModuleType("legacy")
+    legacy.process = lambda url, html: {"legacy": url}
+    docs = [ParsedDocument("x" * i, f"u{i}") for i in range(5)] + [ParsedDocument("y", "boom")]
+    runner = PluginRunner([batch, legacy], declarations={"batch": {"batch_size": 2}})
+    results = runner.run_batch(docs, [{} for _ in docs])
+    assert calls == [2, 2, 2]
+    assert [r.get("n") for r in results] == [0, 1, 2, 3, None, None]  # seul le lot fautif est perdu
+    assert [r["legacy"] for r in results] == ["u0", "u1", "u2", "u3", "u4", "boom"]
+
+
+def test_page_processor_keeps_one_chunk_of_documents_alive(monkeypatch):
+    alive = weakref.WeakSet()
+
+    class TrackedDocument(ParsedDocument):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            alive.add(self)
+
+    monkeypatch.setattr(page_processor, "ParsedDocument", TrackedDocument)
+    seen = []
+    batch = types.ModuleType("batch")
+    batch.PROVIDES = ("n",)
+    batch.process_batch = (lambda urls, htmls:
+                           seen.append((len(urls), len(alive))) or [{"n": 1}] * len(urls))
+    options = {"declarations": {"batch": {"batch_size": 2}}}
+    processor = page_processor.PageProcessor(GenericAnalyzer(), [batch], ["fr"],
+                                             plugin_options=options)
+    jobs = [({"url": f"https://ex.com/{i}"}, f"<html lang='fr'><p>page {i}</p></html>")
+            for i in range(5)]
+    results = processor.process_batch(jobs)
+    assert [r["n"] for r in results] == [1] * 5
+    assert [size for size, _ in seen] == [2, 2, 1]
+    assert max(count for _, count in seen) <= 2  # tranches précédentes déjà libérées
@@ -0,0 +1,48 @@
+import time
+import types
+
+from minima.core.document import ParsedDocument
+from minima.core.plugin_runner import PluginRunner
+from minima.core.plugin_stats import PluginBreaker, PluginStats
+
+
+def test_stats_snapshot_and_merge():
+    stats = PluginStats(keep_events=True)
+    stats.record("p", 0.010, out_bytes=20)
+    stats.record("p", 0.030, pages=2, error=True)
+    stats.skipped("p", 3)
+    merged = PluginStats()
+    merged.merge(stats.drain())
+    assert stats.drain() == []
+    snap = merged.snapshot()["p"]
+    counts = (snap["calls"], snap["pages"], snap["errors"], snap["skipped"], snap["bytes"])
+    assert counts == (2, 3, 1, 3, 20)
+    assert snap["p95_ms"] == 30.0 and snap["seconds"] == 0.04
+
+
+def test_breaker_trips_per_host_then_for_the_run():
+    stats = PluginStats()
+    breaker = PluginBreaker(threshold=2, host_limit=2, stats=stats)
+    breaker.record("p", "a.com", False, "erreur")
+    breaker.record("p", "a.com", True)  # un succès remet le compteur à zéro
+    breaker.record("p", "a.com", False, "erreur")
+    assert breaker.allows("p", "a.com")
+    breaker.record("p", "a.com", False, "erreur")
+    assert not breaker.allows("p", "a.com") and breaker.allows("p", "b.com")
+    breaker.record("p", "b.com", False, "erreur")
+    breaker.record("p", "b.com", False, "erreur")
+    assert not breaker.allows("p", "c.com")
+    disabled = [(name, host) for name, host, _ in stats.disabled]
+    assert disabled == [("p", "a.com"), ("p", "b.com"), ("p", None)]
+
+
+def test_runner_disables_slow_plugin_for_host():
+    slow = types.ModuleType("slow")
+    slow.process = lambda url, html: time.sleep(0.01) or {"slow": True}
+    runner = PluginRunner([slow], budget_ms=1, breaker_threshold=2, breaker_hosts=0)
+    docs = [ParsedDocument("<p>x</p>", f"https://lent.com/{i}") for i in range(4)]
+    docs.append(ParsedDocument("<p>x</p>", "https://autre.com/"))
+    results = runner.run_batch(docs, [{} for _ in docs])
+    assert [r.get("slow") for r in results] == [True, True, None, None, True]
+    snap = runner.stats.snapshot()["slow"]
+    assert snap["calls"] == 3 and snap["over_budget"] == 3 and snap["skipped"] == 2
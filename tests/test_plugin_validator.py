@@ -0,0 +1,54 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from minima.plugins.plugin_validator import LazyPlugin, sha256sum, validate_all
+
+PLUGIN = "import os\n" \
+         "os.environ['MINIMA_TEST_IMPORTS'] = os.environ.get('MINIMA_TEST_IMPORTS', '') + 'x'\n" \
+         "def process(url, html):\n    return {'echo': url}\n"
+
+
+def make_plugin_dir(temp_dir):
+    plugin_dir = Path(temp_dir) / "plugins"
+    plugin_dir.mkdir()
+    plugin = plugin_dir / "echo_plugin.py"
+    plugin.write_text(PLUGIN, encoding="utf-8")
+    hashes = plugin_dir / "trusted_hashes.txt"
+    hashes.write_text(f"{sha256sum(plugin)} echo_plugin.py\n", encoding="utf-8")
+    return plugin_dir, plugin
+
+
+def test_plugins_are_imported_on_first_use(temp_dir, monkeypatch):
+    monkeypatch.setenv("MINIMA_TEST_IMPORTS", "")
+    plugin_dir, plugin = make_plugin_dir(temp_dir)
+    [echo] = validate_all(plugin_dir, cache_path=None)
+    assert isinstance(echo, LazyPlugin) and echo.__name__ == "echo_plugin"
+    assert echo.__file__ == str(plugin) and echo.__sha256__ == sha256sum(plugin)
+    assert not echo.loaded and os.environ["MINIMA_TEST_IMPORTS"] == ""
+    assert echo.process("u", "") == {"echo": "u"}
+    assert hasattr(echo, "process") and not hasattr(echo, "process_batch")
+    assert os.environ["MINIMA_TEST_IMPORTS"] == "x"  # importé une seule fois
+
+
+def test_validation_cache_keyed_by_mtime_and_size(temp_dir):
+    plugin_dir, plugin = make_plugin_dir(temp_dir)
+    cache_path = os.path.join(temp_dir, "validation.json")
+    validate_all(plugin_dir, cache_path=cache_path)
+    entry = json.load(open(cache_path))[str(plugin.resolve())]
+    assert entry["sha256"] == sha256sum(plugin) and entry["size"] == plugin.stat().st_size
+
+    # Même taille, mtime restauré : l’empreinte vient du cache…
+    st = plugin.stat()
+    plugin.write_text(PLUGIN.replace("echo", "ohce"), encoding="utf-8")
+    os.utime(plugin, ns=(st.st_atime_ns, st.st_mtime_ns))
+    [stale] = validate_all(plugin_dir, cache_path=cache_path)
+    with pytest.raises(ImportError):  # … mais l’import revérifie le fichier
+        stale.process
+
+    # Taille ou mtime changés : empreinte recalculée, plugin rejeté
+    plugin.write_text(PLUGIN + "\n", encoding="utf-8")
+    assert validate_all(plugin_dir, cache_path=cache_path) == []
+    assert json.load(open(cache_path))[str(plugin.resolve())]["sha256"] == sha256sum(plugin)
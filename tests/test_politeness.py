@@ -0,0 +1,38 @@
+import threading
+import time
+from minima.core.politeness import HostScheduler, host_of
+
+
+def test_host_of():
+    assert host_of("https://Example.com/page") == "example.com"
+
+
+def test_interval_is_per_host():
+    s = HostScheduler(min_interval=0.2, max_per_host=5)
+    for url in ["https://a.com/1", "https://a.com/2", "https://b.com/1"]:
+        s.add(url)
+    start = time.monotonic()
+    first = [s.acquire(), s.acquire()]
+    assert sorted(first) == ["https://a.com/1", "https://b.com/1"]
+    assert time.monotonic() - start < 0.1  # deux hôtes différents : pas d'attente
+    assert s.acquire() == "https://a.com/2"
+    assert time.monotonic() - start >= 0.19
+    assert s.acquire() is None
+
+
+def test_concurrency_cap_waits_for_release():
+    s = HostScheduler(min_interval=0, max_per_host=1)
+    s.add("https://a.com/1")
+    s.add("https://a.com/2")
+    assert s.acquire() == "https://a.com/1"
+    assert s.acquire(timeout=0.05) is None
+    threading.Timer(0.05, s.release, args=("https://a.com/1",)).start()
+    assert s.acquire(timeout=1) == "https://a.com/2"
+
+
+def test_host_limits_override():
+    s = HostScheduler(min_interval=0, max_per_host=1, host_limits={"a.com": {"max_per_host": 2}})
+    s.add("https://a.com/1")
+    s.add("https://a.com/2")
+    assert s.acquire(timeout=0.05) == "https://a.com/1"
+    assert s.acquire(timeout=0.05) == "https://a.com/2"
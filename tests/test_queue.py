@@ -1,4 +1,5 @@
 import os
+import pytest
 import json
 from minima.core.queue import PersistentQueue
 
@@ -33,3 +34,119 @@ def test_clear_queue(temp_dir):
     q.add("a")
     q.clear()
     assert q.is_empty()
+
+
+def test_dedup_by_url(temp_dir):
+    path = os.path.join(temp_dir, "queue.json")
+    q = PersistentQueue(path)
+    q.add({"url": "https://a.com", "depth": 0, "score": 0})
+    q.add({"url": "https://a.com", "depth": 1, "score": 0})
+    assert len(q.remaining_urls()) == 1
+    q.mark_processed({"url": "https://a.com", "depth": 0, "score": 0})
+    q.add({"url": "https://a.com", "depth": 2, "score": 0})
+    assert q.is_empty()
+    assert q.is_known("https://a.com")
+    assert "https://b.com" not in q
+
+
+def test_load_legacy_file_with_duplicates(temp_dir):
+    path = os.path.join(temp_dir, "queue.json")
+    item = {"url": "https://a.com", "depth": 0, "score": 0}
+    other = {"url": "https://b.com", "depth": 1, "score": 0}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"pending": [item, other, other], "processed": [item],
+                   "scores": {"https://b.com": 3}}, f)
+    q = PersistentQueue(path)
+    assert q.remaining_urls() == [other]
+    assert q.is_processed("https://a.com")
+
+
+def test_journal_replay_after_crash(temp_dir):
+    path = os.path.join(temp_dir, "queue.json")
+    q = PersistentQueue(path, journal=True, compact_every=100)
+    q.add({"url": "https://a.com", "depth": 0, "score": 0})
+    q.add({"url": "https://b.com", "depth": 0, "score": 0})
+    q.mark_processed({"url": "https://a.com", "depth": 0, "score": 0})
+    q._journal_file.flush()  # simule un arrêt brutal sans compaction
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["pending"] == []
+    with open(q.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"op":"add","item":')  # ligne tronquée
+
+    q2 = PersistentQueue(path, journal=True)
+    assert [i["url"] for i in q2.remaining_urls()] == ["https://b.com"]
+    assert q2.is_processed("https://a.com")
+    assert os.path.getsize(q2.journal_path) == 0
+
+
+def test_journal_compaction(temp_dir):
+    path = os.path.join(temp_dir, "queue.json")
+    q = PersistentQueue(path, journal=True, compact_every=2)
+    q.add({"url": "https://a.com", "depth": 0, "score": 0})
+    q.add({"url": "https://b.com", "depth": 0, "score": 0})
+    with open(path, encoding="utf-8") as f:
+        assert len(json.load(f)["pending"]) == 2
+    assert os.path.getsize(q.journal_path) == 0
+
+
+def test_priority_order_and_score_update(temp_dir):
+    path = os.path.join(temp_dir, "queue.json")
+    q = PersistentQueue(path)
+    for i, score in enumerate([1, 5, 3, 5]):
+        q.add({"url": f"https://{i}.com", "depth": 0}, score=score)
+    assert [i["url"] for i in q.remaining_urls(limit=2)] == ["https://1.com", "https://3.com"]
+    q.update_score("https://0.com", 10)
+    assert q.get()["url"] == "https://0.com"
+    q.mark_processed({"url": "https://1.com"})
+    assert [i["url"] for i in q.remaining_urls()] == ["https://3.com", "https://2.com"]
+
+
+def test_reschedule_defers_and_persists(temp_dir):
+    path = os.path.join(temp_dir, "queue.json")
+    q = PersistentQueue(path, journal=True)
+    q.add({"url": "https://a.com", "depth": 0}, score=5)
+    q.add({"url": "https://b.com", "depth": 0})
+    item = q.get()
+    retried = q.reschedule(item, delay=60)
+    assert retried["attempts"] == 1
+    # L'URL différée n'est plus distribuée, mais la queue n'est pas vide
+    assert q.get()["url"] == "https://b.com"
+    assert q.get() is None
+    assert not q.is_empty()
+    assert 59 < q.next_ready_in() < 61
+    q._journal_file.flush()  # arrêt brutal : l'essai différé est dans le journal
+
+    q2 = PersistentQueue(path, journal=True)
+    assert q2.remaining_urls() == [{"url": "https://b.com", "depth": 0}]
+    assert q2.next_ready_in() == 0.0
+    q2.reschedule({"url": "https://b.com", "depth": 0}, delay=-1)
+    q2.reschedule(retried, delay=-1)  # échéance passée : à nouveau dû, score conservé
+    assert [i["url"] for i in q2.remaining_urls()] == ["https://a.com", "https://b.com"]
+    assert q2.get()["attempts"] == 2
+
+
+def test_read_only_open_leaves_files_untouched(temp_dir):
+    from minima.core.errors import QueueError
+    from minima.core.queue import open_queue
+
+    path = os.path.join(temp_dir, "queue.json")
+    cfg = {"queue_journal": True, "queue_seen_filter": True, "queue_keep_processed": False}
+    q = open_queue(cfg, path)
+    q.add({"url": "https://a.com", "depth": 0})
+    q.add({"url": "https://b.com", "depth": 0})
+    q.mark_processed(q.get())
+    q.get()  # en cours au moment de l’arrêt
+    q._journal_file.flush()
+    snapshot = {p: open(p, "rb").read() for p in (path, q.journal_path)}
+
+    status = open_queue(cfg, path, read_only=True)
+    assert [i["url"] for i in status.remaining_urls()] == ["https://b.com"]
+    assert status.is_processed("https://a.com")
+    with pytest.raises(QueueError):
+        status.add({"url": "https://c.com", "depth": 0})
+    status.close()
+    assert {p: open(p, "rb").read() for p in snapshot} == snapshot
+
+    missing = os.path.join(temp_dir, "absente", "queue.json")
+    assert open_queue({}, missing, read_only=True).counts() == {"pending": 0, "processed": 0}
+    assert not os.path.exists(os.path.dirname(missing))
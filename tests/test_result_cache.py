@@ -0,0 +1,95 @@
+import os
+import types
+
+from minima.core.generic_analyzer import GenericAnalyzer
+from minima.core.page_processor import PageProcessor
+from minima.core.result_cache import ResultCache
+
+HTML = ("<html lang='fr'><head><title>Miroir</title></head>"
+        "<body><p>conseil des ministres</p></body></html>")
+
+
+def test_lru_eviction_and_persistence(temp_dir):
+    path = os.path.join(temp_dir, "results.db")
+    cache = ResultCache(path, max_bytes=0)
+    cache.put("a", {"v": "x" * 100})
+    cache.put("b", {"v": "y" * 100})
+    size = cache._size
+    cache.close()
+
+    # Taille relue sur disque, place pour 2 entrées
+    cache = ResultCache(path, max_bytes=int(size * 1.2))
+    assert cache.get("a") == {"v": "x" * 100}  # a devient le plus récemment lu
+    cache.put("c", {"v": "z" * 100})
+    assert cache.get("b") is None and cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats["evicted"] == 1
+    cache.close()
+
+
+class CountingAnalyzer(GenericAnalyzer):
+    calls = 0
+
+    def analyze_document(self, doc):
+        CountingAnalyzer.calls += 1
+        return super().analyze_document(doc)
+
+
+def make_plugin(sha, calls, data_file=None):
+    mod = types.ModuleType("compteur")
+    mod.__sha256__ = sha
+    if data_file is not None:
+        mod.CACHE_FILES = (data_file,)
+
+    def process_document(doc):
+        calls.append(doc.url)
+        return {"mots": len(doc.text.split())}
+
+    mod.process_document = process_document
+    return mod
+
+
+def test_identical_bodies_reuse_analysis_and_plugins(temp_dir):
+    cache = ResultCache(os.path.join(temp_dir, "results.db"))
+    calls = []
+    processor = PageProcessor(CountingAnalyzer(), [make_plugin("v1", calls)], ["fr"],
+                              result_cache=cache)
+    first = processor.process({"url": "https://a.com/page", "score": 1}, HTML)
+    mirror = processor.process({"url": "https://b.com/page?utm_source=x", "score": 2}, HTML)
+    assert mirror == dict(first, url="https://b.com/page?utm_source=x", score=2)
+    assert CountingAnalyzer.calls == 1 and calls == ["https://a.com/page"]
+
+    # Plugin modifié (nouvelle empreinte) : ses entrées ne sont plus lues
+    processor = PageProcessor(CountingAnalyzer(), [make_plugin("v2", calls)], ["fr"],
+                              result_cache=cache)
+    assert processor.process({"url": "https://c.com/"}, HTML)["mots"] == first["mots"]
+    assert CountingAnalyzer.calls == 1 and calls == ["https://a.com/page", "https://c.com/"]
+    assert processor.plugins.stats.snapshot()["compteur"]["cached"] == 0
+    cache.close()
+
+
+def test_editing_a_declared_data_file_misses_the_cache(temp_dir):
+    cache = ResultCache(os.path.join(temp_dir, "results.db"))
+    signatures = os.path.join(temp_dir, "tech_signatures.yaml")
+    with open(signatures, "w", encoding="utf-8") as f:
+        f.write("WordPress: {html: [wp-content]}\n")
+    calls = []
+
+    def run(url):
+        processor = PageProcessor(GenericAnalyzer(), [make_plugin("v1", calls, signatures)],
+                                  ["fr"], result_cache=cache)
+        return processor.process({"url": url}, HTML)
+
+    run("https://a.com/")
+    run("https://b.com/")
+    assert calls == ["https://a.com/"]
+    with open(signatures, "a", encoding="utf-8") as f:
+        f.write("Drupal: {html: [drupal.js]}\n")
+    run("https://c.com/")
+    assert calls == ["https://a.com/", "https://c.com/"]
+    cache.close()
+
+
+def test_tech_detector_declares_its_signature_file():
+    from minima.plugins import tech_detector_plugin
+
+    assert tech_detector_plugin.SIGNATURES_PATH in tech_detector_plugin.CACHE_FILES
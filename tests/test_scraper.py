@@ -1,4 +1,9 @@
 # tests/test_scraper.py
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from minima.core.scraper import Scraper
 
@@ -53,3 +58,129 @@ def test_fetch_all_parallel(monkeypatch, caplog):
     assert any("Parallel fetch complete" in msg for msg in caplog.text)
     assert any("Fetched https://ok1.com" in msg for msg in caplog.text)
     assert any("Failed to fetch https://fail.com" in msg for msg in caplog.text)
+
+
+def test_fetch_all_with_host_scheduler(monkeypatch):
+    from minima.core.politeness import HostScheduler
+
+    s = Scraper(scheduler=HostScheduler(min_interval=0, max_per_host=1))
+    monkeypatch.setattr(s, "fetch_html", lambda url: f"<html>{url}</html>")
+    urls = ["https://a.com/1", "https://a.com/2", "https://b.com/1"]
+    results = s.fetch_all(urls)
+
+    assert set(results) == set(urls)
+    assert results["https://b.com/1"] == "<html>https://b.com/1</html>"
+
+
+class DripResponse:
+    """Réponse qui envoie son corps au compte-gouttes."""
+    status_code = 200
+    headers = {"Content-Type": "text/html"}
+
+    def iter_content(self, chunk_size=None):
+        for _ in range(50):
+            time.sleep(0.05)
+            yield b"<p>x</p>"
+
+    def close(self):
+        pass
+
+
+def test_fetch_deadline_aborts_slow_drip(monkeypatch):
+    s = Scraper()
+    s.fetch_deadline = 0.2
+    monkeypatch.setattr(s.session, "get", lambda url, **kw: DripResponse())
+    start = time.monotonic()
+    assert s.fetch_html("https://slow.com/") is None
+    assert time.monotonic() - start < 1
+    assert s.stats["deadline_exceeded"] == 1
+
+
+def test_batch_deadline_reports_late_urls(monkeypatch):
+    s = Scraper()
+    s.batch_deadline = 0.2
+    monkeypatch.setattr(s, "fetch_html", lambda url: time.sleep(1 if "slow" in url else 0) or "ok")
+    start = time.monotonic()
+    results = s.fetch_all(["https://fast.com/", "https://slow.com/"])
+    assert time.monotonic() - start < 0.8
+    assert results == {"https://fast.com/": "ok", "https://slow.com/": None}
+    assert s.pop_retry("https://slow.com/") == 0.0
+
+
+def test_hedged_fetch_beats_slow_first_request(monkeypatch):
+    s = Scraper()
+    s.hedge_percentile = 95
+    s._hedge_pool = ThreadPoolExecutor(max_workers=4)
+    for _ in range(s.latency.min_samples):
+        s.latency.record("a.com", 0.05)
+    calls = []
+
+    def fake_network(url, cached):
+        calls.append(url)
+        time.sleep(1 if len(calls) == 1 else 0)
+        return f"copie {len(calls)}"
+
+    monkeypatch.setattr(s, "_fetch_network", fake_network)
+    start = time.monotonic()
+    assert s.fetch_html("https://a.com/") == "copie 2"
+    assert time.monotonic() - start < 0.5
+    assert s.stats["hedged"] == s.stats["hedge_wins"] == 1
+
+
+def test_fetch_deadline_interrupts_blocked_read_on_real_socket():
+    """Serveur réel qui envoie 1 octet toutes les 0,2 s : la lecture bufferisée
+    ne rend jamais la main d'elle-même, le délai total doit couper le socket."""
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    stop = threading.Event()
+
+    def serve():
+        conn, _ = listener.accept()
+        conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n"
+                     b"Content-Length: 100000\r\n\r\n")
+        try:
+            while not stop.wait(0.2):
+                conn.sendall(b"x")
+        except OSError:
+            pass
+        finally:
+            conn.close()
+
+    threading.Thread(target=serve, daemon=True).start()
+    s = Scraper()
+    s.cache = None
+    s.retries, s.timeout, s.fetch_deadline = 1, 5, 1
+    start = time.monotonic()
+    try:
+        assert s.fetch_html(f"http://127.0.0.1:{listener.getsockname()[1]}/") is None
+        assert time.monotonic() - start < 3
+        assert s.stats["deadline_exceeded"] == 1
+    finally:
+        stop.set()
+        listener.close()
+
+
+def test_no_hedge_when_host_is_at_its_cap(monkeypatch):
+    from minima.core.politeness import HostScheduler
+
+    scheduler = HostScheduler(max_per_host=1)
+    scheduler.add("https://a.com/")
+    assert scheduler.acquire(timeout=1) == "https://a.com/"  # slot du worker de fetch
+    s = Scraper(scheduler=scheduler)
+    s.hedge_percentile = 95
+    s._hedge_pool = ThreadPoolExecutor(max_workers=4)
+    for _ in range(s.latency.min_samples):
+        s.latency.record("a.com", 0.05)
+    calls = []
+    monkeypatch.setattr(s, "_fetch_network",
+                        lambda url, cached: calls.append(url) or time.sleep(0.3) or "ok")
+    assert s.fetch_html("https://a.com/") == "ok"
+    assert calls == ["https://a.com/"] and s.stats["hedged"] == 0
+
+    scheduler.host_limits = {"a.com": {"max_per_host": 2}}  # place pour la copie
+    calls.clear()
+    assert s.fetch_html("https://a.com/") == "ok"
+    assert len(calls) == 2 and s.stats["hedged"] == 1
+    s._hedge_pool.shutdown(wait=True)
+    assert scheduler._active["a.com"] == 1  # slot de la copie rendu à sa fin
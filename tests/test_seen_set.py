@@ -0,0 +1,39 @@
+import os
+from minima.core.queue import PersistentQueue
+from minima.core.seen_set import BloomFilter
+
+
+def test_bloom_membership_and_persistence(temp_dir):
+    path = os.path.join(temp_dir, "seen.bin")
+    bloom = BloomFilter(path, capacity=1000, error_rate=0.01)
+    urls = [f"https://site.com/page/{i}" for i in range(1000)]
+    for url in urls:
+        bloom.add(url)
+    assert all(url in bloom for url in urls)
+    false_positives = sum(f"https://other.com/{i}" in bloom for i in range(5000))
+    assert false_positives < 5000 * 0.03
+    bloom.close()
+
+    reopened = BloomFilter(path)
+    assert len(reopened) == bloom.count
+    assert urls[0] in reopened
+    reopened.close()
+
+
+def test_queue_with_seen_filter_drops_processed_records(temp_dir):
+    path = os.path.join(temp_dir, "queue.json")
+    seen = BloomFilter(os.path.join(temp_dir, "queue.seen"), capacity=100)
+    q = PersistentQueue(path, seen_filter=seen, keep_processed=False)
+    q.add({"url": "https://a.com", "depth": 0})
+    q.mark_processed({"url": "https://a.com", "depth": 0})
+    q.add({"url": "https://a.com", "depth": 1})
+    assert q.is_empty()
+    assert q.is_processed("https://a.com")
+    assert q.data["processed"] == []
+    q.close()
+
+    q2 = PersistentQueue(path, seen_filter=BloomFilter(os.path.join(temp_dir, "queue.seen")),
+                         keep_processed=False)
+    assert "https://a.com" in q2
+    assert q2.counts() == {"pending": 0, "processed": 1}
+    q2.close()
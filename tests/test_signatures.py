@@ -0,0 +1,68 @@
+import re
+
+import pytest
+
+from minima.core.errors import ConfigError
+from minima.core.signatures import SignatureEngine, _trie_pattern
+from minima.plugins import tech_detector_plugin
+
+
+def test_trie_pattern_matches_longest_literal_at_each_position():
+    regex = re.compile(_trie_pattern(["wp-content/", "wp-includes/", "wp"]))
+    assert [m.group() for m in regex.finditer("wp-includes/ wp-x wp-content/")] == \
+        ["wp-includes/", "wp", "wp-content/"]
+
+
+def test_nested_and_overlapping_literals_are_all_reported():
+    engine = SignatureEngine({
+        "WordPress": {"html": ["/wp-content/"]},
+        "WooCommerce": {"html": ["/wp-content/plugins/woocommerce/"]},
+        "Préfixe": {"html": ["/wp"]},
+        "Chevauchant": {"html": ["content/plugins"]},
+    })
+    html = '<link href="/wp-content/plugins/woocommerce/a.css">'
+    assert engine.detect(html) == {"WordPress", "WooCommerce", "Préfixe", "Chevauchant"}
+    result = tech_detector_plugin.process("u", html)
+    assert result == {"technologies": ["WooCommerce", "WordPress"], "is_wordpress": True}
+
+
+def test_overlapping_regex_signatures_are_all_reported():
+    engine = SignatureEngine({
+        "Angular": {"html": ["re:ng-app"]},
+        "AngularJS": {"html": ["re:ng-(?:app|controller)"]},
+        "Thème": {"html": ["re:wp-\\w+/"]},
+        "Extensions": {"html": ["re:content/plug\\w+"]},
+    })
+    # Même début de match, puis un match qui commence dans un autre
+    html = '<div ng-app="x"><link href="/wp-content/plugins/a.css">'
+    assert engine.detect(html) == {"Angular", "AngularJS", "Thème", "Extensions"}
+
+
+def test_engine_matches_html_scripts_meta_and_headers():
+    engine = SignatureEngine({
+        "WordPress": {"html": ["/wp-content/"], "meta": {"generator": "WordPress"}},
+        "jQuery": {"script": ["re:jquery(?:\\.min)?\\.js"]},
+        "Nginx": {"headers": {"Server": "nginx"}},
+        "Rien": {"html": ["introuvable"]},
+    })
+    html = ("<html><head><META content='WordPress 6.4' name=generator>"
+            "<script src=\"/js/jquery.min.js\"></script></head><body>jquery.js</body></html>")
+    assert engine.detect(html, {"server": "nginx/1.25"}) == {"WordPress", "jQuery", "Nginx"}
+    assert engine.detect("<p>jquery.min.js</p>") == set()  # hors attribut src
+
+
+def test_engine_rejects_invalid_regex():
+    with pytest.raises(ConfigError):
+        SignatureEngine({"Cassé": {"html": ["re:(sans fin"]}})
+
+
+def test_tech_detector_keeps_result_shape():
+    html = ("<html><head><meta name='generator' content='WordPress'>"
+            "<script src='https://www.googletagmanager.com/gtag/js'></script></head>"
+            "<body><div id='__next'></div></body></html>")
+    result = tech_detector_plugin.process("https://ex.com/", html)
+    assert result == {"technologies": ["Google Analytics/GTM", "React/Next.js", "WordPress"],
+                      "is_wordpress": True}
+    empty = tech_detector_plugin.process("https://ex.com/", "<p>rien</p>")
+    assert empty["technologies"] == ["Unknown"]
+    assert tech_detector_plugin.process("https://ex.com/", "") == {"tech_stack": "unknown"}
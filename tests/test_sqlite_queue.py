@@ -0,0 +1,71 @@
+import os
+from minima.core.queue import open_queue, PersistentQueue
+from minima.core.sqlite_queue import SQLiteQueue
+
+
+def test_sqlite_add_get_and_dedup(temp_dir):
+    q = SQLiteQueue(os.path.join(temp_dir, "queue.db"))
+    assert q.is_empty()
+    q.add({"url": "https://a.com", "depth": 0}, score=1)
+    q.add({"url": "https://b.com", "depth": 1}, score=5)
+    q.add({"url": "https://b.com", "depth": 2}, score=9)
+    assert [i["url"] for i in q.remaining_urls()] == ["https://b.com", "https://a.com"]
+    assert q.get()["url"] == "https://b.com"
+    assert q.remaining_urls(limit=1) == [{"url": "https://a.com", "depth": 0}]
+    q.close()
+
+
+def test_sqlite_persistence_and_recovery(temp_dir):
+    path = os.path.join(temp_dir, "queue.db")
+    q = SQLiteQueue(path, batch_size=50)
+    q.add({"url": "https://a.com", "depth": 0})
+    q.add({"url": "https://b.com", "depth": 0})
+    q.mark_processed({"url": "https://a.com", "depth": 0})
+    q.get()  # b sort de la file mais n'est jamais traité
+    q.close()
+
+    q2 = SQLiteQueue(path)
+    assert q2.is_processed("https://a.com")
+    assert "https://b.com" in q2
+    assert q2.counts() == {"pending": 1, "processed": 1}
+    q2.clear()
+    assert q2.is_empty()
+    q2.close()
+
+
+def test_open_queue_backend(temp_dir):
+    path = os.path.join(temp_dir, "queue.json")
+    assert isinstance(open_queue({}, path), PersistentQueue)
+    q = open_queue({"queue_backend": "sqlite"}, path)
+    assert isinstance(q, SQLiteQueue)
+    assert q.path.endswith("queue.db")
+    q.close()
+
+
+def test_reschedule_defers(temp_dir):
+    q = SQLiteQueue(os.path.join(temp_dir, "queue.db"))
+    q.add({"url": "https://a.com", "depth": 0})
+    item = q.reschedule(q.get(), delay=60)
+    assert item["attempts"] == 1
+    assert q.get() is None and not q.is_empty()
+    assert q.remaining_urls() == []
+    assert 59 < q.next_ready_in() < 61
+    q.reschedule(item, delay=-1)
+    assert q.get()["attempts"] == 2
+    q.close()
+
+
+def test_sqlite_read_only_keeps_active_rows(temp_dir):
+    path = os.path.join(temp_dir, "queue.db")
+    q = SQLiteQueue(path)
+    q.add({"url": "https://a.com", "depth": 0})
+    q.get()  # en cours (crawl en route ou arrêt brutal)
+    q.close()
+    status = SQLiteQueue(path, read_only=True)
+    assert status.counts() == {"pending": 0, "processed": 0}
+    status.close()
+    q = SQLiteQueue(path)  # la reprise ne se fait qu’à une vraie ouverture
+    assert q.counts() == {"pending": 1, "processed": 0}
+    q.close()
+    assert SQLiteQueue(os.path.join(temp_dir, "absente.db"), read_only=True).is_empty()
+    assert not os.path.exists(os.path.join(temp_dir, "absente.db"))
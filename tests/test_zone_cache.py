@@ -0,0 +1,66 @@
+import os
+
+from bs4 import BeautifulSoup
+from bs4.element import PageElement
+
+from minima.plugins.word_freq_plugin import ZoneCache, find_content_zone
+
+MAIN_PAGE = ("<html><body><nav><article>menu</article></nav>"
+             "<main><p>contenu</p></main></body></html>")
+ARTICLE_PAGE = "<html><body><article><p>article</p></article><main>autre</main></body></html>"
+
+
+def test_cached_target_is_tried_first_and_falls_back(temp_dir):
+    cache = ZoneCache(os.path.join(temp_dir, "zones.json"))
+    zone = find_content_zone(BeautifulSoup(MAIN_PAGE, "lxml"), "ex.com", cache)
+    assert zone.name == "main" and cache.get("ex.com") == "Contenu Principal"
+
+    # Cible en cache trouvée : elle l’emporte pour les pages du même hôte
+    zone = find_content_zone(BeautifulSoup(ARTICLE_PAGE, "lxml"), "ex.com", cache)
+    assert zone.name == "main" and cache.stats == {"hits": 1, "misses": 1}
+
+    # Cible en cache absente : recherche complète, puis mise à jour du cache
+    soup = BeautifulSoup("<body><article><p>x</p></article></body>", "lxml")
+    zone = find_content_zone(soup, "ex.com", cache)
+    assert zone.name == "article" and cache.get("ex.com") == "Article Universel"
+
+
+def test_cache_is_bounded_and_persisted(temp_dir):
+    path = os.path.join(temp_dir, "zones.json")
+    cache = ZoneCache(path, max_hosts=2, save_every=0)
+    cache.put("a.com", "Article Universel")
+    cache.put("b.com", "Contenu Principal")
+    cache.get("a.com")  # a.com redevient le plus récent
+    cache.put("c.com", "WordPress Standard")
+    assert cache.get("b.com") is None
+    cache.save()
+
+    reloaded = ZoneCache(path, max_hosts=2)
+    assert reloaded.get("a.com") == "Article Universel"
+    assert reloaded.get("c.com") == "WordPress Standard"
+
+
+def test_target_inside_noise_does_not_hide_a_later_match(temp_dir):
+    html = ("<html><body><nav><div class='entry-content'>menu</div></nav>"
+            "<div class='entry-content'><p>vrai contenu</p></div><main>autre</main></body></html>")
+    cache = ZoneCache(os.path.join(temp_dir, "zones.json"))
+    zone = find_content_zone(BeautifulSoup(html, "lxml"), "ex.com", cache)
+    assert zone.get_text() == "vrai contenu"
+    assert cache.get("ex.com") == "WordPress Standard"
+
+
+def test_target_search_stops_at_the_first_kept_candidate(monkeypatch):
+    limits = []
+    find = PageElement._find_all
+
+    def recording_find(self, name, attrs, string, limit, *args, **kwargs):
+        limits.append(limit)
+        return find(self, name, attrs, string, limit, *args, **kwargs)
+
+    monkeypatch.setattr(PageElement, "_find_all", recording_find)
+    html = ("<html><body><nav><article>menu</article></nav>"
+            + "<article><p>contenu</p></article>" * 50 + "</body></html>")
+    zone = find_content_zone(BeautifulSoup(html, "lxml"))
+    assert zone.get_text() == "contenu"
+    # Aucune collecte complète des <article> : une recherche du premier à la fois
+    assert limits and all(limit == 1 for limit in limits)